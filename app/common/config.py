@@ -97,6 +97,16 @@ class Config(QConfig):
     apiConcurrencyNumber = RangeConfigItem("Functions", "ApiConcurrencyNumber", 1,
                                            RangeValidator(1, 100), restart=True)
 
+    # 各个上游的 HTTP 连接池大小与空闲连接保持时间 (秒), 见 app/common/session.py
+    lcuConnectionLimit = RangeConfigItem("Functions", "LcuConnectionLimit", 10,
+                                         RangeValidator(1, 100), restart=True)
+    sgpConnectionLimit = RangeConfigItem("Functions", "SgpConnectionLimit", 10,
+                                         RangeValidator(1, 100), restart=True)
+    webConnectionLimit = RangeConfigItem("Functions", "WebConnectionLimit", 10,
+                                         RangeValidator(1, 100), restart=True)
+    httpKeepAliveTimeout = RangeConfigItem("Functions", "HttpKeepAliveTimeout", 60,
+                                           RangeValidator(1, 600), restart=True)
+
     gameInfoFilter = ConfigItem(
         "Functions", "GameInfoFilter", False, BoolValidator())
 
@@ -203,6 +213,9 @@ class Config(QConfig):
     enableReserveGameinfo = ConfigItem(
         "Functions", "EnableReserveGameinfo", False, BoolValidator())
 
+    enableAssetsWarmUp = ConfigItem(
+        "General", "EnableAssetsWarmUp", False, BoolValidator())
+
     enableSilent = ConfigItem(
         "General", "EnableSilent", False, BoolValidator())
 
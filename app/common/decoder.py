@@ -0,0 +1,84 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class JsonDecoder:
+    """
+    JSON 解码器, 装了 orjson / msgspec 就用它们, 否则退回标准库 `json`
+
+    两者都是可选依赖, 不在 requirements.txt 里; 打包发布时会另外装上 orjson
+
+    LCU / SGP 的响应、websocket 消息、OP.GG 的数据都通过这里解码;
+    快速解码器解不了的内容 (超出 64 位的整数、NaN 之类) 会再交给标准库试一次,
+    保证和原来的行为一致
+    """
+
+    BACKENDS = ["orjson", "msgspec", "json"]
+
+    def __init__(self):
+        self.name = None
+        self.__loads = None
+        self.__errors = ()
+
+        for name in self.BACKENDS:
+            if self.use(name):
+                break
+
+    def getAvailable(self):
+        """
+        @return: 当前环境下可用的后端名称列表
+        """
+        return [name for name in self.BACKENDS if self.__getBackend(name)]
+
+    @staticmethod
+    def __getBackend(name):
+        """
+        @return: (loads, 解码失败时抛出的异常类型), 后端不可用时返回 `None`
+        """
+        if name == "orjson" and orjson is not None:
+            return orjson.loads, (orjson.JSONDecodeError,)
+
+        if name == "msgspec" and msgspec is not None:
+            return msgspec.json.decode, (msgspec.DecodeError,)
+
+        if name == "json":
+            return json.loads, ()
+
+        return None
+
+    def use(self, name):
+        """
+        切换后端
+
+        @return: 切换成功返回 `True`, 后端不可用时返回 `False`
+        """
+        backend = self.__getBackend(name)
+
+        if backend is None:
+            return False
+
+        self.name = name
+        self.__loads, self.__errors = backend
+
+        return True
+
+    def loads(self, data):
+        """
+        @param data: `str` / `bytes`
+        """
+        try:
+            return self.__loads(data)
+        except self.__errors:
+            return json.loads(data)
+
+
+decoder = JsonDecoder()
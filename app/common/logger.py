@@ -81,6 +81,12 @@ class Logger:
         extra = {'TAG': tag} if tag else {}
         self.logger.log(level, message, extra=extra)
 
+    def isEnabledFor(self, level):
+        """
+        日志内容拼起来开销比较大时, 先判断一下这个级别会不会被记录
+        """
+        return self.logger.isEnabledFor(level)
+
     def debug(self, message, tag=None):
         self.log(logging.DEBUG, message, tag)
 
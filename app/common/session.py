@@ -0,0 +1,98 @@
+import ssl
+
+import aiohttp
+
+from app.common.config import cfg
+from app.common.logger import logger
+
+TAG = "Session"
+
+
+class SessionFactory:
+    """
+    统一创建 `aiohttp.ClientSession`, 每个上游用各自显式配置的 `TCPConnector`
+
+    - 连接池大小与空闲连接保持时间来自 `cfg` (`lcuConnectionLimit` 等)
+    - 开启 DNS 缓存, 所有连接共用同一个 SSLContext, 不用每次都重新加载证书
+    - 零散的第三方请求 (ARAM 平衡数据、英雄别名等) 通过 `get()` 共用一个长期存在的
+      session, 不再每次调用都新建再销毁, 连接可以被复用
+
+    上游:
+        - lcu: 本地客户端 (包括 websocket)
+        - sgp: 腾讯服务器
+        - opgg: OP.GG
+        - web: 其余第三方
+    """
+
+    def __init__(self):
+        self.sslContext = None
+        self.shared = {}
+
+    def getSslContext(self):
+        """
+        LCU 是自签名证书, 其余上游以前也都是 `ssl=False`, 这里保持一致不校验证书;
+        证书只在创建 context 时处理一次, 请求时不要再传 `ssl=...`, 否则会绕过这个 context
+        """
+        if self.sslContext is None:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+
+            self.sslContext = context
+
+        return self.sslContext
+
+    def __getLimit(self, upstream):
+        if upstream == "lcu":
+            return cfg.get(cfg.lcuConnectionLimit)
+
+        if upstream == "sgp":
+            return cfg.get(cfg.sgpConnectionLimit)
+
+        return cfg.get(cfg.webConnectionLimit)
+
+    def createConnector(self, upstream):
+        limit = self.__getLimit(upstream)
+
+        return aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit,
+            keepalive_timeout=cfg.get(cfg.httpKeepAliveTimeout),
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            ssl=self.getSslContext(),
+        )
+
+    def create(self, upstream, **kwargs) -> aiohttp.ClientSession:
+        """
+        创建一个新的 session, 由调用方负责关闭
+
+        @param upstream: "lcu" / "sgp" / "opgg" / "web"
+        @param kwargs: 透传给 `aiohttp.ClientSession`
+        """
+        logger.debug(f"create session for {upstream}", TAG)
+
+        return aiohttp.ClientSession(
+            connector=self.createConnector(upstream), **kwargs)
+
+    def get(self, upstream="web") -> aiohttp.ClientSession:
+        """
+        获取共用的 session, 调用方不要关闭它
+        """
+        session = self.shared.get(upstream)
+
+        if session is None or session.closed:
+            session = self.create(upstream)
+            self.shared[upstream] = session
+
+        return session
+
+    async def close(self):
+        for session in self.shared.values():
+            if not session.closed:
+                await session.close()
+
+        self.shared.clear()
+
+
+sessionFactory = SessionFactory()
@@ -19,6 +19,7 @@ class SignalBus(QObject):
     gameStatusChanged = pyqtSignal(str)
     champSelectChanged = pyqtSignal(dict)
     getCmdlineError = pyqtSignal()
+    assetsWarmUpProgress = pyqtSignal(int, int)
 
     # career_interface
     careerGameBarClicked = pyqtSignal(str)
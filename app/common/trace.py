@@ -0,0 +1,265 @@
+import asyncio
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from app.common.logger import logger
+
+TAG = "Trace"
+
+
+class Span:
+    __slots__ = ('name', 'cat', 'args', 'start', 'end', 'tid')
+
+    def __init__(self, name, cat, args, tid):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.tid = tid
+
+        self.start = time.perf_counter()
+        self.end = None
+
+
+class _SpanContext:
+    def __init__(self, tracer, name, cat, args, log):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.log = log
+
+        self.span = None
+
+    def __enter__(self):
+        self.span = self.tracer.begin(self.name, self.cat, **self.args)
+        return self.span
+
+    def __exit__(self, ty, value, tb):
+        if ty is not None:
+            self.span.args['error'] = ty.__name__
+
+        self.tracer.finish(self.span)
+
+        if self.log:
+            logger.info(
+                f"{self.name} took {(self.span.end - self.span.start) * 1000:.0f} ms", TAG)
+
+        return False
+
+
+class Tracer:
+    """
+    轻量的耗时追踪, 用来看英雄选择 / 游戏开始时各个环节花了多少时间
+
+    - 结束了的 span 存在一个环形缓冲区里, 只保留最近 `maxSpans` 个
+    - 每个 asyncio task 对应 trace 里的一条 "线程", 同一个 task 里的 span 天然是嵌套的
+    - 可以导出为 Chrome trace (chrome://tracing, Perfetto) 或 speedscope 格式
+
+        with tracer.span("champSelect", log=True):
+            ...
+
+        @traced("parseAllyGameInfo")
+        async def parseAllyGameInfo(...):
+            ...
+    """
+
+    def __init__(self, maxSpans=20000):
+        self.spans = deque(maxlen=maxSpans)
+        self.lock = threading.Lock()
+
+        # task / 线程 -> 连续的小整数, 以及它们的名字
+        self.tids = {}
+        self.tidNames = {}
+        self.nextTid = 1
+
+        self.origin = time.perf_counter()
+
+    def __getTid(self):
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+
+        if task is not None:
+            key, name = id(task), task.get_name()
+        else:
+            key, name = threading.get_ident(), threading.current_thread().name
+
+        tid = self.tids.get(key)
+
+        if tid is None:
+            if len(self.tids) >= 4096:
+                self.__pruneTids()
+
+            tid = self.tids[key] = self.nextTid
+            self.tidNames[tid] = name
+            self.nextTid += 1
+
+        return tid
+
+    def __pruneTids(self):
+        # task 用完就没了, 只保留环形缓冲区里还用得到的名字
+        alive = {span.tid for span in self.getSpans()}
+
+        self.tids.clear()
+        self.tidNames = {tid: name for tid, name in self.tidNames.items()
+                         if tid in alive}
+
+    def begin(self, name, cat="app", **args) -> Span:
+        return Span(name, cat, args, self.__getTid())
+
+    def finish(self, span: Span):
+        span.end = time.perf_counter()
+
+        with self.lock:
+            self.spans.append(span)
+
+    def span(self, name, cat="app", log=False, **args):
+        """
+        @param log: 结束时把耗时打到日志里
+        """
+        return _SpanContext(self, name, cat, args, log)
+
+    def instant(self, name, cat="app", **args):
+        """
+        记录一个时间点, 如收到 websocket 事件
+        """
+        span = self.begin(name, cat, **args)
+        span.end = span.start
+
+        with self.lock:
+            self.spans.append(span)
+
+    def clear(self):
+        with self.lock:
+            self.spans.clear()
+
+    def __us(self, t):
+        return (t - self.origin) * 1e6
+
+    def getSpans(self):
+        with self.lock:
+            return list(self.spans)
+
+    def toChromeTrace(self):
+        events = []
+        pid = os.getpid()
+
+        for span in self.getSpans():
+            item = {
+                'name': span.name,
+                'cat': span.cat,
+                'pid': pid,
+                'tid': span.tid,
+                'ts': self.__us(span.start),
+                'args': span.args,
+            }
+
+            if span.end == span.start:
+                item['ph'] = 'i'
+                item['s'] = 't'
+            else:
+                item['ph'] = 'X'
+                item['dur'] = (span.end - span.start) * 1e6
+
+            events.append(item)
+
+        for tid, name in self.tidNames.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid,
+                           'tid': tid, 'args': {'name': name}})
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def toSpeedscope(self):
+        spans = [span for span in self.getSpans() if span.end != span.start]
+
+        frames = []
+        frameIndex = {}
+
+        def getFrame(name):
+            index = frameIndex.get(name)
+
+            if index is None:
+                index = frameIndex[name] = len(frames)
+                frames.append({'name': name})
+
+            return index
+
+        byTid = {}
+        for span in spans:
+            byTid.setdefault(span.tid, []).append(span)
+
+        profiles = []
+
+        for tid, items in sorted(byTid.items()):
+            items.sort(key=lambda s: (s.start, -s.end))
+
+            events = []
+            stack = []
+
+            # speedscope 的 evented 格式要求严格嵌套, 子 span 超出父 span 时截断
+            for span in items:
+                while stack and stack[-1][1] <= span.start:
+                    frame, end = stack.pop()
+                    events.append({'type': 'C', 'frame': frame, 'at': self.__us(end)})
+
+                end = span.end if not stack else min(span.end, stack[-1][1])
+                frame = getFrame(span.name)
+
+                events.append({'type': 'O', 'frame': frame,
+                               'at': self.__us(span.start)})
+                stack.append((frame, end))
+
+            while stack:
+                frame, end = stack.pop()
+                events.append({'type': 'C', 'frame': frame, 'at': self.__us(end)})
+
+            profiles.append({
+                'type': 'evented',
+                'name': self.tidNames.get(tid, str(tid)),
+                'unit': 'microseconds',
+                'startValue': events[0]['at'],
+                'endValue': events[-1]['at'],
+                'events': events,
+            })
+
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': frames},
+            'profiles': profiles,
+            'name': 'Seraphine',
+            'exporter': 'Seraphine',
+        }
+
+    def export(self, path, format="chrome"):
+        """
+        @param format: "chrome" 或 "speedscope"
+        """
+        data = self.toChromeTrace() if format == "chrome" else self.toSpeedscope()
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+
+tracer = Tracer()
+
+
+def traced(name=None, cat="app"):
+    """
+    给协程函数套上一个 span
+    """
+    def decorator(func):
+        spanName = name or func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with tracer.span(spanName, cat):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,15 +1,21 @@
 import json
 import os
 import re
-import winreg
 from pathlib import Path
 
 import requests
 import base64
 import subprocess
 import psutil
-import win32api
-import win32gui
+
+# 只在 Windows 上可用; 其他平台 (如在 Linux 上连本地的替身服务器做 benchmark) 时
+# 用到它们的函数不可用, 其余函数照常工作
+try:
+    import winreg
+    import win32api
+    import win32gui
+except ImportError:
+    winreg = win32api = win32gui = None
 
 from PyQt5.QtCore import QRectF
 
@@ -3,10 +3,9 @@ import os
 import re
 from functools import lru_cache, wraps
 
-import aiohttp
-
 from app.common.config import cfg, LOCAL_PATH
 from app.common.logger import logger
+from app.common.session import sessionFactory
 from app.common.util import getLolClientVersion
 
 
@@ -78,8 +77,8 @@ class AramBuff:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                res = await session.get(url, params=params, proxy=None, ssl=False)
+            session = sessionFactory.get()
+            async with session.get(url, params=params, proxy=None) as res:
                 data = await res.json()
         except:
             logger.warning(f"Getting Aram buff failed", self.TAG)
@@ -0,0 +1,179 @@
+import asyncio
+import os
+import tempfile
+
+from app.common.logger import logger
+from app.lol.request import SingleFlight
+
+TAG = "AssetStore"
+
+
+class AssetStore:
+    """
+    管理 `app/resource/game/*` 下从 LCU 下载的图片资源
+
+    - 启动时扫描一次目录, 在内存里维护已有文件的索引, 命中时不再访问文件系统
+    - 下载好的文件在线程池里先写临时文件再替换, 不阻塞事件循环, 也不会留下写一半的文件
+    - 同一个文件同时只会下载一次
+    """
+
+    ROOT = "app/resource/game"
+
+    FOLDERS = [
+        "champion icons",
+        "item icons",
+        "profile icons",
+        "rune icons",
+        "summoner spell icons",
+        "augment icons",
+        "splashes",
+    ]
+
+    def __init__(self):
+        self.index = set()
+        self.initialized = False
+
+        # 只按路径合并: 预下载 (后台优先级) 与界面要同一个文件时也只下载一次
+        self.singleFlight = SingleFlight(byPriority=False)
+
+        self.hits = 0
+        self.misses = 0
+
+    def init(self):
+        """
+        创建资源目录并建立索引, 只需要在启动时调用一次
+        """
+        if self.initialized:
+            return
+
+        self.reindex()
+        self.initialized = True
+
+    def reindex(self):
+        index = set()
+
+        for folder in self.FOLDERS:
+            path = f"{self.ROOT}/{folder}"
+
+            if not os.path.exists(path):
+                os.makedirs(path)
+                continue
+
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_file() and not entry.name.endswith(".tmp"):
+                        index.add(f"{path}/{entry.name}")
+
+        self.index = index
+
+        logger.info(f"asset index built, {len(index)} files", TAG)
+
+    @classmethod
+    def getPath(cls, folder, name):
+        return f"{cls.ROOT}/{folder}/{name}"
+
+    def has(self, folder, name):
+        return self.getPath(folder, name) in self.index
+
+    async def get(self, folder, name, download):
+        """
+        获取资源的本地路径, 本地没有时调用 `download` 下载
+
+        @param folder: `FOLDERS` 中的一个
+        @param name: 文件名
+        @param download: 无参数的协程函数, 返回文件内容 (bytes)
+        @return: 本地路径
+        """
+        path = self.getPath(folder, name)
+
+        if path in self.index:
+            self.hits += 1
+            return path
+
+        self.misses += 1
+
+        return await self.singleFlight.do(path, lambda: self.__fetch(path, download))
+
+    async def __fetch(self, path, download):
+        data = await download()
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.__write, path, data)
+
+        self.index.add(path)
+
+        return path
+
+    @staticmethod
+    def __write(path, data: bytes):
+        # 临时文件名各不相同, 同一个文件同时写两次也不会互相覆盖
+        folder, name = os.path.split(path)
+        fd, tmp = tempfile.mkstemp(prefix=f"{name}.", suffix=".tmp", dir=folder)
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+
+            os.replace(tmp, path)
+        except:
+            os.remove(tmp)
+            raise
+
+    async def warmUp(self, items, concurrency=2, isBusy=None, onProgress=None):
+        """
+        后台批量预下载资源
+
+        @param items: [(folder, name, download), ...], 已经存在的会被跳过
+        @param concurrency: 同时下载的数量
+        @param isBusy: 返回 `True` 时暂停下载, 给用户操作触发的请求让路
+        @param onProgress: `onProgress(done, total)`
+        """
+        pending = [item for item in items if not self.has(item[0], item[1])]
+        pending.reverse()
+
+        total = len(pending)
+        done = 0
+        failed = 0
+
+        logger.info(f"warm up started, {total} assets to download", TAG)
+
+        async def worker():
+            nonlocal done, failed
+
+            while pending:
+                folder, name, download = pending.pop()
+
+                while isBusy and isBusy():
+                    await asyncio.sleep(.1)
+
+                path = self.getPath(folder, name)
+
+                try:
+                    if path not in self.index:
+                        await self.singleFlight.do(
+                            path, lambda: self.__fetch(path, download))
+                except asyncio.CancelledError:
+                    raise
+                except BaseException as e:
+                    failed += 1
+                    logger.warning(f"warm up {path} failed: {e!r}", TAG)
+
+                done += 1
+
+                if onProgress:
+                    onProgress(done, total)
+
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+
+        logger.info(f"warm up finished, {done} done, {failed} failed", TAG)
+
+    def getStats(self):
+        return {
+            'files': len(self.index),
+            'hits': self.hits,
+            'misses': self.misses,
+            'downloading': len(self.singleFlight.calls),
+        }
+
+
+assetStore = AssetStore()
@@ -0,0 +1,89 @@
+import time
+
+
+class TTLCache:
+    """
+    带过期时间的内存缓存
+
+    用来缓存召唤师信息、段位这类短时间内会被反复查询、但又会变化的数据;
+    键由调用方决定, 一般是 (server, kind, puuid)
+
+    - 条目在 `ttl` 秒后过期
+    - 超过 `maxSize` 条时先清过期条目, 仍然超过时按写入顺序淘汰最早的
+    """
+
+    def __init__(self, ttl=60., maxSize=1024):
+        self.ttl = ttl
+        self.maxSize = maxSize
+
+        # key -> (expireAt, value), dict 本身保持写入顺序
+        self.data = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        @return: 缓存的值, 不存在或已过期时返回 `None`
+        """
+        item = self.data.get(key)
+
+        if item is None:
+            self.misses += 1
+            return None
+
+        expireAt, value = item
+
+        if expireAt < time.monotonic():
+            del self.data[key]
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return value
+
+    def put(self, key, value, ttl=None):
+        if ttl is None:
+            ttl = self.ttl
+
+        # 重新插入, 让它排到最后
+        self.data.pop(key, None)
+        self.data[key] = (time.monotonic() + ttl, value)
+
+        if len(self.data) > self.maxSize:
+            self.__evict()
+
+    def invalidate(self, predicate):
+        """
+        删除所有满足 `predicate(key)` 的条目
+
+        @return: 删除的条数
+        """
+        keys = [key for key in self.data if predicate(key)]
+
+        for key in keys:
+            del self.data[key]
+
+        return len(keys)
+
+    def clear(self):
+        self.data.clear()
+
+    def __evict(self):
+        now = time.monotonic()
+
+        for key in [key for key, (expireAt, _) in self.data.items() if expireAt < now]:
+            del self.data[key]
+
+        while len(self.data) > self.maxSize:
+            del self.data[next(iter(self.data))]
+
+    def getStats(self):
+        total = self.hits + self.misses
+
+        return {
+            'size': len(self.data),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hitRate': self.hits / total if total else 0.,
+        }
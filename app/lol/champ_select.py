@@ -0,0 +1,430 @@
+import asyncio
+import math
+import time
+
+from app.common.logger import logger
+
+TAG = "ChampSelect"
+
+
+class LatestWinsDispatcher:
+    """
+    最新优先的事件合并器
+
+    英雄选择阶段 LCU 会连续推送大量 `/lol-champ-select/v1/session` 更新 (悬停、计时器跳动等),
+    每一帧都是完整的 session 快照, 只有最新的那一帧有意义
+
+    - 处理函数同一时间只跑一个
+    - 处理期间到达的事件只保留最新的一个, 中间的直接丢掉
+    - 记录收到 / 处理 / 丢弃的数量, 以及事件从到达到开始处理的延迟
+    """
+
+    def __init__(self, handler, name="dispatcher"):
+        """
+        @param handler: 协程函数, `await handler(data)`
+        """
+        self.handler = handler
+        self.name = name
+
+        self.task: asyncio.Task = None
+
+        # (data, 到达时间)
+        self.latest = None
+
+        self.received = 0
+        self.handled = 0
+        self.dropped = 0
+        self.lagSum = 0.
+        self.lagMax = 0.
+        self.durationMax = 0.
+
+    def push(self, data):
+        self.received += 1
+
+        if self.latest is not None:
+            self.dropped += 1
+
+        self.latest = (data, time.perf_counter())
+
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.__run())
+
+    async def __run(self):
+        while self.latest is not None:
+            data, arrivedAt = self.latest
+            self.latest = None
+
+            start = time.perf_counter()
+            lag = start - arrivedAt
+
+            self.lagSum += lag
+            self.lagMax = max(self.lagMax, lag)
+
+            try:
+                await self.handler(data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"{self.name} handler failed", e, TAG)
+
+            self.handled += 1
+            self.durationMax = max(
+                self.durationMax, time.perf_counter() - start)
+
+    def reset(self):
+        """
+        丢掉还没处理的事件, 把统计数据打到日志里并清零, 如离开英雄选择时
+        """
+        self.latest = None
+
+        if self.received:
+            logger.info(f"{self.name} stats: {self.getStats()}", TAG)
+
+        self.received = self.handled = self.dropped = 0
+        self.lagSum = self.lagMax = self.durationMax = 0.
+
+    def getStats(self):
+        return {
+            'received': self.received,
+            'handled': self.handled,
+            'dropped': self.dropped,
+            'lagAvgMs': self.lagSum / self.handled * 1000 if self.handled else 0.,
+            'lagMaxMs': self.lagMax * 1000,
+            'durationMaxMs': self.durationMax * 1000,
+        }
+
+
+class ChampSelectView:
+    """
+    一帧英雄选择 session 的索引视图
+
+    每收到一帧只遍历一次 `actions` / `myTeam`, 各个自动功能直接读这里算好的结果,
+    不用每个功能都从头扫一遍
+    """
+
+    def __init__(self, data: dict):
+        self.data = data
+
+        self.cellId = data.get('localPlayerCellId')
+
+        timer = data.get('timer', {})
+        self.phase = timer.get('phase')
+
+        # 当前阶段 (BAN_PICK 时为当前这一轮) 结束的时间, 和 `time.time()` 同一时钟;
+        # LCU 与本程序在同一台机器上, `internalNowInEpochMs` 可以直接用,
+        # 只有明显对不上时 (如回放录制下来的数据) 才退回到收到这一帧的时间
+        if timer.get('isInfinite'):
+            self.deadline = math.inf
+        else:
+            now = time.time()
+            base = timer.get('internalNowInEpochMs', 0) / 1000
+
+            if abs(base - now) > 300:
+                base = now
+
+            self.deadline = base + \
+                timer.get('adjustedTimeLeftInPhase', 0) / 1000
+        self.myTeam = data.get('myTeam', [])
+
+        # 自己在 myTeam 里的条目, 观战等情况下可能没有
+        self.me = next(
+            (player for player in self.myTeam if player['cellId'] == self.cellId), None)
+        self.position = self.me.get('assignedPosition') if self.me else None
+        self.championId = self.me['championId'] if self.me else 0
+        self.pickIntent = self.me['championPickIntent'] if self.me else 0
+
+        # 自己的 action, 按出现顺序
+        self.myPickActions = []
+        self.myBanActions = []
+
+        # 最后一个包含自己 pick action 的 action 组里的那个 pick action
+        self.lastPickAction = None
+
+        # 第一个正在进行中的自己的 ban action
+        self.inProgressBan = None
+
+        # 其他人已经锁定的英雄
+        self.completedPicksByOthers = []
+
+        for actionGroup in data.get('actions', []):
+            groupPick = None
+
+            for action in actionGroup:
+                if action['actorCellId'] != self.cellId:
+                    if action['type'] == 'pick' and action['completed']:
+                        self.completedPicksByOthers.append(action['championId'])
+
+                    continue
+
+                if action['type'] == 'pick':
+                    self.myPickActions.append(action)
+
+                    if groupPick is None:
+                        groupPick = action
+                elif action['type'] == 'ban':
+                    self.myBanActions.append(action)
+
+                    if self.inProgressBan is None and action['isInProgress']:
+                        self.inProgressBan = action
+
+            if groupPick is not None:
+                self.lastPickAction = groupPick
+
+        bans = data.get('bans', {})
+        self.bans = frozenset(bans.get('myTeamBans', [])) | \
+            frozenset(bans.get('theirTeamBans', []))
+
+        self.intents = tuple(player['championPickIntent']
+                             for player in self.myTeam)
+
+        self.receivedSwaps = [swap for swap in data.get('pickOrderSwaps', [])
+                              if swap['state'] == 'RECEIVED']
+        self.receivedTrades = [trade for trade in data.get('trades', [])
+                               if trade['state'] == 'RECEIVED']
+
+    @staticmethod
+    def actionKey(action):
+        if action is None:
+            return None
+
+        return (action['id'], action['championId'], action['isInProgress'], action['completed'])
+
+    def timeLeft(self):
+        """
+        @return: 距离阶段结束还有多少秒, 可能为负数
+        """
+        return self.deadline - time.time()
+
+    def teamKey(self):
+        return tuple((player['cellId'], player.get('summonerId'), player['championId'],
+                      player['championPickIntent'], player.get('assignedPosition'))
+                     for player in self.myTeam)
+
+
+class DeadlineScheduler:
+    """
+    按阶段截止时间安排英雄选择中的延迟操作 (自动禁用、超时自动锁定等)
+
+    - 操作在 `delay` 秒后执行, 但不会晚于截止时间前 `margin` 秒;
+      截止时间取自最新一帧的 timer, 每来一帧都会重新计算
+    - 到点时把最新一帧的 `ChampSelectView` 交给操作自己重新判断, 不再额外请求 session
+    - 记录每个操作落地时离截止时间还剩多少
+    """
+
+    def __init__(self):
+        self.view: ChampSelectView = None
+        self.tasks = {}
+
+        # 有新的一帧时 set, 让等待中的操作重新计算时间
+        self.changed: asyncio.Event = None
+
+        # name -> [次数, 超时次数, 剩余时间之和, 最小剩余时间]
+        self.stats = {}
+
+    def update(self, view: ChampSelectView):
+        self.view = view
+
+        if self.changed is not None:
+            self.changed.set()
+
+        self.changed = asyncio.Event()
+
+    def isPending(self, name):
+        task = self.tasks.get(name)
+        return task is not None and not task.done()
+
+    def schedule(self, name, action, delay=0., margin=2.):
+        """
+        @param action: `await action(view)`, 用最新的一帧重新判断后执行, 做了操作返回 `True`
+        @param delay: 最早在多少秒之后执行
+        @param margin: 最晚在截止时间前多少秒执行
+
+        同名的操作还没执行时不会重复安排
+        """
+        if self.isPending(name):
+            return
+
+        self.tasks[name] = asyncio.create_task(
+            self.__run(name, action, time.time() + delay, margin))
+
+    async def __run(self, name, action, notBefore, margin):
+        while True:
+            view = self.view
+
+            if view is None:
+                return
+
+            wait = min(notBefore, view.deadline - margin) - time.time()
+
+            if wait <= 0:
+                break
+
+            try:
+                await asyncio.wait_for(self.changed.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
+        try:
+            if await action(view):
+                self.record(name, view)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception(f"{name} failed", e, TAG)
+
+    def record(self, name, view: ChampSelectView):
+        """
+        记录一次落地的操作, 在请求返回之后调用
+        """
+        left = view.timeLeft()
+
+        # 没有截止时间 (自定义对局等) 时选人、禁用也会走到这里, 这种不计入统计
+        if math.isinf(left):
+            return
+
+        stats = self.stats.setdefault(name, [0, 0, 0., math.inf])
+        stats[0] += 1
+        stats[1] += left < 0
+        stats[2] += left
+        stats[3] = min(stats[3], left)
+
+        logger.info(
+            f"{name} landed {left * 1000:.0f} ms before the deadline", TAG)
+
+    def reset(self):
+        for task in self.tasks.values():
+            task.cancel()
+
+        self.tasks.clear()
+        self.stats.clear()
+        self.view = None
+
+        if self.changed is not None:
+            self.changed.set()
+            self.changed = None
+
+    def getStats(self):
+        return {
+            name: {
+                'count': count,
+                'late': late,
+                'marginAvgMs': total / count * 1000,
+                'marginMinMs': least * 1000,
+            }
+            for name, (count, late, total, least) in self.stats.items()
+        }
+
+
+deadlineScheduler = DeadlineScheduler()
+
+
+class _Feature:
+    def __init__(self, func, inputs, name):
+        self.func = func
+        self.inputs = inputs
+        self.name = name
+
+
+_MISSING = object()
+
+
+class ChampSelectEngine:
+    """
+    英雄选择自动功能的调度器
+
+    每一帧先构造一次 `ChampSelectView`, 再对每个功能算出它关心的输入 (`inputs(view)`),
+    和这个功能上一次运行时的输入相同就跳过
+
+    - feature: 按阶段注册, 依次执行, 某个返回 `True` (做了操作) 时本帧后面的不再执行,
+      与原来的行为一致; 没执行到的功能下一帧会再次判断
+    - watcher: 与阶段无关, 只要输入变了就执行, 如刷新界面上的英雄头像
+    """
+
+    def __init__(self, selection):
+        """
+        @param selection: `ChampionSelection`, 传给每个功能
+        """
+        self.selection = selection
+
+        self.features = {}
+        self.watchers = []
+
+        self.lastInputs = {}
+        self.view: ChampSelectView = None
+
+        self.runs = 0
+        self.skips = 0
+
+    def addFeature(self, phases, func, inputs, name=None):
+        """
+        @param phases: 在哪些阶段执行, 如 ('BAN_PICK', 'FINALIZATION')
+        @param func: `await func(view, selection)`, 返回 `True` 表示做了操作
+        @param inputs: `inputs(view)`, 返回可比较的值
+        """
+        feature = _Feature(func, inputs, name or func.__name__)
+
+        for phase in phases:
+            self.features.setdefault(phase, []).append(feature)
+
+    def addWatcher(self, func, inputs, name=None):
+        """
+        @param func: `await func(view)`
+        """
+        self.watchers.append(_Feature(func, inputs, name or func.__name__))
+
+    def __changed(self, feature: _Feature, view):
+        key = feature.inputs(view)
+
+        if self.lastInputs.get(feature.name, _MISSING) == key:
+            self.skips += 1
+            return False
+
+        self.lastInputs[feature.name] = key
+        self.runs += 1
+
+        return True
+
+    async def __run(self, feature: _Feature, *args):
+        try:
+            return await feature.func(*args)
+        except:
+            # 出错了下一帧还要再试
+            self.lastInputs.pop(feature.name, None)
+            raise
+
+    async def update(self, data):
+        """
+        @param data: `/lol-champ-select/v1/session` 的内容
+        """
+        view = ChampSelectView(data)
+        deadlineScheduler.update(view)
+
+        for feature in self.features.get(view.phase, []):
+            if not self.__changed(feature, view):
+                continue
+
+            if await self.__run(feature, view, self.selection):
+                break
+
+        for watcher in self.watchers:
+            if self.__changed(watcher, view):
+                await self.__run(watcher, view)
+
+        self.view = view
+
+    def reset(self):
+        if self.runs or self.skips:
+            logger.info(f"champ select engine stats: {self.getStats()}", TAG)
+
+        self.lastInputs.clear()
+        self.view = None
+
+        deadlineScheduler.reset()
+        self.runs = self.skips = 0
+
+    def getStats(self):
+        return {
+            'runs': self.runs,
+            'skipped': self.skips,
+            'deadlines': deadlineScheduler.getStats(),
+        }
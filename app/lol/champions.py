@@ -1,10 +1,9 @@
 import json
 import os
 
-import aiohttp
-
 from app.common.config import LOCAL_PATH
 from app.common.logger import logger
+from app.common.session import sessionFactory
 from app.common.util import getLolClientVersion
 
 
@@ -27,9 +26,8 @@ class ChampionAlias:
         logger.info("Update champions alias", self.TAG)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                res = await session.get(self.URL, proxy=None, ssl=False)
-
+            session = sessionFactory.get()
+            async with session.get(self.URL, proxy=None) as res:
                 # 不知道为什么这样子不行：
                 # res = await res.json()
 
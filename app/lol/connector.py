@@ -1,6 +1,7 @@
 import asyncio
 import inspect
 import json
+import logging
 import os
 import re
 import subprocess
@@ -17,8 +18,21 @@ from PyQt5.QtCore import QObject
 from app.common.config import cfg, Language
 from app.common.logger import logger
 from app.common.signals import signalBus
+from app.common.session import sessionFactory
+from app.common.decoder import decoder
+from app.common.trace import tracer
 from app.common.util import getPortTokenServerByPid, getTasklistPath, getLolClientPid
 from app.lol.exceptions import *
+from app.lol.storage import gameDetailStorage, gameDataSnapshot, matchHistoryStorage
+from app.lol.history import MatchHistoryIndex, slimSGPGame
+from app.lol.assets import assetStore
+from app.lol.cache import TTLCache
+from app.lol.metrics import apiMetrics
+from app.lol.state import ClientState
+from app.lol.recording import WsRecorder
+from app.lol.request import (SingleFlight, RetryPolicy, RetryStats, PriorityScheduler,
+                             gatherWithLimit, requestPriority, responseStatus,
+                             recordResponseStatus, getErrorStatus, BACKGROUND)
 
 requests.packages.urllib3.disable_warnings()
 
@@ -31,6 +45,8 @@ class PastRequest:
         self.params_dict = params_dict
         self.kwargs = kwargs
         self.response = None
+        self.retries = None
+        self.elapsed = None
         self.timestamp = time.time()
 
     def __str__(self):
@@ -53,7 +69,7 @@ def needLcu():
     return decorator
 
 
-def retry(count=5, retry_sep=0):
+def retry(count=5, retry_sep=0, budget=5.):
     def decorator(func):
         async def wrapper(*args, **kwargs):
             logger.info(f"call %s" % func.__name__, TAG)
@@ -84,9 +100,12 @@ def retry(count=5, retry_sep=0):
                 connector.callStack.append(req_obj)
 
             exce = None
-            for _ in range(count):
+            state = RetryPolicy(count, retry_sep or .1,
+                                budget=budget).begin()
+
+            while True:
                 try:
-                    async with connector.semaphore:
+                    with responseStatus() as last:
                         res = await func(*args, **kwargs)
                 except CancelledError:
                     # Fix: 使用 task.cancel() 偶尔会停不下 task -- By Hpero4
@@ -95,21 +114,33 @@ def retry(count=5, retry_sep=0):
                     #   若 task 恰好跑到被 retry 装饰的函数中, 会被 retry 中的 BaseException 捕获并吞掉, 从而无事发生
                     raise
                 except BaseException as e:
-                    time.sleep(retry_sep)
                     exce = e
 
                     # SummonerNotFound 再重试会报 429 (限流)
                     if isinstance(e, SummonerNotFound):
+                        connector.retryStats.record(
+                            func.__name__, state, True)
                         raise e
 
-                    continue
+                    # LCU 返回 4xx 时函数一般是在取字段时出错, 按状态码判断要不要重试
+                    delay = state.next(e, last.status)
+                    if delay is None:
+                        break
+
+                    # 不能用 time.sleep, 会把整个 qasync 事件循环 (包括 UI) 卡住
+                    await asyncio.sleep(delay)
                 else:
+                    exce = None
                     break
-            else:
-                # 有异常抛异常, 没异常抛 RetryMaximumAttempts
-                exce = exce if exce else RetryMaximumAttempts(
-                    "Exceeded maximum retry attempts.")
 
+            connector.retryStats.record(
+                func.__name__, state, exce is not None)
+
+            with connector.dqLock:
+                req_obj.retries = state.retries or None
+                req_obj.elapsed = round(time.time() - req_obj.timestamp, 3)
+
+            if exce is not None:
                 # ReferenceError 为 LCU 未就绪仍有请求发送时抛出, 直接吞掉不用提示
                 # 其余异常弹一个提示
                 if type(exce) is not ReferenceError:
@@ -136,6 +167,49 @@ def retry(count=5, retry_sep=0):
     return decorator
 
 
+class WsSubscription:
+    """
+    一个 websocket 订阅
+
+    同一个订阅的回调按收到的顺序一个一个执行, 不会为每一帧都开一个新的 task;
+    积压的事件超过 `maxPending` 时丢掉最旧的
+    """
+
+    def __init__(self, uri, types, func, maxPending=64):
+        self.uri = uri
+        self.types = types
+        self.callable = func
+
+        self.pending = deque(maxlen=maxPending)
+        self.task: asyncio.Task = None
+
+    def push(self, data):
+        if len(self.pending) == self.pending.maxlen:
+            logger.warning(f"websocket handler for {self.uri} is too slow, "
+                           "dropping oldest event", TAG)
+
+        self.pending.append(data)
+
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.__drain())
+
+    async def __drain(self):
+        while self.pending:
+            data = self.pending.popleft()
+
+            try:
+                await self.callable(data)
+            except Exception as e:
+                logger.exception(
+                    f"websocket handler for {self.uri} failed", e, TAG)
+
+    def cancel(self):
+        self.pending.clear()
+
+        if self.task:
+            self.task.cancel()
+
+
 class LcuWebSocket():
     def __init__(self, port, token):
         self.port = port
@@ -144,30 +218,78 @@ class LcuWebSocket():
         self.events = []
         self.subscribes = []
 
+        self.session = None
+        self.ws = None
+        self.task = None
+
+        # 连上并发完订阅之后 set, 此后客户端的改动都会推送过来
+        self.connected = asyncio.Event()
+
+        # 设置了环境变量 SERAPHINE_WS_RECORD (文件路径) 时, 把收到的帧录下来
+        self.recorder: WsRecorder = None
+
+        # (uri, eventType) -> [WsSubscription], 精确匹配, 一次字典查找
+        self.exact = {}
+        # [(前缀, WsSubscription)], `uri` 以 '*' 结尾的订阅
+        self.prefixes = []
+        # uri 为空的订阅, 匹配所有事件
+        self.wildcards = []
+
     def subscribe(self, event: str, uri: str = '', type: tuple = ('Update', 'Create', 'Delete')):
+        """
+        @param uri: 为空时匹配所有 uri; 以 '*' 结尾时按前缀匹配
+        @param type: 为空时匹配所有 eventType
+        """
         def wrapper(func):
-            self.events.append(event)
-            self.subscribes.append({
-                'uri': uri,
-                'type': type,
-                'callable': func
-            })
+            if event not in self.events:
+                self.events.append(event)
+
+            sub = WsSubscription(uri, type, func)
+            self.subscribes.append(sub)
+
+            if not uri:
+                self.wildcards.append(sub)
+            elif uri.endswith('*'):
+                self.prefixes.append((uri[:-1], sub))
+            elif not type:
+                # 没有限定 eventType 的精确 uri, 当作一个不带 '*' 的前缀处理
+                self.prefixes.append((uri, sub))
+            else:
+                for t in type:
+                    self.exact.setdefault((uri, t), []).append(sub)
+
             return func
 
         return wrapper
 
     def matchUri(self, data):
-        for s in self.subscribes:
-            # If the 'uri' or 'type' is empty, it matches any event.
-            if not (s.get('uri') or s.get('type')) or (
-                    data.get('uri') == s['uri'] and data.get('eventType') in s['type']):
-                logger.info(s['uri'], TAG)
-                logger.debug(data, TAG)
-                asyncio.create_task(s['callable'](data))
-                # return
+        uri = data.get('uri')
+        eventType = data.get('eventType')
+
+        matched = list(self.exact.get((uri, eventType), ()))
+
+        if uri:
+            for prefix, sub in self.prefixes:
+                if (uri.startswith(prefix) and (sub.uri.endswith('*') or uri == prefix)
+                        and (not sub.types or eventType in sub.types)):
+                    matched.append(sub)
+
+        for sub in self.wildcards:
+            if not sub.types or eventType in sub.types:
+                matched.append(sub)
+
+        if not matched:
+            return
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{eventType} {uri}: {data}", TAG)
+
+        for sub in matched:
+            sub.push(data)
 
     async def runWs(self):
-        self.session = aiohttp.ClientSession(
+        self.session = sessionFactory.create(
+            "lcu",
             auth=aiohttp.BasicAuth('riot', self.token),
             headers={
                 'Content-type': 'application/json',
@@ -175,24 +297,64 @@ class LcuWebSocket():
             }
         )
         address = f'wss://127.0.0.1:{self.port}/'
-        self.ws = await self.session.ws_connect(address, ssl=False)
+        self.ws = await self.session.ws_connect(address)
 
         # see: https://hextechdocs.dev/getting-started-with-the-lcu-websocket/
         for event in self.events:
             await self.ws.send_json([5, event])
 
+        self.connected.set()
+
+        if path := os.environ.get("SERAPHINE_WS_RECORD"):
+            self.recorder = WsRecorder(path)
+            logger.info(f"recording websocket frames to {path}", TAG)
+
         while True:
             msg = await self.ws.receive()
 
             if msg.type == aiohttp.WSMsgType.TEXT and msg.data != '':
-                data = json.loads(msg.data)[2]
-                self.matchUri(data)
+                self.onMessage(msg.data)
             elif msg.type == aiohttp.WSMsgType.CLOSED:
                 logger.info("WebSocket closed", TAG)
                 break
 
+        self.__closeRecorder()
         await self.session.close()
 
+    def onMessage(self, raw: str):
+        """
+        处理收到的一帧, 回放录制的数据时也从这里进入
+        """
+        if self.recorder:
+            self.recorder.write(raw)
+
+        self.matchUri(decoder.loads(raw)[2])
+
+    def __closeRecorder(self):
+        if self.recorder:
+            logger.info(f"{self.recorder.frames} websocket frames recorded", TAG)
+            self.recorder.close()
+            self.recorder = None
+
+    def isConnected(self):
+        return self.ws is not None and not self.ws.closed
+
+    async def waitConnected(self, timeout=None):
+        """
+        等 websocket 连上并发完订阅
+
+        @return: 连上了返回 `True`; 连接失败或超时返回 `False`
+        """
+        waiter = asyncio.ensure_future(self.connected.wait())
+
+        try:
+            await asyncio.wait((waiter, self.task), timeout=timeout,
+                               return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+
+        return self.connected.is_set() and self.isConnected()
+
     async def start(self):
         if "OnJsonApiEvent" in self.events:
             raise AssertionError(
@@ -202,8 +364,16 @@ class LcuWebSocket():
         self.task = asyncio.create_task(self.runWs())
 
     async def close(self):
-        self.task.cancel()
-        await self.session.close()
+        if self.task:
+            self.task.cancel()
+
+        for sub in self.subscribes:
+            sub.cancel()
+
+        self.__closeRecorder()
+
+        if self.session:
+            await self.session.close()
 
 
 class LolClientConnector(QObject):
@@ -212,7 +382,8 @@ class LolClientConnector(QObject):
         super().__init__()
         self.maxRefCnt = cfg.get(cfg.apiConcurrencyNumber)
 
-        self.semaphore = None
+        # LCU 请求按优先级排队, 见 `requestPriority`
+        self.scheduler: PriorityScheduler = None
         self.lcuSess = None
         self.sgpSess = None
         self.port = None
@@ -224,9 +395,32 @@ class LolClientConnector(QObject):
         self.manager = None
         self.perksStyleCache = None
 
+        self.warmUpTask: asyncio.Task = None
+        self.hydrateTask: asyncio.Task = None
+
+        # 客户端版本号与语言, 用作本地游戏数据快照的键
+        self.gameVersion = None
+        self.locale = None
+
         self.dqLock = threading.Lock()
         self.callStack = deque(maxlen=10)
 
+        # 合并同时发出的相同 GET 请求
+        self.singleFlight = SingleFlight()
+
+        # 重试次数与退避时长, 供排查问题时查看
+        self.retryStats = RetryStats()
+
+        # 召唤师信息与段位的短期缓存, 键为 (server, kind, puuid)
+        self.profileCache = TTLCache(ttl=300.)
+
+        # 每个人最近若干局战绩的本地索引, 再查同一个人时只拉新打的对局
+        self.matchHistory = MatchHistoryIndex(matchHistoryStorage)
+
+        # websocket 推送过来的 LCU 资源镜像, 连接正常时直接用, 不用再去请求
+        self.listener: LcuWebSocket = None
+        self.state = ClientState()
+
     async def autoStart(self):
         '''
         只是为了 debug 的时候省事罢了
@@ -245,16 +439,23 @@ class LolClientConnector(QObject):
             signalBus.getCmdlineError.emit()
             return
 
-        self.semaphore = asyncio.Semaphore(self.maxRefCnt)
+        self.scheduler = PriorityScheduler(self.maxRefCnt)
 
         await self.__initSessions()
         self.__initPlatformInfo()
         await self.__initManager()
         self.__initFolder()
         await self.__runListener()
-        await self.__initRuneStyle()
+        self.hydrateTask = asyncio.create_task(self.__hydrateState())
+
+        if await self.__initRuneStyle():
+            await self.__saveGameDataSnapshot()
+
+        if cfg.get(cfg.enableAssetsWarmUp):
+            self.warmUpTask = asyncio.create_task(self.__warmUpAssets())
 
-        logger.critical(f"connector started, server: {self.server}", TAG)
+        logger.critical(
+            f"connector started, server: {self.server}, json decoder: {decoder.name}", TAG)
 
     async def __runListener(self):
         self.listener = LcuWebSocket(self.port, self.token)
@@ -263,19 +464,46 @@ class LolClientConnector(QObject):
                                  uri='/lol-summoner/v1/current-summoner',
                                  type=('Update',))
         async def onCurrentSummonerProfileChanged(event):
+            self.__updateState(event)
+            self.invalidateProfileCache(event['data'].get('puuid'))
+            self.matchHistory.invalidate(event['data'].get('puuid'))
             signalBus.currentSummonerProfileChanged.emit(event['data'])
 
         @self.listener.subscribe(event='OnJsonApiEvent_lol-gameflow_v1_gameflow-phase',
                                  uri='/lol-gameflow/v1/gameflow-phase',
                                  type=('Update',))
         async def onGameFlowPhaseChanged(event):
+            self.__updateState(event)
+
+            # 上一次的确认状态 (如被人拒绝后重新排队) 不能用到下一次
+            if event['data'] != 'ReadyCheck':
+                self.state.delete('/lol-matchmaking/v1/ready-check')
+
+            # 同理, 上一局的 mapSide 不能用到下一次英雄选择
+            if event['data'] != 'ChampSelect':
+                self.state.delete('/lol-champ-select/v1/pin-drop-notification')
+
+            tracer.instant("gameStatusChanged", phase=event['data'])
             signalBus.gameStatusChanged.emit(event['data'])
 
         @self.listener.subscribe(event='OnJsonApiEvent_lol-champ-select_v1_session',
-                                 uri='/lol-champ-select/v1/session',
-                                 type=('Update',))
+                                 uri='/lol-champ-select/v1/session')
         async def onChampSelectChanged(event):
-            signalBus.champSelectChanged.emit(event)
+            self.__updateState(event)
+
+            if event['eventType'] == 'Update':
+                signalBus.champSelectChanged.emit(event)
+
+        # 以下资源只需要保持镜像最新
+        for event, uri in [
+            ('OnJsonApiEvent_lol-gameflow_v1_session', '/lol-gameflow/v1/session'),
+            ('OnJsonApiEvent_lol-matchmaking_v1_ready-check',
+             '/lol-matchmaking/v1/ready-check'),
+            ('OnJsonApiEvent_lol-lobby_v2_lobby', '/lol-lobby/v2/lobby'),
+            ('OnJsonApiEvent_lol-champ-select_v1_pin-drop-notification',
+             '/lol-champ-select/v1/pin-drop-notification'),
+        ]:
+            self.listener.subscribe(event=event, uri=uri)(self.__onStateChanged)
 
         @self.listener.subscribe(event="OnJsonApiEvent_entitlements_v1_token",
                                  uri='/entitlements/v1/token',
@@ -289,12 +517,69 @@ class LolClientConnector(QObject):
 
         await self.listener.start()
 
+    def __updateState(self, event):
+        if event['eventType'] == 'Delete':
+            self.state.delete(event['uri'])
+        else:
+            self.state.update(event['uri'], event['data'])
+
+    async def __onStateChanged(self, event):
+        self.__updateState(event)
+
+    async def __hydrateState(self):
+        """
+        连接客户端时把镜像中的资源各请求一次, 之后交给 websocket 推送更新
+
+        要等订阅发出去之后再请求, 否则请求期间的改动收不到推送, 镜像也不会写入;
+        没连上时不请求, 之后用到的时候再按需请求
+        """
+        if not await self.listener.waitConnected(timeout=10):
+            logger.warning("websocket not connected, skip hydrating state", TAG)
+            return
+
+        await asyncio.gather(
+            self.getCurrentSummoner(),
+            self.getGameStatus(),
+            self.getGameflowSession(),
+            self.getChampSelectSession(),
+            self.getReadyCheckStatus(),
+            self.getLobby(),
+            return_exceptions=True)
+
+    async def __getState(self, uri, fetch, isFresh=None):
+        """
+        websocket 正常且镜像中有数据时直接返回, 否则请求一次 (冷启动或断线)
+        并在请求期间没有推送时写回镜像
+
+        @param fetch: 请求该资源的协程函数, 返回解析后的数据
+        @param isFresh: `isFresh(data)`, 返回 `False` 时认为镜像里的数据还没跟上, 重新请求
+        """
+        connected = self.listener is not None and self.listener.isConnected()
+
+        if connected and (data := self.state.get(uri)) is not None:
+            if isFresh is None or isFresh(data):
+                return data
+
+        version = self.state.getVersion(uri)
+        data = await fetch()
+
+        if connected and not (isinstance(data, dict) and data.get('errorCode')):
+            self.state.hydrate(uri, version, data)
+
+        return data
+
     async def close(self):
         try:
             await self.listener.close()
         except:
             pass
 
+        if self.warmUpTask:
+            self.warmUpTask.cancel()
+
+        if self.hydrateTask:
+            self.hydrateTask.cancel()
+
         if self.lcuSess:
             await self.lcuSess.close()
 
@@ -304,8 +589,10 @@ class LolClientConnector(QObject):
         self.__init__()
 
     async def __initSessions(self):
-        self.lcuSess = aiohttp.ClientSession(
+        self.lcuSess = sessionFactory.create(
+            "lcu",
             base_url=f'https://127.0.0.1:{self.port}',
+            response_class=apiMetrics.responseClass("lcu"),
             auth=aiohttp.BasicAuth('riot', self.token)
         )
 
@@ -317,44 +604,59 @@ class LolClientConnector(QObject):
         else:
             url = f'https://{self.server.lower()}-sgp.lol.qq.com:21019'
 
-        self.sgpSess = aiohttp.ClientSession(
-            base_url=url
-        )
+        # 指向本地的替身服务器, 见 benchmark/standin_server.py
+        url = os.environ.get("SERAPHINE_SGP_URL", url)
+
+        self.sgpSess = sessionFactory.create(
+            "sgp", base_url=url, response_class=apiMetrics.responseClass("sgp"))
 
         self.sgpToken = await self.getSGPtoken()
 
     def __initFolder(self):
-        if not os.path.exists("app/resource/game"):
-            os.mkdir("app/resource/game")
-
-        for folder in [
-            "champion icons",
-            "item icons",
-            "profile icons",
-            "rune icons",
-            "summoner spell icons",
-            "augment icons",
-            "splashes",
-        ]:
-            p = f"app/resource/game/{folder}"
-            if not os.path.exists(p):
-                os.mkdir(p)
+        assetStore.init()
 
     async def __initManager(self):
-        items = await self.__json_retry_get("/lol-game-data/assets/v1/items.json")
-        spells = await self.__json_retry_get(
-            "/lol-game-data/assets/v1/summoner-spells.json")
-        runes = await self.__json_retry_get("/lol-game-data/assets/v1/perks.json")
-        perks = await self.__json_retry_get("/lol-game-data/assets/v1/perkstyles.json")
-        queues = await self.__json_retry_get("/lol-game-queues/v1/queues")
-        champions = await self.__json_retry_get(
-            "/lol-game-data/assets/v1/champion-summary.json")
-        skins = await self.__json_retry_get("/lol-game-data/assets/v1/skins.json")
-        augments = await self.__json_retry_get("/lol-game-data/assets/v1/cherry-augments.json")
+        # 同一个版本、同一种语言的数据是一样的, 有快照就直接用
+        try:
+            version, locale = await asyncio.gather(
+                self.__json_retry_get("/lol-patch/v1/game-version"),
+                self.__json_retry_get("/riotclient/region-locale"))
+            locale = locale['locale']
+        except Exception as e:
+            logger.exception("get game version / locale failed", e, TAG)
+            version = locale = None
+
+        if version and locale:
+            snapshot = await gameDataSnapshot.load(version, locale)
+
+            if snapshot:
+                self.gameVersion = version
+                self.locale = locale
+                self.manager = JsonManager.fromSnapshot(snapshot)
+                logger.info(
+                    f"game data loaded from snapshot: {version}, {locale}", TAG)
+                return
+
+        urls = [
+            "/lol-game-data/assets/v1/items.json",
+            "/lol-game-data/assets/v1/summoner-spells.json",
+            "/lol-game-data/assets/v1/perks.json",
+            "/lol-game-data/assets/v1/perkstyles.json",
+            "/lol-game-queues/v1/queues",
+            "/lol-game-data/assets/v1/champion-summary.json",
+            "/lol-game-data/assets/v1/skins.json",
+            "/lol-game-data/assets/v1/cherry-augments.json",
+        ]
+
+        items, spells, runes, perks, queues, champions, skins, augments = \
+            await asyncio.gather(*[self.__json_retry_get(url) for url in urls])
 
         self.manager = JsonManager(
             items, spells, runes, queues, champions, skins, perks, augments)
 
+        self.gameVersion = version
+        self.locale = locale
+
     def __initPlatformInfo(self):
         if self.server:
             platforms = {'tj100', 'hn1', 'cq100',
@@ -363,33 +665,66 @@ class LolClientConnector(QObject):
             self.inTencent = self.server.lower() in platforms
 
     async def __initRuneStyle(self):
-        res = {}
-
-        for item in self.manager.perks['styles']:
-            id = item['id']
-            name = item['name']
+        """
+        @return: 是否重新构建了 `perkStyles` (需要更新本地快照)
+        """
+        # 快照里带了, 并且图标文件都还在, 就不用再构建了
+        styles = self.manager.perkStyles
+        if styles and all(path in assetStore.index for path in self.__getRuneStyleIcons(styles)):
+            return False
 
-            slots = []
+        styles = self.manager.perks['styles']
 
+        runeIds = {item['id'] for item in styles}
+        for item in styles:
             for s in item['slots']:
-                perks = [{
-                    "runeId": perk,
-                    "icon": await self.getRuneIcon(perk),
-                    "name": self.manager.getRuneName(perk),
-                    "desc": self.manager.getRuneDesc(perk),
-                } for perk in s['perks']
-                ]
+                runeIds.update(s['perks'])
+
+        # 所有符文图标作为一批并发下载, 而不是一个一个 await
+        runeIds = list(runeIds)
+        icons = await gatherWithLimit(
+            self.maxRefCnt * 4, [self.getRuneIcon(id) for id in runeIds])
+        icons = dict(zip(runeIds, icons))
+
+        res = {}
+
+        for item in styles:
+            id = item['id']
 
-                slots.append(perks)
+            slots = [[{
+                "runeId": perk,
+                "icon": icons[perk],
+                "name": self.manager.getRuneName(perk),
+                "desc": self.manager.getRuneDesc(perk),
+            } for perk in s['perks']
+            ] for s in item['slots']]
 
             res[id] = {
-                "name": name,
-                "icon": await self.getRuneIcon(id),
+                "name": item['name'],
+                "icon": icons[id],
                 "slots": slots
             }
 
         self.manager.perkStyles = res
 
+        return True
+
+    @staticmethod
+    def __getRuneStyleIcons(styles):
+        for style in styles.values():
+            yield style['icon']
+
+            for slot in style['slots']:
+                for perk in slot:
+                    yield perk['icon']
+
+    async def __saveGameDataSnapshot(self):
+        if not (self.gameVersion and self.locale):
+            return
+
+        await gameDataSnapshot.save(
+            self.gameVersion, self.locale, self.manager.toSnapshot())
+
     async def __json_retry_get(self, url, max_retries=5):
         """
         根据 httpStatus 字段值, retry 获取数据
@@ -401,49 +736,94 @@ class LolClientConnector(QObject):
         @return: json
         @rtype: dict
         """
-        retries = 0
-        while retries < max_retries:
+        state = RetryPolicy(max_retries, .25, budget=8.).begin()
+
+        while True:
+            status = None
+
             try:
                 result = await self.__get(url)
                 result = await result.json()
 
             # 客户端刚打开, Service 正在初始化
             # 有部分请求可能会 ConnectionError, 直接忽略重试
-            except aiohttp.ClientConnectorError:
-                retries += 1
-                time.sleep(.5)
-                continue
-
-            if type(result) is list:
-                return result
-
-            # 如果有才判定, 有部分相应成功时没有 httpStatus
-            elif result.get("httpStatus") and result.get("httpStatus") != 200:
-                time.sleep(.5)
-                retries += 1
+            except (aiohttp.ClientConnectorError, RequestRateLimited) as e:
+                exce = e
             else:
-                return result
+                # 5xx (服务还没起来) 重试, 4xx 重试了也一样
+                if status := getErrorStatus(result):
+                    exce = RetryMaximumAttempts(f"{url}: httpStatus {status}")
+                else:
+                    self.retryStats.record("__json_retry_get", state, False)
+                    return result
 
-        # 最大重试次数, 抛异常
-        raise RetryMaximumAttempts("Exceeded maximum retry attempts.")
+            delay = state.next(exce, status)
+            if delay is None:
+                break
+
+            await asyncio.sleep(delay)
+
+        self.retryStats.record("__json_retry_get", state, True)
+
+        # 最大重试次数或者不该重试 (4xx), 抛异常
+        raise RetryMaximumAttempts(f"{url}: gave up after {state.retries} retries, {exce!r}")
 
-    @retry()
     async def getRuneIcon(self, runeId):
         if runeId == 0:
             return "app/resource/images/rune-0.png"
 
-        icon = f"app/resource/game/rune icons/{runeId}.png"
-        if not os.path.exists(icon):
-            path = self.manager.getRuneIconPath(runeId)
-            res = await self.__get(path)
+        return await assetStore.get(
+            "rune icons", f"{runeId}.png",
+            lambda: self.__downloadAsset(self.manager.getRuneIconPath(runeId)))
 
-            with open(icon, "wb") as f:
-                f.write(await res.read())
+    @retry()
+    async def __downloadAsset(self, path):
+        res = await self.__get(path)
+        return await res.read()
 
-        return icon
+    async def __warmUpAssets(self):
+        """
+        后台预下载 `JsonManager` 中所有英雄、装备、召唤师技能、符文与强化符文的图标
+        """
+        async def download(path):
+            # 不走 retry, 失败了也不要弹窗, 下次用到的时候再下就是了
+            res = await self.__get(path)
+            res.raise_for_status()
+
+            return await res.read()
+
+        def item(folder, name, path):
+            return (folder, name, lambda: download(path))
+
+        m = self.manager
+        items = []
+
+        items.extend(item("champion icons", f"{id}.png", m.getChampionIconPath(id))
+                     for id in m.champs if id not in (-1, 0))
+        items.extend(item("summoner spell icons", f"{id}.png", path)
+                     for id, path in m.spells.items())
+        items.extend(item("item icons", f"{id}.png", path)
+                     for id, path in m.items.items() if id != 0)
+        items.extend(item("rune icons", f"{id}.png", rune['icon'])
+                     for id, rune in m.runes.items())
+        items.extend(item("rune icons", f"{style['id']}.png", style['iconPath'])
+                     for style in m.perks['styles'])
+        items.extend(item("augment icons", f"{id}.png", m.getAugmentsIconPath(id))
+                     for id in m.cherryAugments)
+
+        with requestPriority(BACKGROUND):
+            await assetStore.warmUp(
+                items,
+                # 有请求在排队时先停下, 不和界面上的请求抢
+                isBusy=lambda: self.scheduler.isBusy(),
+                onProgress=signalBus.assetsWarmUpProgress.emit)
 
-    @retry()
     async def getCurrentSummoner(self):
+        return await self.__getState("/lol-summoner/v1/current-summoner",
+                                     self.__getCurrentSummoner)
+
+    @retry()
+    async def __getCurrentSummoner(self):
         res = await self.__get("/lol-summoner/v1/current-summoner")
         res = await res.json()
 
@@ -457,49 +837,24 @@ class LolClientConnector(QObject):
         res = await self.__get("/data-store/v1/install-dir")
         return await res.json()
 
-    @retry()
     async def getProfileIcon(self, iconId):
-        icon = f"./app/resource/game/profile icons/{iconId}.jpg"
-
-        if not os.path.exists(icon):
-            path = self.manager.getSummonerProfileIconPath(iconId)
-            res = await self.__get(path)
-
-            with open(icon, "wb") as f:
-                f.write(await res.read())
+        return await assetStore.get(
+            "profile icons", f"{iconId}.jpg",
+            lambda: self.__downloadAsset(self.manager.getSummonerProfileIconPath(iconId)))
 
-        return icon
-
-    @retry()
     async def getItemIcon(self, iconId):
         if iconId == 0:
             return "app/resource/images/item-0.png"
 
-        icon = f"app/resource/game/item icons/{iconId}.png"
+        return await assetStore.get(
+            "item icons", f"{iconId}.png",
+            lambda: self.__downloadAsset(self.manager.getItemIconPath(iconId)))
 
-        if not os.path.exists(icon):
-            path = self.manager.getItemIconPath(iconId)
-            res = await self.__get(path)
-
-            with open(icon, "wb") as f:
-                f.write(await res.read())
-
-        return icon
-
-    @retry()
     async def getAugmentIcon(self, augmentId):
-        icon = f"app/resource/game/augment icons/{augmentId}.png"
-
-        if not os.path.exists(icon):
-            path = self.manager.getAugmentsIconPath(augmentId)
-            res = await self.__get(path)
-
-            with open(icon, "wb") as f:
-                f.write(await res.read())
-
-        return icon
+        return await assetStore.get(
+            "augment icons", f"{augmentId}.png",
+            lambda: self.__downloadAsset(self.manager.getAugmentsIconPath(augmentId)))
 
-    @retry()
     async def getChampionSplashes(self, skinInfo, isCentered: bool):
         """
         :param skinInfo:
@@ -518,34 +873,20 @@ class LolClientConnector(QObject):
         splashesId = skinInfo["skinId"]
 
         if isCentered:
-            image = f"app/resource/game/splashes/{splashesId}_centered.jpg"
+            name = f"{splashesId}_centered.jpg"
             url = skinInfo["splashPath"]
         else:
-            image = f"app/resource/game/splashes/{splashesId}_uncentered.jpg"
+            name = f"{splashesId}_uncentered.jpg"
             url = skinInfo["uncenteredSplashPath"]
 
-        if not os.path.exists(image):
-            res = await self.__get(url)
-
-            with open(image, "wb") as f:
-                f.write(await res.read())
+        return await assetStore.get(
+            "splashes", name, lambda: self.__downloadAsset(url))
 
-        return image
-
-    @retry()
     async def getSummonerSpellIcon(self, spellId):
-        icon = f"app/resource/game/summoner spell icons/{spellId}.png"
-
-        if not os.path.exists(icon):
-            path = self.manager.getSummonerSpellIconPath(spellId)
-            res = await self.__get(path)
-
-            with open(icon, "wb") as f:
-                f.write(await res.read())
-
-        return icon
+        return await assetStore.get(
+            "summoner spell icons", f"{spellId}.png",
+            lambda: self.__downloadAsset(self.manager.getSummonerSpellIconPath(spellId)))
 
-    @retry()
     async def getChampionIcon(self, championId) -> str:
         """
         @param championId:
@@ -556,16 +897,9 @@ class LolClientConnector(QObject):
         if championId in [-1, 0]:
             return "app/resource/images/champion-0.png"
 
-        icon = f"app/resource/game/champion icons/{championId}.png"
-
-        if not os.path.exists(icon):
-            path = self.manager.getChampionIconPath(championId)
-            res = await self.__get(path)
-
-            with open(icon, "wb") as f:
-                f.write(await res.read())
-
-        return icon
+        return await assetStore.get(
+            "champion icons", f"{championId}.png",
+            lambda: self.__downloadAsset(self.manager.getChampionIconPath(championId)))
 
     @retry()
     async def getSummonerByName(self, name):
@@ -575,8 +909,12 @@ class LolClientConnector(QObject):
 
         return res
 
-    @retry()
     async def getSummonerByPuuid(self, puuid):
+        return await self.__cachedProfile(
+            "summoner", puuid, self.__getSummonerByPuuid)
+
+    @retry()
+    async def __getSummonerByPuuid(self, puuid):
         res = await self.__get(f"/lol-summoner/v2/summoners/puuid/{puuid}")
         res = await res.json()
 
@@ -585,6 +923,32 @@ class LolClientConnector(QObject):
 
         return res
 
+    @retry()
+    async def getSummonersByIds(self, summonerIds):
+        """
+        批量获取召唤师信息, 一次请求拿到一整局的人
+
+        @param summonerIds: summonerId 列表
+        @return: 召唤师信息列表, 查不到的 id 不会出现在结果里
+        """
+        if not summonerIds:
+            return []
+
+        params = {'ids': f"[{','.join(str(id) for id in summonerIds)}]"}
+        res = await self.__get("/lol-summoner/v2/summoners", params)
+        res = await res.json()
+
+        if not isinstance(res, list):
+            return []
+
+        # 顺便填进缓存, 之后按 puuid 单独查的时候就不用再发请求了
+        for summoner in res:
+            if summoner.get('puuid'):
+                self.profileCache.put(
+                    (self.server, "summoner", summoner['puuid']), summoner)
+
+        return res
+
     @retry(5, 1)
     async def getSummonerGamesByPuuidSlowly(self, puuid, begIndex=0, endIndex=4):
         """
@@ -612,22 +976,38 @@ class LolClientConnector(QObject):
 
         return res["games"]
 
-    @retry()
     async def getSummonerGamesByPuuid(self, puuid, begIndex=0, endIndex=4):
         """
         Retrieves a list of summoner games by PUUID.
 
+        Games already in `self.matchHistory` are read locally, only newer
+        games and the missing tail of the window are requested.
+
         Args:
             puuid (str): The PUUID of the summoner.
             begIndex (int, optional): The starting index of the games to retrieve. Defaults to 0.
             endIndex (int, optional): The ending index of the games to retrieve. Defaults to 4.
 
         Returns:
-            list: A list of summoner games.
+            dict: `gameCount`, `gameIndexBegin`, `gameIndexEnd` and `games`.
 
         Raises:
             SummonerGamesNotFound: If the summoner games are not found.
         """
+        games = await self.matchHistory.getGames(
+            self.server, "lcu", puuid, begIndex, endIndex,
+            lambda beg, end: self.__getSummonerGamesByPuuid(puuid, beg, end),
+            lambda game: game['gameId'])
+
+        return {
+            'gameCount': len(games),
+            'gameIndexBegin': begIndex,
+            'gameIndexEnd': endIndex,
+            'games': games,
+        }
+
+    @retry()
+    async def __getSummonerGamesByPuuid(self, puuid, begIndex, endIndex):
         params = {"begIndex": begIndex, "endIndex": endIndex}
         res = await self.__get(
             f"/lol-match-history/v1/products/lol/{puuid}/matches", params
@@ -637,16 +1017,33 @@ class LolClientConnector(QObject):
         if "games" not in res:
             raise SummonerGamesNotFound()
 
-        return res["games"]
+        return res["games"]["games"]
 
-    @retry()
     async def getGameDetailByGameId(self, gameId):
+        # 结束了的对局不会再变, 优先读本地存储
+        game = await gameDetailStorage.get(self.server, gameId)
+        if game is not None:
+            return game
+
+        game = await self.__getGameDetailByGameId(gameId)
+
+        if game.get("gameId") and not game.get("errorCode"):
+            await gameDetailStorage.put(self.server, gameId, game)
+
+        return game
+
+    @retry()
+    async def __getGameDetailByGameId(self, gameId):
         res = await self.__get(f"/lol-match-history/v1/games/{gameId}")
 
         return await res.json()
 
-    @retry()
     async def getRankedStatsByPuuid(self, puuid):
+        return await self.__cachedProfile(
+            "ranked", puuid, self.__getRankedStatsByPuuid)
+
+    @retry()
+    async def __getRankedStatsByPuuid(self, puuid):
         res = await self.__get(f"/lol-ranked/v1/ranked-stats/{puuid}")
 
         res = await res.json()
@@ -793,19 +1190,39 @@ class LolClientConnector(QObject):
         res = await self.__post("/lol-matchmaking/v1/ready-check/accept")
         return res
 
-    @retry()
     async def getGameflowSession(self):
+        # gameflow-phase 的推送可能比 session 的先到, 此时 session 里还是上一个阶段的数据
+        phase = self.state.resources.get("/lol-gameflow/v1/gameflow-phase")
+
+        return await self.__getState("/lol-gameflow/v1/session",
+                                     self.__getGameflowSession,
+                                     lambda data: phase is None or data.get('phase') == phase)
+
+    @retry()
+    async def __getGameflowSession(self):
         # FIXME
         # 若刚进行完一场对局, 随后开启一盘自定义, 玩家在红色方且蓝色方没人时,
         # 该接口会返回上一局中蓝色方的队员信息 (teamOne or teamTwo)
         res = await self.__get("/lol-gameflow/v1/session")
         return await res.json()
 
-    @retry()
     async def getChampSelectSession(self):
+        return await self.__getState("/lol-champ-select/v1/session",
+                                     self.__getChampSelectSession)
+
+    @retry()
+    async def __getChampSelectSession(self):
         res = await self.__get("/lol-champ-select/v1/session")
         return await res.json()
 
+    async def getLobby(self):
+        return await self.__getState("/lol-lobby/v2/lobby", self.__getLobby)
+
+    @retry()
+    async def __getLobby(self):
+        res = await self.__get("/lol-lobby/v2/lobby")
+        return await res.json()
+
     @retry()
     async def getGameQueues(self):
         res = await self.__get("/lol-game-queues/v1/queues")
@@ -911,22 +1328,34 @@ class LolClientConnector(QObject):
 
         return await res.json()
 
-    # @retry()
     async def getGameStatus(self):
+        return await self.__getState("/lol-gameflow/v1/gameflow-phase",
+                                     self.__getGameStatus)
+
+    # @retry()
+    async def __getGameStatus(self):
         res = await self.__get("/lol-gameflow/v1/gameflow-phase")
         res = await res.text()
 
         return res[1:-1]
 
-    @retry()
     async def getMapSide(self):
-        res = await self.__get("/lol-champ-select/v1/pin-drop-notification")
-        res = await res.json()
+        res = await self.__getState("/lol-champ-select/v1/pin-drop-notification",
+                                    self.__getPinDropNotification)
 
         return res.get("mapSide", "")
 
     @retry()
+    async def __getPinDropNotification(self):
+        res = await self.__get("/lol-champ-select/v1/pin-drop-notification")
+        return await res.json()
+
     async def getReadyCheckStatus(self):
+        return await self.__getState("/lol-matchmaking/v1/ready-check",
+                                     self.__getReadyCheckStatus)
+
+    @retry()
+    async def __getReadyCheckStatus(self):
         res = await self.__get("/lol-matchmaking/v1/ready-check")
 
         return await res.json()
@@ -1167,8 +1596,21 @@ class LolClientConnector(QObject):
         return res
 
     async def getSummonerGamesByPuuidViaSGP(self, puuid, begIdx, endIdx):
+        """
+        和 `self.getSummonerGamesByPuuid()` 一样经过 `self.matchHistory`
+
+        @return: {'games': [...]}
+        """
+        games = await self.matchHistory.getGames(
+            self.server, "sgp", puuid, begIdx, endIdx,
+            lambda beg, end: self.__getSummonerGamesByPuuidViaSGP(puuid, beg, end),
+            lambda game: game['json']['gameId'])
+
+        return {'games': games}
+
+    async def __getSummonerGamesByPuuidViaSGP(self, puuid, begIdx, endIdx):
         logger.debug(
-            f"getSummonerGamesByPuuidViaSGP called, {puuid = }", TAG)
+            f"getSummonerGamesByPuuidViaSGP called, {puuid = }, [{begIdx}-{endIdx}]", TAG)
 
         url = f"/match-history-query/v1/products/lol/player/{puuid}/SUMMARY"
         params = {
@@ -1177,7 +1619,13 @@ class LolClientConnector(QObject):
         }
 
         res = await self.__sgp__get(url, params)
-        return await res.json()
+        res = await res.json()
+
+        if "games" not in res:
+            raise SummonerGamesNotFound()
+
+        # 只留解析战绩用得到的字段, 原始数据一局就有十几 KB
+        return [slimSGPGame(game, puuid) for game in res["games"]]
 
     async def getSummonerGamingInfoByPuuidViaSgp(self, puuid):
         logger.debug(
@@ -1188,6 +1636,10 @@ class LolClientConnector(QObject):
         return await res.json()
 
     async def getRankedStatsByPuuidViaSGP(self, puuid):
+        return await self.__cachedProfile(
+            "sgpRanked", puuid, self.__getRankedStatsByPuuidViaSGP)
+
+    async def __getRankedStatsByPuuidViaSGP(self, puuid):
         logger.debug(
             f"getRankedStatsByPuuidViaSGP called, {puuid = }", TAG)
 
@@ -1205,6 +1657,10 @@ class LolClientConnector(QObject):
         该接口的返回值与 `self.getSummonerByPuuid()` 相比，拿不到召唤师的 `tagLine`
         即数字编号信息
         """
+        return await self.__cachedProfile(
+            "sgpSummoner", puuid, self.__getSummonerByPuuidViaSGP)
+
+    async def __getSummonerByPuuidViaSGP(self, puuid):
         logger.debug(
             f"getSummonerByPuuidViaSGP called, {puuid = }", TAG)
 
@@ -1213,38 +1669,128 @@ class LolClientConnector(QObject):
         res = await self.__sgp__get(url)
         return await res.json()
 
+    async def __cachedProfile(self, kind, puuid, fetch):
+        """
+        召唤师信息 / 段位这类数据先查 `self.profileCache`, 没有再调用 `fetch(puuid)`
+
+        抛异常或者返回了 `errorCode` 的结果不会被缓存
+        """
+        key = (self.server, kind, puuid)
+
+        res = self.profileCache.get(key)
+        if res is not None:
+            return res
+
+        res = await fetch(puuid)
+
+        if not (isinstance(res, dict) and "errorCode" in res):
+            self.profileCache.put(key, res)
+
+        return res
+
+    def invalidateProfileCache(self, puuid=None):
+        """
+        使召唤师信息与段位缓存失效
+
+        @param puuid: 只清掉这个人的, 为 `None` 时全部清掉
+        """
+        if puuid is None:
+            self.profileCache.clear()
+        else:
+            self.profileCache.invalidate(lambda key: key[2] == puuid)
+
     def isInTencent(self):
         return self.inTencent
 
     @needLcu()
     async def __get(self, path, params=None):
-        return await self.lcuSess.get(path, params=params, ssl=False)
+        key = ("lcu", path, self.__paramsKey(params))
+        res = await self.singleFlight.do(key, lambda: self.__doGet(path, params))
+
+        # 在调用方自己的上下文里记, 合并掉的调用方也能拿到
+        recordResponseStatus(res.status)
+        return res
+
+    async def __doGet(self, path, params=None):
+        res = await self.__request("GET", path, params=params)
+
+        self.__checkRateLimited(res)
+        return res
 
     @needLcu()
     async def __post(self, path, data=None):
         headers = {"Content-type": "application/json"}
-        return await self.lcuSess.post(path, json=data, headers=headers, ssl=False)
+        return await self.__request("POST", path, json=data, headers=headers)
 
     @needLcu()
     async def __put(self, path, data=None):
-        return await self.lcuSess.put(path, json=data, ssl=False)
+        return await self.__request("PUT", path, json=data)
 
     @needLcu()
     async def __delete(self, path):
-        return await self.lcuSess.delete(path, ssl=False)
+        return await self.__request("DELETE", path)
 
     @needLcu()
     async def __patch(self, path, data=None):
-        return await self.lcuSess.patch(path, json=data, ssl=False)
+        return await self.__request("PATCH", path, json=data)
+
+    async def __request(self, method, path, **kwargs):
+        with apiMetrics.measure("lcu", method, path) as m, \
+                tracer.span(f"{method} {path}", "lcu"):
+            async with self.scheduler.slot():
+                m.acquired()
+                res = await self.lcuSess.request(method, path, **kwargs)
+
+                # 先把 body 读进来, 合并掉的调用方拿到的是同一个 response
+                body = await res.read()
+
+            m.done(res, len(body))
+
+        recordResponseStatus(res.status)
+        return res
 
     async def __sgp__get(self, path, params=None):
         assert self.inTencent
 
+        key = ("sgp", path, self.__paramsKey(params))
+        res = await self.singleFlight.do(key, lambda: self.__doSgpGet(path, params))
+
+        recordResponseStatus(res.status)
+        return res
+
+    async def __doSgpGet(self, path, params=None):
         headers = {
             "Authorization": f"Bearer {self.sgpToken}"
         }
 
-        return await self.sgpSess.get(path, params=params, ssl=False, headers=headers)
+        with apiMetrics.measure("sgp", "GET", path) as m, \
+                tracer.span(f"GET {path}", "sgp"):
+            res = await self.sgpSess.get(path, params=params, headers=headers)
+            body = await res.read()
+
+            m.done(res, len(body))
+
+        self.__checkRateLimited(res)
+        return res
+
+    @staticmethod
+    def __checkRateLimited(res: aiohttp.ClientResponse):
+        if res.status != 429:
+            return
+
+        try:
+            retryAfter = float(res.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            retryAfter = None
+
+        raise RequestRateLimited(retryAfter)
+
+    @staticmethod
+    def __paramsKey(params):
+        if not params:
+            return None
+
+        return tuple(sorted(params.items()))
 
     def getLoginSummonerByPid(self, pid):
         port, token, _ = getPortTokenServerByPid(pid)
@@ -1319,6 +1865,19 @@ class JsonManager:
             item['id']: item
             for item in augments}
 
+    def toSnapshot(self) -> dict:
+        """
+        导出处理好的数据, 用于保存本地快照 (@see `GameDataSnapshot`)
+        """
+        return dict(self.__dict__)
+
+    @classmethod
+    def fromSnapshot(cls, snapshot: dict):
+        manager = cls.__new__(cls)
+        manager.__dict__.update(snapshot)
+
+        return manager
+
     def getItemIconPath(self, iconId):
         if iconId != 0:
             try:
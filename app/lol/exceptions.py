@@ -16,3 +16,11 @@ class SummonerNotInGame(BaseException):
 
 class RetryMaximumAttempts(BaseException):
     pass
+
+
+class RequestRateLimited(BaseException):
+    def __init__(self, retryAfter=None):
+        super().__init__(f"HTTP 429, retry after {retryAfter}")
+
+        # 服务端给的 Retry-After (秒), 没给就是 None
+        self.retryAfter = retryAfter
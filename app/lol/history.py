@@ -0,0 +1,243 @@
+import asyncio
+import time
+
+from app.lol.cache import TTLCache
+
+# SGP 战绩里 `app/lol/tools.py` 用到的字段, 其余的不进索引
+SGP_GAME_FIELDS = ('gameCreation', 'gameDuration', 'gameId', 'mapId', 'queueId')
+
+# 每个玩家: 查队友 (`getTeammatesFromSGPGame`) 用到的
+SGP_PLAYER_FIELDS = (
+    'puuid', 'summonerId', 'summonerName', 'riotIdGameName', 'riotIdTagline',
+    'profileIcon', 'championId', 'teamId', 'subteamPlacement', 'win',
+    'teamEarlySurrendered',
+)
+
+# 本人: 另外加上解析这一局 (`makeGameDataFromSGP`) 用到的
+SGP_OWNER_FIELDS = SGP_PLAYER_FIELDS + (
+    'champLevel', 'kills', 'deaths', 'assists', 'spell1Id', 'spell2Id',
+    'item0', 'item1', 'item2', 'item3', 'item4', 'item5', 'item6',
+    'totalMinionsKilled', 'neutralMinionsKilled', 'goldEarned',
+    'gameEndedInEarlySurrender', 'lane', 'role',
+)
+
+
+def slimSGPGame(game, puuid):
+    """
+    把 SGP 战绩里的一局裁剪成只有 `puuid` 这个人的战绩页用得到的字段
+
+    @return: 结构和原来一样的 {'json': {...}}, 缺的字段仍然缺
+    """
+    json = game['json']
+    participants = []
+
+    for player in json['participants']:
+        owner = player['puuid'] == puuid
+        fields = SGP_OWNER_FIELDS if owner else SGP_PLAYER_FIELDS
+        slim = {key: player[key] for key in fields if key in player}
+
+        if owner:
+            perk = player['perks']['styles'][0]['selections'][0]['perk']
+            slim['perks'] = {'styles': [{'selections': [{'perk': perk}]}]}
+
+        participants.append(slim)
+
+    res = {key: json[key] for key in SGP_GAME_FIELDS if key in json}
+    res['participants'] = participants
+
+    return {'json': res}
+
+
+class MatchHistoryIndex:
+    """
+    每个人的本地战绩索引, 以 (server, source, puuid) 为键
+
+    索引是一个从新到旧排好的对局概要列表, 和接口返回的前若干局一一对应;
+    再次查询同一个人时只拉比本地最新一局更新的对局, 碰到本地已有的 gameId 就停,
+    剩下的直接从本地读. 组队开黑反复查同一批人的时候基本不用再请求
+
+    - 只索引最近 `maxGames` 局, 更靠后的窗口直接请求, 不经过索引
+    - `fresh` 秒内同一个人的索引视为最新, 连头部都不用再查
+    - 内存里放最近用过的一批, 同时落盘到 `MatchHistoryStorage`;
+      从磁盘读回来的索引一定会先查一次头部
+    - SGP 战绩在进索引之前由 `slimSGPGame()` 裁剪过, 只留解析用得到的字段
+    """
+
+    def __init__(self, storage, maxGames=100, fresh=30., headPage=5, pageSize=20):
+        self.storage = storage
+        self.maxGames = maxGames
+        self.fresh = fresh
+        self.headPage = headPage
+        self.pageSize = pageSize
+
+        # key -> {'games': [...], 'complete': bool, 'syncedAt': float}
+        self.records = TTLCache(ttl=1800., maxSize=256)
+
+        # 同一个人同时只同步一次, 避免英雄选择与生涯界面同时查时重复拉取
+        self.locks = {}
+
+        self.headSyncs = 0
+        self.resets = 0
+        self.fetchedGames = 0
+        self.servedGames = 0
+
+    async def getGames(self, server, source, puuid, begIndex, endIndex, fetch, gameIdOf):
+        """
+        取第 `begIndex` 到 `endIndex` 局 (闭区间, 0 为最近一局)
+
+        @param fetch: `await fetch(begIndex, endIndex)`, 请求接口, 返回对局列表
+        @param gameIdOf: `gameIdOf(game)`, 取一局的 gameId
+        @return: 对局列表, 是新的 list, 调用方可以随意增删
+        """
+        if endIndex >= self.maxGames:
+            games = await fetch(begIndex, endIndex)
+            self.fetchedGames += len(games)
+            self.servedGames += len(games)
+
+            return games
+
+        key = ((server or "").lower(), source, puuid)
+
+        # [lock, 持有和等待的调用数], 没人用了就删掉, 不然查过的人越多锁越多
+        entry = self.locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+
+        try:
+            async with entry[0]:
+                return await self.__getGames(key, begIndex, endIndex, fetch, gameIdOf)
+        finally:
+            entry[1] -= 1
+
+            if entry[1] == 0:
+                del self.locks[key]
+
+    async def __getGames(self, key, begIndex, endIndex, fetch, gameIdOf):
+        record = await self.__load(key)
+        changed = False
+
+        stale = time.time() - record['syncedAt'] >= self.fresh
+
+        if (record['games'] or record['complete']) and stale:
+            games, complete = await self.__syncHead(record, endIndex, fetch, gameIdOf)
+            changed = games is not record['games']
+
+            record['games'], record['complete'] = games, complete
+
+        games = record['games']
+
+        if len(games) <= endIndex and not record['complete']:
+            changed = await self.__fetchTail(record, endIndex, fetch, gameIdOf) or changed
+
+        record['syncedAt'] = time.time()
+
+        games = games[begIndex:endIndex + 1]
+        self.servedGames += len(games)
+
+        if changed:
+            await self.__save(key, record)
+
+        return games
+
+    async def __syncHead(self, record, endIndex, fetch, gameIdOf):
+        """
+        从最近一局往后拉, 直到碰上本地已有的对局
+
+        @return: (新的对局列表, 是否已经到了战绩末尾);
+                 没有新对局时返回的就是 `record['games']` 本身
+        """
+        self.headSyncs += 1
+
+        games = record['games']
+        known = {gameIdOf(game): i for i, game in enumerate(games)}
+
+        new = []
+        begIndex, size = 0, self.headPage
+
+        while True:
+            rows = await fetch(begIndex, begIndex + size - 1)
+            self.fetchedGames += len(rows)
+
+            for row in rows:
+                i = known.get(gameIdOf(row))
+
+                if i is not None:
+                    if not new and i == 0:
+                        return games, record['complete']
+
+                    return (new + games[i:])[:self.maxGames], record['complete']
+
+                new.append(row)
+
+            if len(rows) < size:
+                return new, True
+
+            # 新对局已经够这次用了还没接上, 说明中间断档了, 旧索引作废
+            if len(new) > endIndex:
+                self.resets += 1
+                return new[:self.maxGames], False
+
+            begIndex += size
+            size = self.pageSize
+
+    async def __fetchTail(self, record, endIndex, fetch, gameIdOf):
+        """
+        本地不够 `endIndex` 局时, 把缺的部分补上
+
+        @return: 有没有补到新对局
+        """
+        games = record['games']
+        begIndex = len(games)
+
+        rows = await fetch(begIndex, endIndex)
+        self.fetchedGames += len(rows)
+
+        if len(rows) < endIndex - begIndex + 1:
+            record['complete'] = True
+
+        known = {gameIdOf(game) for game in games}
+        rows = [row for row in rows if gameIdOf(row) not in known]
+
+        games.extend(rows[:self.maxGames - len(games)])
+
+        return bool(rows)
+
+    async def __load(self, key):
+        record = self.records.get(key)
+
+        if record is None:
+            record = await self.storage.get(*key) or {'games': [], 'complete': False}
+
+            # 磁盘上的不知道多久以前的了, 先查一次头部
+            record['syncedAt'] = 0.
+            self.records.put(key, record)
+
+        return record
+
+    async def __save(self, key, record):
+        self.records.put(key, record)
+
+        # 编码在线程池里做, 给它一份拷贝, 免得和之后对 record 的修改撞上
+        await self.storage.put(*key, {
+            'games': list(record['games']),
+            'complete': record['complete'],
+        })
+
+    def invalidate(self, puuid=None):
+        """
+        让索引下次使用时重新查一次头部, 本地已有的对局不会丢
+
+        @param puuid: 只处理这个人的, 为 `None` 时全部处理
+        """
+        if puuid is None:
+            self.records.clear()
+        else:
+            self.records.invalidate(lambda key: key[2] == puuid)
+
+    def getStats(self):
+        return {
+            'records': len(self.records.data),
+            'headSyncs': self.headSyncs,
+            'resets': self.resets,
+            'fetchedGames': self.fetchedGames,
+            'servedGames': self.servedGames,
+        }
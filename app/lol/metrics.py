@@ -0,0 +1,275 @@
+import re
+import time
+import threading
+
+import aiohttp
+
+from app.common.decoder import decoder
+
+
+class Histogram:
+    """
+    固定分桶的耗时直方图, 单位为毫秒
+    """
+
+    BOUNDS = [1, 2, 5, 10, 20, 50, 100, 200, 500,
+              1000, 2000, 5000, 10000, float('inf')]
+
+    def __init__(self):
+        self.buckets = [0] * len(self.BOUNDS)
+        self.count = 0
+        self.sum = 0.
+        self.max = 0.
+
+    def add(self, ms):
+        for i, bound in enumerate(self.BOUNDS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                break
+
+        self.count += 1
+        self.sum += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, p):
+        """
+        @param p: 0 ~ 100
+        @return: 第 p 百分位所在桶的上界 (最后一个桶返回实际最大值)
+        """
+        if self.count == 0:
+            return 0.
+
+        target = self.count * p / 100
+        acc = 0
+
+        for bound, n in zip(self.BOUNDS, self.buckets):
+            acc += n
+
+            if acc >= target:
+                return min(bound, self.max)
+
+        return self.max
+
+    def getStats(self):
+        return {
+            'count': self.count,
+            'avg': self.sum / self.count if self.count else 0.,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
+
+
+class EndpointStats:
+    def __init__(self):
+        self.latency = Histogram()
+        self.wait = Histogram()
+        self.decode = Histogram()
+
+        self.bytes = 0
+        self.errors = {}
+
+    def getStats(self):
+        return {
+            'latency': self.latency.getStats(),
+            'wait': self.wait.getStats(),
+            'decode': self.decode.getStats(),
+            'bytes': self.bytes,
+            'errors': dict(self.errors),
+        }
+
+
+class Measure:
+    """
+    一次请求的计时, 由 `ApiMetrics.measure()` 创建
+
+        with apiMetrics.measure("lcu", "GET", path) as m:
+            async with scheduler.slot():
+                m.acquired()
+                res = await sess.get(path)
+                body = await res.read()
+
+            m.done(res, len(body))
+    """
+
+    def __init__(self, metrics, source, method, path):
+        self.metrics = metrics
+        self.source = source
+        self.method = method
+        self.path = path
+
+        self.start = 0.
+        self.acquiredAt = None
+        self.status = None
+        self.size = 0
+
+    def acquired(self):
+        self.acquiredAt = time.perf_counter()
+
+    def done(self, res: aiohttp.ClientResponse, size=0):
+        self.status = res.status
+        self.size = size
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, ty, value, tb):
+        end = time.perf_counter()
+        acquiredAt = self.acquiredAt or self.start
+
+        if ty is not None:
+            error = ty.__name__
+        elif self.status is not None and self.status >= 400:
+            error = str(self.status)
+        else:
+            error = None
+
+        self.metrics.record(self.source, self.method, self.path,
+                            (acquiredAt - self.start) * 1000,
+                            (end - acquiredAt) * 1000,
+                            self.size, error)
+
+        return False
+
+
+class ApiMetrics:
+    """
+    LCU / SGP 请求的统计数据, 按 (来源, 方法, 接口) 聚合
+
+    - latency: 从拿到信号量到读完 body 的耗时
+    - wait: 排队等信号量的耗时
+    - decode: `res.json()` 的耗时
+    - bytes: 收到的 body 总大小
+    - errors: 按异常类型 / HTTP 状态码计数
+
+    重试次数见 `connector.retryStats`, 每一次重试也会作为一次请求被记录在这里
+    """
+
+    # 接口路径里的 puuid、gameId 之类替换成占位符, 防止同一个接口被拆成成千上万条
+    UUID = re.compile(
+        r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+    NUMBER = re.compile(r"(?<=/)\d+(?=/|$)")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.endpoints = {}
+
+    @classmethod
+    def normalize(cls, path):
+        path = path.split("?", 1)[0]
+        path = cls.UUID.sub("{uuid}", path)
+
+        return cls.NUMBER.sub("{id}", path)
+
+    def __getEndpoint(self, source, method, path) -> EndpointStats:
+        key = (source, method, self.normalize(path))
+        item = self.endpoints.get(key)
+
+        if item is None:
+            item = self.endpoints[key] = EndpointStats()
+
+        return item
+
+    def measure(self, source, method, path):
+        return Measure(self, source, method, path)
+
+    def record(self, source, method, path, waitMs, latencyMs, size, error=None):
+        with self.lock:
+            item = self.__getEndpoint(source, method, path)
+            item.wait.add(waitMs)
+            item.latency.add(latencyMs)
+            item.bytes += size
+
+            if error is not None:
+                item.errors[error] = item.errors.get(error, 0) + 1
+
+    def recordDecode(self, source, method, path, decodeMs):
+        with self.lock:
+            self.__getEndpoint(source, method, path).decode.add(decodeMs)
+
+    def responseClass(self, source):
+        """
+        给 `aiohttp.ClientSession(response_class=...)` 用, 记录 `json()` 的耗时,
+        并默认使用 `decoder` 解码
+        """
+        metrics = self
+
+        class TimedResponse(aiohttp.ClientResponse):
+            async def json(self, *args, **kwargs):
+                kwargs.setdefault('loads', decoder.loads)
+                start = time.perf_counter()
+
+                try:
+                    return await super().json(*args, **kwargs)
+                finally:
+                    metrics.recordDecode(source, self.method, self.url.path,
+                                         (time.perf_counter() - start) * 1000)
+
+        return TimedResponse
+
+    def getStats(self):
+        """
+        @return: {(source, method, endpoint): {...}}
+        """
+        with self.lock:
+            return {key: item.getStats() for key, item in self.endpoints.items()}
+
+    def reset(self):
+        with self.lock:
+            self.endpoints.clear()
+
+    def dump(self, retryStats=None, singleFlightStats=None):
+        """
+        把统计数据格式化成便于阅读的文本, 按总耗时从高到低排序
+
+        @param retryStats: `RetryStats.getStats()`
+        @param singleFlightStats: {name: `SingleFlight.getStats()`}
+        """
+        stats = self.getStats()
+        rows = sorted(stats.items(),
+                      key=lambda kv: kv[1]['latency']['avg'] * kv[1]['latency']['count'],
+                      reverse=True)
+
+        lines = [
+            f"{'source':<6} {'method':<6} {'count':>6} {'avg':>8} {'p50':>7} {'p90':>7} "
+            f"{'p99':>7} {'max':>8} {'wait':>8} {'decode':>8} {'KB':>8}  errors  endpoint"
+        ]
+
+        for (source, method, endpoint), item in rows:
+            latency = item['latency']
+
+            lines.append(
+                f"{source:<6} {method:<6} {latency['count']:>6} {latency['avg']:>8.1f} "
+                f"{latency['p50']:>7.0f} {latency['p90']:>7.0f} {latency['p99']:>7.0f} "
+                f"{latency['max']:>8.1f} {item['wait']['avg']:>8.1f} "
+                f"{item['decode']['avg']:>8.2f} {item['bytes'] / 1024:>8.1f}  "
+                f"{item['errors'] or '-'}  {endpoint}")
+
+        if retryStats:
+            lines.append("")
+            lines.append("retries:")
+
+            for name, item in sorted(retryStats.items()):
+                if item['retries'] or item['failed']:
+                    lines.append(
+                        f"  {name}: calls={item['calls']} retries={item['retries']} "
+                        f"waited={item['waited']:.2f}s failed={item['failed']}")
+
+        if singleFlightStats:
+            lines.append("")
+            lines.append("single flight:")
+
+            for name, item in singleFlightStats.items():
+                calls = item['total'] + item['coalesced']
+                ratio = item['coalesced'] / calls if calls else 0
+
+                lines.append(
+                    f"  {name}: total={item['total']} coalesced={item['coalesced']} "
+                    f"({ratio:.1%}) inFlight={item['inFlight']}")
+
+        return "\n".join(lines)
+
+
+apiMetrics = ApiMetrics()
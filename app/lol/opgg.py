@@ -1,8 +1,9 @@
-import aiohttp
 from async_lru import alru_cache
 
 from app.lol.connector import connector
 from app.common.config import cfg
+from app.common.session import sessionFactory
+from app.common.decoder import decoder
 
 TAG = "opgg"
 
@@ -16,15 +17,19 @@ class Opgg:
             self.proxy = f"http://{cfg.get(cfg.opggProxyAddr)}"
 
     async def start(self):
-        self.session = aiohttp.ClientSession("https://lol-api-champion.op.gg")
+        if self.session and not self.session.closed:
+            return
+
+        self.session = sessionFactory.create(
+            "opgg", base_url="https://lol-api-champion.op.gg")
 
     async def close(self):
         if self.session:
             await self.session.close()
 
     async def __get(self, url, params=None):
-        res = await self.session.get(url, params=params, ssl=False, proxy=self.proxy)
-        return await res.json()
+        res = await self.session.get(url, params=params, proxy=self.proxy)
+        return await res.json(loads=decoder.loads)
 
     @alru_cache(maxsize=512)
     async def __fetchTierList(self, region, mode, tier):
@@ -0,0 +1,60 @@
+import json
+import time
+
+# 录制文件格式:
+#   第一行是 JSON 头, 如 {"version": 1, "startedAt": 1700000000.0}
+#   之后每行一帧: "<相对开始的秒数>\t<websocket 收到的原始文本>"
+VERSION = 1
+
+
+class WsRecorder:
+    """
+    把 LCU websocket 收到的原始帧连同时间戳写到文件里, 供 benchmark/ws_replay.py 回放
+
+    只做追加写, 不解析内容, 对收消息的路径影响很小
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "w", encoding="utf-8")
+        self.start = time.perf_counter()
+        self.frames = 0
+
+        header = {'version': VERSION, 'startedAt': time.time()}
+        self.file.write(json.dumps(header) + "\n")
+
+    def write(self, raw: str):
+        # JSON 字符串里不会有真正的换行, 出现在 token 之间的换行换成空格不影响内容
+        if "\n" in raw:
+            raw = raw.replace("\n", " ")
+
+        self.file.write(f"{time.perf_counter() - self.start:.6f}\t{raw}\n")
+        self.frames += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+def loadRecording(path):
+    """
+    @return: (头部信息, [(相对时间, 原始文本), ...])
+    """
+    frames = []
+
+    with open(path, encoding="utf-8") as f:
+        header = json.loads(f.readline())
+
+        if header.get('version') != VERSION:
+            raise ValueError(f"unsupported recording version: {header}")
+
+        for line in f:
+            line = line.rstrip("\n")
+
+            if not line:
+                continue
+
+            t, raw = line.split("\t", 1)
+            frames.append((float(t), raw))
+
+    return header, frames
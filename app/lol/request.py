@@ -0,0 +1,605 @@
+import asyncio
+import contextvars
+import random
+import time
+import weakref
+from collections import deque
+from contextlib import suppress
+
+import aiohttp
+
+from app.lol.exceptions import RequestRateLimited, SummonerNotFound
+from app.lol.metrics import Histogram
+
+
+async def gatherWithLimit(limit, coros):
+    """
+    和 `asyncio.gather` 一样, 但同时最多只跑 `limit` 个
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*[run(coro) for coro in coros])
+
+
+async def gatherByKind(jobs, kinds=()):
+    """
+    并发跑一批以 (kind, key) 为键的查询, 再按 kind 分组
+
+    并发数不在这里限制, connector 里的请求都会经过 `PriorityScheduler` 排队
+
+    @param jobs: {(kind, key): coro}
+    @param kinds: 即使没有任何查询也要出现在结果里的 kind
+    @return: {kind: {key: result}}
+    """
+    results = await asyncio.gather(*jobs.values())
+    res = {kind: {} for kind in kinds}
+
+    for (kind, key), result in zip(jobs, results):
+        res.setdefault(kind, {})[key] = result
+
+    return res
+
+
+class TaskScope:
+    """
+    绑定在一个查看目标 (如搜索、生涯界面正在看的人) 上的一组 task
+
+    换目标时调用 `cancel()`, 这个人还在跑的请求与解析全部立即取消;
+    在 connector 里排队的请求会一起撤掉 (`PriorityScheduler` 与 `SingleFlight`
+    都会处理取消), 不用再在各处轮询比较 puuid
+
+        self.scope.cancel()
+        info = await self.scope.run(self.__load(puuid))
+        if info is None:    # 加载途中又换了目标
+            return
+    """
+
+    def __init__(self):
+        self.tasks = set()
+
+        # 被 `cancel()` 取消的 task, 用来和调用方自己被取消区分开
+        self.cancelledTasks = weakref.WeakSet()
+
+        self.cancelled = 0
+
+    def spawn(self, coro):
+        """
+        在 scope 里起一个 task, 不等它结束, 用法和 `asyncio.create_task()` 一样
+        """
+        task = asyncio.ensure_future(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+        return task
+
+    async def run(self, coro, default=None):
+        """
+        在 scope 里跑 `coro` 并等它结束
+
+        @return: `coro` 的返回值; 被 `cancel()` 取消时返回 `default`
+        """
+        task = asyncio.ensure_future(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if task in self.cancelledTasks:
+                return default
+
+            raise
+
+    def cancel(self):
+        """
+        取消 scope 里所有还没结束的 task
+
+        @return: 取消的个数
+        """
+        tasks = [task for task in self.tasks if not task.done()]
+
+        for task in tasks:
+            self.cancelledTasks.add(task)
+            task.cancel()
+
+        self.tasks.clear()
+        self.cancelled += len(tasks)
+
+        return len(tasks)
+
+
+# 请求优先级, 数字越小越优先
+CRITICAL = 0        # 英雄选择、接受对局这类有时限的
+INTERACTIVE = 1     # 用户点击触发的, 默认
+BACKGROUND = 2      # 后台预加载, 如翻页战绩、资源预下载
+
+PRIORITY_NAMES = ("critical", "interactive", "background")
+
+
+class _Priority:
+    """
+    `requestPriority` 设置的优先级
+
+    在它下面起的 task 共用同一个对象; `SingleFlight` 合并到更高优先级的调用时
+    会通过 `promote()` 把它提上去, 已经在 `PriorityScheduler` 里排队的请求一起挪到前面
+    """
+    __slots__ = ('value', 'queued')
+
+    def __init__(self, value):
+        self.value = value
+
+        # 正在排队的 (scheduler, waiter)
+        self.queued = set()
+
+    def promote(self, priority):
+        if priority >= self.value:
+            return
+
+        self.value = priority
+
+        for scheduler, waiter in list(self.queued):
+            scheduler.promote(waiter, priority)
+
+
+_priority = contextvars.ContextVar("requestPriority", default=_Priority(INTERACTIVE))
+
+
+class requestPriority:
+    """
+    在这个上下文里发出的请求都使用 `priority` 优先级
+
+        with requestPriority(BACKGROUND):
+            await connector.getSummonerGamesByPuuidSlowly(...)
+
+    基于 contextvars, 在里面 `asyncio.create_task()` 出去的 task 也会继承
+    """
+
+    def __init__(self, priority):
+        self.priority = priority
+        self.token = None
+
+    def __enter__(self):
+        self.token = _priority.set(_Priority(self.priority))
+        return self
+
+    def __exit__(self, ty, value, tb):
+        _priority.reset(self.token)
+        return False
+
+
+def currentPriority():
+    return _priority.get().value
+
+
+class _Waiter:
+    __slots__ = ('future', 'priority', 'enqueuedAt')
+
+    def __init__(self, future, priority):
+        self.future = future
+        self.priority = priority
+        self.enqueuedAt = time.perf_counter()
+
+
+class _ClassStats:
+    def __init__(self):
+        self.running = 0
+        self.granted = 0
+        self.maxDepth = 0
+        self.wait = Histogram()
+
+
+class _Slot:
+    def __init__(self, scheduler, priority, box=None):
+        self.scheduler = scheduler
+        self.priority = priority
+        self.box = box
+
+    async def __aenter__(self):
+        # 排队期间可能被提高了优先级, 释放时要还给实际占用的那一级
+        self.priority = await self.scheduler.acquire(self.priority, self.box)
+        return self
+
+    async def __aexit__(self, ty, value, tb):
+        self.scheduler.release(self.priority)
+        return False
+
+
+class PriorityScheduler:
+    """
+    按优先级调度请求, 代替原来所有请求共用的一个信号量
+
+    - 同时最多 `limit` 个请求; 每个优先级另有自己的并发上限,
+      后台请求最多占一半, 留出位置给界面上的请求
+    - 有空位时先放行优先级高的, 同一优先级内先来先服务;
+      排着队的低优先级请求会被之后来的高优先级请求插队
+    - `CRITICAL` 额外多一个位置, 不会因为前面正在跑的慢请求而错过时限
+
+        async with scheduler.slot():
+            ...
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.classLimits = (limit + 1, limit, max(1, limit // 2))
+
+        self.running = 0
+        self.queues = tuple(deque() for _ in PRIORITY_NAMES)
+        self.stats = tuple(_ClassStats() for _ in PRIORITY_NAMES)
+
+    def slot(self, priority=None):
+        """
+        @param priority: 为 `None` 时使用 `requestPriority` 设置的优先级,
+                         排队期间该优先级被提高时会跟着往前挪
+        """
+        if priority is not None:
+            return _Slot(self, priority)
+
+        box = _priority.get()
+        return _Slot(self, box.value, box)
+
+    def __canRun(self, priority):
+        limit = self.limit + 1 if priority == CRITICAL else self.limit
+
+        return (self.running < limit
+                and self.stats[priority].running < self.classLimits[priority])
+
+    def __grant(self, priority, waited):
+        stats = self.stats[priority]
+        stats.running += 1
+        stats.granted += 1
+        stats.wait.add(waited * 1000)
+
+        self.running += 1
+
+    async def acquire(self, priority, box=None):
+        """
+        @param box: 排队时登记到这个 `_Priority` 上, 它被提高时跟着往前挪
+        @return: 实际占用位置的优先级, 释放时传给 `release()`
+        """
+        ahead = any(self.queues[p] for p in range(priority + 1))
+
+        if not ahead and self.__canRun(priority):
+            self.__grant(priority, 0.)
+            return priority
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), priority)
+        queue = self.queues[priority]
+        queue.append(waiter)
+
+        stats = self.stats[priority]
+        stats.maxDepth = max(stats.maxDepth, len(queue))
+
+        if box is not None:
+            box.queued.add((self, waiter))
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 已经分到位置了才被取消, 把位置还回去
+                self.release(waiter.priority)
+            else:
+                # 可能已经被 `__wakeUp()` 当作取消了的弹出队列
+                with suppress(ValueError):
+                    self.queues[waiter.priority].remove(waiter)
+
+            raise
+        finally:
+            if box is not None:
+                box.queued.discard((self, waiter))
+
+        return waiter.priority
+
+    def promote(self, waiter: _Waiter, priority):
+        """
+        把还在排队的 `waiter` 挪到 `priority` 的队尾
+        """
+        if waiter.future.done() or priority >= waiter.priority:
+            return
+
+        with suppress(ValueError):
+            self.queues[waiter.priority].remove(waiter)
+
+        waiter.priority = priority
+        self.queues[priority].append(waiter)
+
+        self.__wakeUp()
+
+    def release(self, priority):
+        self.stats[priority].running -= 1
+        self.running -= 1
+
+        self.__wakeUp()
+
+    def __wakeUp(self):
+        now = time.perf_counter()
+
+        for priority, queue in enumerate(self.queues):
+            while queue and self.__canRun(priority):
+                waiter = queue.popleft()
+
+                if waiter.future.done():
+                    continue
+
+                self.__grant(priority, now - waiter.enqueuedAt)
+                waiter.future.set_result(None)
+
+            # 高优先级还有人在排队时, 不放行低优先级的
+            if queue:
+                break
+
+    def isBusy(self):
+        """
+        @return: 有请求在排队
+        """
+        return any(self.queues)
+
+    def getStats(self):
+        return {
+            name: {
+                'queued': len(queue),
+                'maxQueued': stats.maxDepth,
+                'running': stats.running,
+                'granted': stats.granted,
+                'waitMs': stats.wait.getStats(),
+            } for name, queue, stats in zip(PRIORITY_NAMES, self.queues, self.stats)
+        }
+
+
+class _Call:
+    def __init__(self, task: asyncio.Task, box: _Priority = None):
+        self.task = task
+        self.box = box
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    并发请求合并 (single-flight)
+
+    相同 key 的调用在前一个还没返回时会共享同一个 task, 不会重复发请求;
+    所有调用方都被 cancel 之后, 共享的 task 才会被 cancel
+
+    共享的 task 使用第一个调用方的 `requestPriority`, 所以默认只合并同一优先级的调用,
+    否则英雄选择的请求可能会排在后台请求的队列里;
+    `byPriority=False` 时只按 key 合并, 有更高优先级的调用加入时把共享的 task 的优先级提上去
+    (如资源预下载与界面同时要同一个图标, 只下载一次)
+    """
+
+    def __init__(self, byPriority=True):
+        self.byPriority = byPriority
+        self.calls = {}
+
+        # 发起的真实请求数 / 被合并掉的调用数
+        self.total = 0
+        self.coalesced = 0
+
+    async def do(self, key, factory):
+        """
+        @param key: 可哈希的请求标识
+        @param factory: 无参数的协程函数, 只有在没有相同 key 的请求进行中时才会被调用
+        """
+        priority = currentPriority()
+
+        if self.byPriority:
+            key = (key, priority)
+
+        call: _Call = self.calls.get(key)
+
+        if call is None:
+            if self.byPriority:
+                call = _Call(asyncio.ensure_future(factory()))
+            else:
+                box = _Priority(priority)
+                call = _Call(asyncio.ensure_future(self.__run(box, factory)), box)
+
+            call.task.add_done_callback(
+                lambda t: self.__onDone(key, call, t))
+            self.calls[key] = call
+            self.total += 1
+        else:
+            self.coalesced += 1
+
+            if call.box is not None:
+                call.box.promote(priority)
+
+        call.waiters += 1
+
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+
+            # 最后一个等待者也走了 (被 cancel), 没必要再跑下去
+            if call.waiters == 0 and not call.task.done():
+                if self.calls.get(key) is call:
+                    del self.calls[key]
+
+                call.task.cancel()
+
+    @staticmethod
+    async def __run(box, factory):
+        # 在新 task 自己的 context 里, 不影响调用方
+        _priority.set(box)
+        return await factory()
+
+    def __onDone(self, key, call: _Call, task: asyncio.Task):
+        if self.calls.get(key) is call:
+            del self.calls[key]
+
+        # 标记异常已被取走, 防止没人等的时候 loop 报 "exception was never retrieved"
+        if not task.cancelled():
+            task.exception()
+
+    def getStats(self):
+        return {
+            'inFlight': len(self.calls),
+            'total': self.total,
+            'coalesced': self.coalesced,
+        }
+
+
+_responseStatus = contextvars.ContextVar("responseStatus", default=None)
+
+
+class responseStatus:
+    """
+    记录这个上下文里最后收到的 HTTP 状态码, 给 `@retry` 判断要不要重试
+
+    LCU 出错时不抛异常, 而是返回 4xx / 5xx 和 {'httpStatus', 'errorCode', ...} 的 body,
+    被装饰的函数一般到取字段时才失败 (KeyError 之类), 光看异常分不出来
+
+        with responseStatus() as last:
+            await func()
+        last.status
+    """
+
+    def __init__(self):
+        self.status = None
+        self.token = None
+
+    def __enter__(self):
+        self.token = _responseStatus.set(self)
+        return self
+
+    def __exit__(self, ty, value, tb):
+        _responseStatus.reset(self.token)
+        return False
+
+
+def recordResponseStatus(status):
+    """
+    收到响应时调用, 不在 `responseStatus` 里时什么也不做
+    """
+    recorder = _responseStatus.get()
+
+    if recorder is not None:
+        recorder.status = status
+
+
+def getErrorStatus(res):
+    """
+    @param res: LCU 返回的 json
+    @return: 出错时 body 里的 httpStatus, 正常的结果返回 `None`
+             (有部分成功的响应没有 httpStatus)
+    """
+    if type(res) is dict:
+        status = res.get("httpStatus")
+
+        if status and status != 200:
+            return status
+
+    return None
+
+
+class RetryPolicy:
+    """
+    重试策略: 指数退避 + 随机抖动
+
+    - 429: 优先使用服务端给的 Retry-After, 否则用更长的退避
+    - 连接被拒绝 (客户端还在启动): 正常指数退避
+    - 4xx 以及 `SummonerNotFound`: 不重试, 重试了也是一样的结果, 还会触发限流;
+      状态码来自 `aiohttp.ClientResponseError`, 或者调用方传进来的 (见 `responseStatus`)
+    - 单次调用所有退避时间之和不超过 `budget` 秒
+    """
+
+    def __init__(self, count=5, base=.1, cap=2., budget=5.):
+        self.count = count
+        self.base = base
+        self.cap = cap
+        self.budget = budget
+
+    def begin(self):
+        return RetryState(self)
+
+    def getDelay(self, attempt, exce, status=None):
+        """
+        @param attempt: 已经失败的次数 (从 1 开始)
+        @param status: 这次失败对应的 HTTP 状态码, 不知道时为 `None`
+        @return: 下一次重试前需要等待的秒数, 返回 `None` 表示不应再重试
+        """
+        if attempt >= self.count:
+            return None
+
+        if isinstance(exce, SummonerNotFound):
+            return None
+
+        if status is None and isinstance(exce, aiohttp.ClientResponseError):
+            status = exce.status
+
+        if status is not None and 400 <= status < 500 and status != 429:
+            return None
+
+        if isinstance(exce, RequestRateLimited):
+            if exce.retryAfter is not None:
+                return exce.retryAfter
+
+            delay = self.base * 4 * 2 ** (attempt - 1)
+        else:
+            delay = self.base * 2 ** (attempt - 1)
+
+        delay = min(self.cap, delay)
+
+        # 抖动一下, 防止一堆同时失败的请求又同时重试
+        return random.uniform(delay / 2, delay)
+
+
+class RetryState:
+    """
+    单次调用的重试状态
+    """
+
+    def __init__(self, policy: RetryPolicy):
+        self.policy = policy
+        self.retries = 0
+        self.waited = 0.
+
+    def next(self, exce, status=None):
+        """
+        @param status: @see RetryPolicy.getDelay
+        @return: 下一次重试前需要等待的秒数, 返回 `None` 表示放弃
+        """
+        delay = self.policy.getDelay(self.retries + 1, exce, status)
+
+        if delay is None or self.waited + delay > self.policy.budget:
+            return None
+
+        self.retries += 1
+        self.waited += delay
+
+        return delay
+
+
+class RetryStats:
+    """
+    按函数名统计重试次数与退避总时长, 用于排查问题
+    """
+
+    def __init__(self):
+        self.stats = {}
+
+    def record(self, name, state: RetryState, failed: bool):
+        item = self.stats.setdefault(name, {
+            'calls': 0,
+            'retries': 0,
+            'waited': 0.,
+            'failed': 0,
+        })
+
+        item['calls'] += 1
+        item['retries'] += state.retries
+        item['waited'] += state.waited
+        item['failed'] += failed
+
+    def getStats(self):
+        return {name: dict(item) for name, item in self.stats.items()}
+
+    def getTotal(self):
+        return {
+            'retries': sum(item['retries'] for item in self.stats.values()),
+            'waited': sum(item['waited'] for item in self.stats.values()),
+        }
@@ -0,0 +1,66 @@
+class ClientState:
+    """
+    LCU 部分资源的内存镜像, 以 uri 为键
+
+    - 连接客户端时请求一次填充, 之后由 websocket 推送保持最新
+    - 每个资源带一个版本号, 每次推送 (包括删除) 加一; 请求回来的数据只有在
+      请求期间没有收到推送时才会写入, 避免旧数据覆盖新数据
+    - 返回的是镜像里的对象本身, 调用方只读, 不要修改
+    """
+
+    def __init__(self):
+        self.resources = {}
+        self.versions = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def update(self, uri, data):
+        self.versions[uri] = self.versions.get(uri, 0) + 1
+        self.resources[uri] = data
+
+    def delete(self, uri):
+        self.versions[uri] = self.versions.get(uri, 0) + 1
+        self.resources.pop(uri, None)
+
+    def hydrate(self, uri, version, data):
+        """
+        写入请求回来的数据
+
+        @param version: 发请求之前的 `getVersion(uri)`
+        @return: 写入了返回 `True`, 期间已有推送时返回 `False`
+        """
+        if self.getVersion(uri) != version:
+            return False
+
+        self.resources[uri] = data
+
+        return True
+
+    def get(self, uri, default=None):
+        data = self.resources.get(uri)
+
+        if data is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+
+        return data
+
+    def getVersion(self, uri):
+        return self.versions.get(uri, 0)
+
+    def clear(self):
+        self.resources.clear()
+        self.versions.clear()
+
+    def getStats(self):
+        total = self.hits + self.misses
+
+        return {
+            'resources': len(self.resources),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hitRate': self.hits / total if total else 0.,
+        }
@@ -0,0 +1,319 @@
+import asyncio
+import json
+import os
+import pickle
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+from app.common.config import LOCAL_PATH
+from app.common.logger import logger
+
+TAG = "Storage"
+
+
+class SqliteBlobStore:
+    """
+    值为 zlib 压缩后的 JSON 的 SQLite 存储, 主键由 `keys` 指定的若干列组成
+
+    - 总条数超过 `maxCount` 时按最近访问时间淘汰 (LRU)
+    - 使用 `PRAGMA user_version` 记录表结构版本, 版本不一致时直接重建
+    - 数据库打不开 / 损坏时置为不可用, 之后所有操作直接退化为 miss
+    - 编解码与 SQLite 调用都放到线程池里跑, 不阻塞事件循环
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path, table, keys, maxCount):
+        """
+        @param keys: 主键列, 如 `(("server", "TEXT"), ("gameId", "INTEGER"))`
+        """
+        self.path = path
+        self.table = table
+        self.keys = keys
+        self.maxCount = maxCount
+
+        self.where = " AND ".join(f"{name} = ?" for name, _ in keys)
+
+        self.conn: sqlite3.Connection = None
+        self.lock = threading.Lock()
+
+        self.available = True
+
+    def __connect(self):
+        if self.conn is not None:
+            return self.conn
+
+        folder = os.path.dirname(self.path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, self.SCHEMA_VERSION):
+            logger.warning(
+                f"{self.table} storage schema {version} -> {self.SCHEMA_VERSION}, rebuild", TAG)
+            conn.execute(f"DROP TABLE IF EXISTS {self.table}")
+
+        columns = "".join(f"{name} {ty} NOT NULL, " for name, ty in self.keys)
+        primary = ", ".join(name for name, _ in self.keys)
+
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.table} (
+                {columns}
+                data BLOB NOT NULL,
+                lastAccess REAL NOT NULL,
+                PRIMARY KEY ({primary})
+            )
+        """)
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.table}_access ON {self.table} (lastAccess)")
+        conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+        conn.commit()
+
+        self.conn = conn
+        return conn
+
+    def __disable(self, e):
+        logger.exception(f"{self.table} storage disabled", e, TAG)
+        self.available = False
+
+        try:
+            self.conn.close()
+        except:
+            pass
+
+        self.conn = None
+
+    async def load(self, key: tuple):
+        """
+        @return: 存进去的值, 不存在时返回 `None`
+        """
+        if not self.available:
+            return None
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.__load, key)
+
+    async def save(self, key: tuple, value):
+        if not self.available:
+            return
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.__save, key, value)
+
+    async def remove(self, key: tuple):
+        if not self.available:
+            return
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.__remove, key)
+
+    def __load(self, key):
+        with self.lock:
+            try:
+                conn = self.__connect()
+                row = conn.execute(
+                    f"SELECT data FROM {self.table} WHERE {self.where}", key).fetchone()
+
+                if row is None:
+                    return None
+
+                conn.execute(
+                    f"UPDATE {self.table} SET lastAccess = ? WHERE {self.where}",
+                    (time.time(), *key))
+                conn.commit()
+            except sqlite3.Error as e:
+                self.__disable(e)
+                return None
+
+        try:
+            return json.loads(zlib.decompress(row[0]))
+        except (zlib.error, ValueError):
+            self.__remove(key)
+            return None
+
+    def __save(self, key, value):
+        data = zlib.compress(json.dumps(
+            value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+        columns = ", ".join(name for name, _ in self.keys)
+        marks = ", ".join("?" for _ in self.keys)
+
+        with self.lock:
+            try:
+                conn = self.__connect()
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table} ({columns}, data, lastAccess) "
+                    f"VALUES ({marks}, ?, ?)",
+                    (*key, data, time.time()))
+                self.__evict(conn)
+                conn.commit()
+            except sqlite3.Error as e:
+                self.__disable(e)
+
+    def __remove(self, key):
+        with self.lock:
+            try:
+                conn = self.__connect()
+                conn.execute(f"DELETE FROM {self.table} WHERE {self.where}", key)
+                conn.commit()
+            except sqlite3.Error as e:
+                self.__disable(e)
+
+    def __evict(self, conn: sqlite3.Connection):
+        count = conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        if count <= self.maxCount:
+            return
+
+        # 一次多删一点, 避免之后每次 put 都触发淘汰
+        n = count - int(self.maxCount * 0.9)
+        conn.execute(
+            f"DELETE FROM {self.table} WHERE rowid IN "
+            f"(SELECT rowid FROM {self.table} ORDER BY lastAccess LIMIT ?)", (n,))
+
+    def close(self):
+        with self.lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+
+
+class GameDetailStorage(SqliteBlobStore):
+    """
+    对局详情的本地持久化存储
+
+    已经结束的对局详情不会再变化, 以 (server, gameId) 为键存进 SQLite,
+    `connector.getGameDetailByGameId()` 会优先从这里读
+    """
+
+    def __init__(self, path, maxCount=3000):
+        super().__init__(path, "games",
+                         (("server", "TEXT"), ("gameId", "INTEGER")), maxCount)
+
+    async def get(self, server, gameId):
+        """
+        @return: 对局详情, 不存在时返回 `None`
+        """
+        return await self.load(((server or "").lower(), int(gameId)))
+
+    async def put(self, server, gameId, game: dict):
+        await self.save(((server or "").lower(), int(gameId)), game)
+
+    async def delete(self, server, gameId):
+        await self.remove(((server or "").lower(), int(gameId)))
+
+
+class MatchHistoryStorage(SqliteBlobStore):
+    """
+    战绩索引 (见 `app.lol.history.MatchHistoryIndex`) 的本地持久化存储
+
+    以 (server, source, puuid) 为键, 每条存一个人最近若干局的概要列表;
+    source 区分 LCU 与 SGP 两种接口, 它们返回的对局格式不同
+    """
+
+    def __init__(self, path, maxCount=500):
+        super().__init__(path, "histories",
+                         (("server", "TEXT"), ("source", "TEXT"), ("puuid", "TEXT")),
+                         maxCount)
+
+    async def get(self, server, source, puuid):
+        """
+        @return: 索引数据, 不存在时返回 `None`
+        """
+        return await self.load(((server or "").lower(), source, puuid))
+
+    async def put(self, server, source, puuid, history: dict):
+        await self.save(((server or "").lower(), source, puuid), history)
+
+    async def delete(self, server, source, puuid):
+        await self.remove(((server or "").lower(), source, puuid))
+
+
+class GameDataSnapshot:
+    """
+    处理好的游戏资源数据 (`JsonManager`) 的本地快照
+
+    以客户端版本号 + 语言为键, 同一个版本再次连接时直接从磁盘加载,
+    不需要重新下载、解析那一堆 json
+
+    文件为 zlib 压缩后的 pickle, 只保留最近 `keep` 个版本;
+    (解)压缩、(反)序列化与读写文件都在线程池里做, 不卡住事件循环
+    """
+
+    # JsonManager 的结构改了之后要 +1, 让旧快照失效
+    FORMAT_VERSION = 1
+
+    def __init__(self, folder, keep=3):
+        self.folder = folder
+        self.keep = keep
+
+    def __getPath(self, version, locale):
+        name = re.sub(r"[^\w.\-]", "_", f"{version}_{locale}")
+        return os.path.join(self.folder, f"{name}_v{self.FORMAT_VERSION}.bin")
+
+    async def load(self, version, locale):
+        """
+        @return: 快照数据, 不存在或损坏时返回 `None`
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.__load, version, locale)
+
+    async def save(self, version, locale, data):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.__save, version, locale, data)
+
+    def __load(self, version, locale):
+        path = self.__getPath(version, locale)
+
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                return pickle.loads(zlib.decompress(f.read()))
+        except Exception as e:
+            logger.exception(f"load game data snapshot failed: {path}", e, TAG)
+            return None
+
+    def __save(self, version, locale, data):
+        path = self.__getPath(version, locale)
+
+        try:
+            if not os.path.exists(self.folder):
+                os.makedirs(self.folder)
+
+            blob = zlib.compress(pickle.dumps(
+                data, protocol=pickle.HIGHEST_PROTOCOL))
+
+            # 先写临时文件再替换, 避免写一半退出留下坏文件
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.exception(f"save game data snapshot failed: {path}", e, TAG)
+            return
+
+        self.__cleanup()
+
+    def __cleanup(self):
+        try:
+            files = [os.path.join(self.folder, name)
+                     for name in os.listdir(self.folder) if name.endswith(".bin")]
+            files.sort(key=os.path.getmtime, reverse=True)
+
+            for path in files[self.keep:]:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+gameDetailStorage = GameDetailStorage(f"{LOCAL_PATH}/GameDetails.db")
+matchHistoryStorage = MatchHistoryStorage(f"{LOCAL_PATH}/MatchHistory.db")
+gameDataSnapshot = GameDataSnapshot(f"{LOCAL_PATH}/GameData")
@@ -1,4 +1,4 @@
-import itertools
+import math
 import time
 import ctypes
 from copy import deepcopy
@@ -9,7 +9,10 @@ from PyQt5.QtCore import QObject
 from .exceptions import SummonerRankInfoNotFound
 from ..common.config import cfg, Language
 from ..lol.connector import connector
+from ..lol.request import gatherByKind
+from ..lol.champ_select import ChampSelectView, ChampSelectEngine, deadlineScheduler
 from ..common.signals import signalBus
+from ..common.trace import traced
 
 
 SERVERS_NAME = {
@@ -150,8 +153,7 @@ async def parseSummonerData(summoner, rankTask, gameTask):
             "assists": 0,
             "games": [],
         }
-        for game in gamesInfo["games"]:
-            info = await parseGameData(game)
+        for info in await parseGamesDataConcurrently(gamesInfo["games"]):
             if time.time() - info["timeStamp"] / 1000 > 60 * 60 * 24 * 365:
                 continue
             if not info["remake"] and info["queueId"] != 0:
@@ -186,7 +188,71 @@ async def parseSummonerData(summoner, rankTask, gameTask):
     }
 
 
-async def parseGameData(game):
+async def resolveGamesIcons(players):
+    """
+    一页对局要用到的英雄 / 召唤师技能 / 装备 / 符文图标, 去重之后作为一批并发查询
+
+    @param players: [getGameIconIds() 的返回值, ...]
+    @return: {
+        'championIcons': {championId: path},
+        'spellIcons': {spellId: path},
+        'itemIcons': {itemId: path},
+        'runeIcons': {runeId: path},
+    }
+    """
+    championIds = {player['championId'] for player in players}
+    spellIds = {id for player in players for id in player['spellIds']}
+    itemIds = {id for player in players for id in player['itemIds']}
+    runeIds = {player['runeId'] for player in players}
+
+    jobs = {
+        **{('championIcons', id): connector.getChampionIcon(id) for id in championIds},
+        **{('spellIcons', id): connector.getSummonerSpellIcon(id) for id in spellIds},
+        **{('itemIcons', id): connector.getItemIcon(id) for id in itemIds},
+        **{('runeIcons', id): connector.getRuneIcon(id) for id in runeIds},
+    }
+
+    return await gatherByKind(
+        jobs, ('championIcons', 'spellIcons', 'itemIcons', 'runeIcons'))
+
+
+def getGameIconIds(game, puuid=None):
+    """
+    一局战绩里本人用到的图标 id
+
+    @param game: LCU 战绩里的一局; 传了 `puuid` 时为 SGP 战绩里的一局
+    @return: {'championId', 'spellIds', 'itemIds', 'runeId'}
+    """
+    if puuid is None:
+        participant = game['participants'][0]
+        stats = participant['stats']
+        runeId = stats['perk0']
+    else:
+        participant = getSGPParticipant(game, puuid)
+        stats = participant
+        runeId = participant['perks']['styles'][0]['selections'][0]['perk']
+
+    return {
+        'championId': participant['championId'],
+        'spellIds': (participant['spell1Id'], participant['spell2Id']),
+        'itemIds': [stats[f'item{i}'] for i in range(7)],
+        'runeId': runeId,
+    }
+
+
+def getSGPParticipant(game, puuid):
+    participant = None
+    for p in game['json']['participants']:
+        if p['puuid'] == puuid:
+            participant = p
+
+    return participant
+
+
+def makeGameData(game, icons):
+    """
+    @param icons: @see resolveGamesIcons
+    """
     timeStamp = game["gameCreation"]  # 毫秒级时间戳
     time = timeStampToStr(game['gameCreation'])
     shortTime = timeStampToShortStr(game['gameCreation'])
@@ -204,11 +270,11 @@ async def parseGameData(game):
 
     participant = game['participants'][0]
     championId = participant['championId']
-    championIcon = await connector.getChampionIcon(championId)
+    championIcon = icons['championIcons'][championId]
     spell1Id = participant['spell1Id']
     spell2Id = participant['spell2Id']
-    spell1Icon = await connector.getSummonerSpellIcon(spell1Id)
-    spell2Icon = await connector.getSummonerSpellIcon(spell2Id)
+    spell1Icon = icons['spellIcons'][spell1Id]
+    spell2Icon = icons['spellIcons'][spell2Id]
     stats = participant['stats']
 
     champLevel = stats['champLevel']
@@ -225,9 +291,9 @@ async def parseGameData(game):
         stats['item6'],
     ]
 
-    itemIcons = [await connector.getItemIcon(itemId) for itemId in itemIds]
+    itemIcons = [icons['itemIcons'][itemId] for itemId in itemIds]
     runeId = stats['perk0']
-    runeIcon = await connector.getRuneIcon(runeId)
+    runeIcon = icons['runeIcons'][runeId]
 
     cs = stats['totalMinionsKilled'] + stats['neutralMinionsKilled']
     gold = stats['goldEarned']
@@ -281,6 +347,107 @@ async def parseGameData(game):
     }
 
 
+AI_PUUID = '00000000-0000-0000-0000-000000000000'
+
+
+async def getParticipantsPrivacy(identities):
+    """
+    查询一局里所有玩家的生涯是否公开
+
+    先用 summonerId 走一次批量接口, 批量接口里没拿到的人再按 puuid 单独查
+
+    @param identities: game['participantIdentities']
+    @return: {puuid: isPublic}
+    """
+    res = {}
+    players = []
+
+    for participant in identities:
+        player = participant['player']
+
+        if player['puuid'] == AI_PUUID:
+            res[player['puuid']] = True
+        else:
+            players.append(player)
+
+    summonerIds = [player['summonerId']
+                   for player in players if player.get('summonerId')]
+    summoners = await connector.getSummonersByIds(summonerIds)
+
+    for summoner in summoners:
+        res[summoner['puuid']] = summoner.get("privacy") == "PUBLIC"
+
+    missing = [player['puuid']
+               for player in players if player['puuid'] not in res]
+    summoners = await asyncio.gather(
+        *[connector.getSummonerByPuuid(puuid) for puuid in missing])
+
+    for puuid, summoner in zip(missing, summoners):
+        res[puuid] = summoner.get("privacy") == "PUBLIC"
+
+    return res
+
+
+async def getRankedStatsOrNone(puuid):
+    try:
+        return await connector.getRankedStatsByPuuid(puuid)
+    except SummonerRankInfoNotFound:
+        return None
+
+
+async def resolveGameDetailResources(game, getRankInfo):
+    """
+    把一局对局详情要用到的远程数据 (生涯是否公开、段位、各种图标) 作为一批并发查询,
+    相同的英雄 / 装备 / 技能 / 符文只查一次
+
+    @param game: @see connector.getGameDetailByGameId
+    @param getRankInfo: 是否查询段位
+    @return: {
+        'championIcons': {championId: path},
+        'spellIcons': {spellId: path},
+        'runeIcons': {runeId: path},
+        'itemIcons': {itemId: path},
+        'privacy': {puuid: isPublic},
+        'ranks': {puuid: rankedStats or None},
+    }
+    """
+    championIds = {item['championId']
+                   for team in game['teams'] for item in team['bans']}
+    spellIds = set()
+    runeIds = set()
+    itemIds = set()
+
+    for summoner in game['participants']:
+        stats = summoner['stats']
+
+        championIds.add(summoner['championId'])
+        spellIds.update((summoner['spell1Id'], summoner['spell2Id']))
+        runeIds.add(stats['perk0'])
+        itemIds.update(stats[f'item{i}'] for i in range(7))
+
+    puuids = [] if not getRankInfo else list({
+        participant['player']['puuid']
+        for participant in game['participantIdentities']
+        if participant['player']['puuid'] != AI_PUUID
+    })
+
+    jobs = {
+        **{('championIcons', id): connector.getChampionIcon(id) for id in championIds},
+        **{('spellIcons', id): connector.getSummonerSpellIcon(id) for id in spellIds},
+        **{('runeIcons', id): connector.getRuneIcon(id) for id in runeIds},
+        **{('itemIcons', id): connector.getItemIcon(id) for id in itemIds},
+        **{('ranks', puuid): getRankedStatsOrNone(puuid) for puuid in puuids},
+    }
+
+    kinds = ('championIcons', 'spellIcons', 'runeIcons', 'itemIcons', 'ranks')
+    res, privacy = await asyncio.gather(
+        gatherByKind(jobs, kinds),
+        getParticipantsPrivacy(game['participantIdentities']))
+
+    res['privacy'] = privacy
+    return res
+
+
 async def parseGameDetailData(puuid, game):
     queueId = game['queueId']
     mapId = game['mapId']
@@ -328,6 +495,17 @@ async def parseGameDetailData(puuid, game):
     cherryResult = None
     win = None
 
+    getRankInfo = cfg.get(cfg.showTierInGameInfo)
+
+    # 先把十个人要查的东西一次性并发查完, 再同步地拼结果
+    resources = await resolveGameDetailResources(game, getRankInfo)
+    championIcons = resources['championIcons']
+    spellIcons = resources['spellIcons']
+    runeIcons = resources['runeIcons']
+    itemIcons = resources['itemIcons']
+    privacy = resources['privacy']
+    ranks = resources['ranks']
+
     for team in game['teams']:
         teamId = team['teamId']
 
@@ -336,8 +514,7 @@ async def parseGameDetailData(puuid, game):
 
         teams[teamId]['win'] = team['win']
         teams[teamId]['bans'] = [
-            await connector.getChampionIcon(item['championId'])
-            for item in team['bans']
+            championIcons[item['championId']] for item in team['bans']
         ]
         teams[teamId]['baronKills'] = team['baronKills']
         teams[teamId]['dragonKills'] = team['dragonKills']
@@ -352,12 +529,7 @@ async def parseGameDetailData(puuid, game):
             'gameName') or participant['player'].get('summonerName')  # 兼容外服
         summonerPuuid = participant['player']['puuid']
         isCurrent = (summonerPuuid == puuid)
-
-        if summonerPuuid == '00000000-0000-0000-0000-000000000000':  # AI
-            isPublic = True
-        else:
-            t = await connector.getSummonerByPuuid(summonerPuuid)
-            isPublic = t.get("privacy") == "PUBLIC"
+        isPublic = privacy[summonerPuuid]
 
         for summoner in game['participants']:
             if summoner['participantId'] == participantId:
@@ -377,13 +549,9 @@ async def parseGameDetailData(puuid, game):
                     if queueId == 1700:
                         cherryResult = subteamPlacement
 
-                championId = summoner['championId']
-                championIcon = await connector.getChampionIcon(championId)
-
-                spell1Id = summoner['spell1Id']
-                spell1Icon = await connector.getSummonerSpellIcon(spell1Id)
-                spell2Id = summoner['spell2Id']
-                spell2Icon = await connector.getSummonerSpellIcon(spell2Id)
+                championIcon = championIcons[summoner['championId']]
+                spell1Icon = spellIcons[summoner['spell1Id']]
+                spell2Icon = spellIcons[summoner['spell2Id']]
 
                 kills = stats['kills']
                 deaths = stats['deaths']
@@ -395,53 +563,33 @@ async def parseGameDetailData(puuid, game):
                 teams[tid]['assists'] += assists
                 teams[tid]['gold'] += gold
 
-                runeIcon = await connector.getRuneIcon(stats['perk0'])
+                runeIcon = runeIcons[stats['perk0']]
 
-                itemIds = [
-                    stats['item0'],
-                    stats['item1'],
-                    stats['item2'],
-                    stats['item3'],
-                    stats['item4'],
-                    stats['item5'],
-                    stats['item6'],
-                ]
-
-                itemIcons = [
-                    await connector.getItemIcon(itemId) for itemId in itemIds
-                ]
+                tier = division = lp = rankIcon = ""
+                rank = ranks.get(summonerPuuid)
 
-                getRankInfo = cfg.get(cfg.showTierInGameInfo)
+                if rank is not None:
+                    rank = rank['queueMap']
 
-                tier = division = lp = rankIcon = ""
-                if getRankInfo:
-                    try:
-                        rank = await connector.getRankedStatsByPuuid(
-                            summonerPuuid)
-                    except SummonerRankInfoNotFound:
-                        ...
+                    if queueId == 1700 and 'CHERRY' in rank:
+                        rankInfo = rank["CHERRY"]
+                        lp = rankInfo['ratedRating']
                     else:
-                        rank = rank['queueMap']
-
-                        if queueId == 1700 and 'CHERRY' in rank:
-                            rankInfo = rank["CHERRY"]
-                            lp = rankInfo['ratedRating']
-                        else:
-                            rankInfo = rank[
-                                'RANKED_FLEX_SR'] if queueId == 440 else rank['RANKED_SOLO_5x5']
+                        rankInfo = rank[
+                            'RANKED_FLEX_SR'] if queueId == 440 else rank['RANKED_SOLO_5x5']
 
-                            tier = rankInfo['tier']
-                            division = rankInfo['division']
-                            lp = rankInfo['leaguePoints']
+                        tier = rankInfo['tier']
+                        division = rankInfo['division']
+                        lp = rankInfo['leaguePoints']
 
-                            if tier == '':
-                                rankIcon = 'app/resource/images/unranked.png'
-                            else:
-                                rankIcon = f'app/resource/images/{tier.lower()}.png'
-                                tier = translateTier(tier, True)
+                        if tier == '':
+                            rankIcon = 'app/resource/images/unranked.png'
+                        else:
+                            rankIcon = f'app/resource/images/{tier.lower()}.png'
+                            tier = translateTier(tier, True)
 
-                            if division == 'NA':
-                                division = ''
+                        if division == 'NA':
+                            division = ''
 
                 item = {
                     'summonerName': summonerName,
@@ -455,7 +603,7 @@ async def parseGameDetailData(puuid, game):
                     'rankIcon': rankIcon,
                     'spell1Icon': spell1Icon,
                     'spell2Icon': spell2Icon,
-                    'itemIcons': itemIcons,
+                    'itemIcons': [itemIcons[stats[f'item{i}']] for i in range(7)],
                     'kills': kills,
                     'deaths': deaths,
                     'assists': assists,
@@ -786,7 +934,7 @@ def parseGames(games, targetId=0):
     解析 Games 数据
 
     @param targetId: 需要查询的游戏模式, 不传则收集所有模式的数据
-    @param games: 由 @see: {parseGameData} 获取到的games数据
+    @param games: 由 @see: {parseGamesDataConcurrently} 获取到的games数据
     @return: hitGame, K, D, A, win, loss
     @rtype: tuple[list, int, int, int, int, int, int]
     """
@@ -811,6 +959,7 @@ def parseGames(games, targetId=0):
     return hitGames, kills, deaths, assists, wins, losses
 
 
+@traced()
 async def parseAllyGameInfo(session, currentSummonerId, queueID, useSGP=False):
 
     if useSGP and connector.isInTencent():
@@ -852,6 +1001,7 @@ def parseSummonerOrder(team):
     return [s['summonerId'] for s in summoners if s['summonerId'] != 0]
 
 
+@traced()
 async def parseGameInfoByGameflowSession(session, currentSummonerId, side, useSGP=False):
     data = session['gameData']
     queueId = data['queue']['id']
@@ -988,10 +1138,25 @@ def separateTeams(data, currentSummonerId):
 
 
 async def parseGamesDataConcurrently(games):
-    tasks = [parseGameData(game) for game in games]
-    return await asyncio.gather(*tasks)
+    """
+    解析一页 LCU 战绩: 先把所有对局用到的图标去重后一起查完, 再逐局同步地拼结果
+    """
+    icons = await resolveGamesIcons([getGameIconIds(game) for game in games])
+
+    return [makeGameData(game, icons) for game in games]
+
 
+async def parseSGPGamesData(games, puuid):
+    """
+    和 `parseGamesDataConcurrently()` 一样, 用于 SGP 战绩
+    """
+    icons = await resolveGamesIcons(
+        [getGameIconIds(game, puuid) for game in games])
+
+    return [makeGameDataFromSGP(game, puuid, icons) for game in games]
 
+
+@traced()
 async def parseSummonerGameInfo(item, queueId, currentSummonerId):
     summonerId = item.get('summonerId', None)
 
@@ -1041,9 +1206,7 @@ async def parseSummonerGameInfo(item, queueId, currentSummonerId):
     except:
         gamesInfo = []
     else:
-        tasks = [parseGameData(game)
-                 for game in origGamesInfo["games"][:11]]
-        gamesInfo = await asyncio.gather(*tasks)
+        gamesInfo = await parseGamesDataConcurrently(origGamesInfo["games"][:11])
 
     _, kill, deaths, assists, _, _ = parseGames(gamesInfo)
 
@@ -1091,6 +1254,7 @@ async def parseSummonerGameInfo(item, queueId, currentSummonerId):
     }
 
 
+@traced()
 async def getSummonerGamesInfoViaSGP(item, queueID, currentSummonerId):
     '''
     使用 SGP 接口取战绩信息
@@ -1139,9 +1303,7 @@ async def getSummonerGamesInfoViaSGP(item, queueID, currentSummonerId):
         summonerName, tagLine = getNameTagLineFromGame(
             origGamesInfo['games'][0], puuid)
 
-        tasks = [parseGamesDataFromSGP(game, puuid)
-                 for game in origGamesInfo["games"][:11]]
-        gamesInfo = await asyncio.gather(*tasks)
+        gamesInfo = await parseSGPGamesData(origGamesInfo["games"][:11], puuid)
 
     _, kill, deaths, assists, _, _ = parseGames(gamesInfo)
 
@@ -1264,11 +1426,11 @@ def getTeammatesFromSGPGame(game, puuid):
     return res
 
 
-async def parseGamesDataFromSGP(game, puuid):
+def makeGameDataFromSGP(game, puuid, icons):
     """
-    解析由 SGP 接口得到的具体到某一局的对局记录信息
+    @param icons: @see resolveGamesIcons
     """
-
+    participant = getSGPParticipant(game, puuid)
     game = game['json']
 
     timeStamp = game["gameCreation"]  # 毫秒级时间戳
@@ -1286,17 +1448,12 @@ async def parseGamesDataFromSGP(game, puuid):
     else:
         mapName = connector.manager.getMapNameById(game['mapId'])
 
-    participant = None
-    for p in game['participants']:
-        if p['puuid'] == puuid:
-            participant = p
-
     championId = participant['championId']
-    championIcon = await connector.getChampionIcon(championId)
+    championIcon = icons['championIcons'][championId]
     spell1Id = participant['spell1Id']
     spell2Id = participant['spell2Id']
-    spell1Icon = await connector.getSummonerSpellIcon(spell1Id)
-    spell2Icon = await connector.getSummonerSpellIcon(spell2Id)
+    spell1Icon = icons['spellIcons'][spell1Id]
+    spell2Icon = icons['spellIcons'][spell2Id]
 
     champLevel = participant['champLevel']
     kills = participant['kills']
@@ -1313,9 +1470,9 @@ async def parseGamesDataFromSGP(game, puuid):
         participant['item6'],
     ]
 
-    itemIcons = [await connector.getItemIcon(itemId) for itemId in itemIds]
+    itemIcons = [icons['itemIcons'][itemId] for itemId in itemIds]
     runeId = participant['perks']['styles'][0]['selections'][0]['perk']
-    runeIcon = await connector.getRuneIcon(runeId)
+    runeIcon = icons['runeIcons'][runeId]
 
     cs = participant['totalMinionsKilled'] + \
         participant['neutralMinionsKilled']
@@ -1391,7 +1548,7 @@ class ChampionSelection:
         self.__init__()
 
 
-async def autoSwap(data, selection: ChampionSelection):
+async def autoSwap(view: ChampSelectView, selection: ChampionSelection):
     """
     选用顺序交换请求发生时，自动接受
     """
@@ -1399,54 +1556,41 @@ async def autoSwap(data, selection: ChampionSelection):
     if not cfg.get(cfg.autoAcceptCeilSwap):
         return
 
-    for pickOrderSwap in data['pickOrderSwaps']:
-        if 'RECEIVED' == pickOrderSwap['state']:
-            await asyncio.sleep(0.5)
-            await connector.acceptSwap(pickOrderSwap['id'])
+    for pickOrderSwap in view.receivedSwaps:
+        await asyncio.sleep(0.5)
+        await connector.acceptSwap(pickOrderSwap['id'])
 
-            selection.isChampionPickedCompleted = False
-            return True
+        selection.isChampionPickedCompleted = False
+        return True
 
 
-async def autoTrade(data, selection):
+async def autoTrade(view: ChampSelectView, selection):
     """
     英雄交换请求发生时，自动接受
     """
     if not cfg.get(cfg.autoAcceptChampTrade):
         return False
 
-    for trade in data['trades']:
-        if 'RECEIVED' == trade['state']:
-            await asyncio.sleep(0.5)
-            await connector.acceptTrade(trade['id'])
+    for trade in view.receivedTrades:
+        await asyncio.sleep(0.5)
+        await connector.acceptTrade(trade['id'])
 
-            return True
+        return True
 
     return False
 
 
-async def showOpggBuild(data, selection: ChampionSelection):
-    cellId = data['localPlayerCellId']
-
+async def showOpggBuild(view: ChampSelectView, selection: ChampionSelection):
     # 只有在英雄已经选定后才会尝试刷新 OPGG 界面
-    for actionGroup in data['actions']:
-        # 这里必须遍历完所有的 actorCellId == cellId 的所有 action
-        for action in actionGroup:
-            if not action['actorCellId'] == cellId:
-                continue
-
-            if action['type'] != 'pick':
-                continue
+    if not all(action['completed'] for action in view.myPickActions):
+        return False
 
-            if not action['completed']:
-                return False
+    if view.me is None:
+        return False
 
     # 拿一下位置和英雄 ID
-    for player in data['myTeam']:
-        if player['cellId'] == cellId:
-            position = player.get('assignedPosition', "")
-            championId = player['championId'] or player['championPickIntent']
-            break
+    position = view.position or ""
+    championId = view.championId or view.pickIntent
 
     # 大乱斗模式下，即使锁定了也可能会换英雄，这里判断一下
     if championId == selection.opggShowChampionId:
@@ -1466,9 +1610,9 @@ async def showOpggBuild(data, selection: ChampionSelection):
         return False
 
     if selection.queueId == None:
-        if data.get('benchEnabled'):
+        if view.data.get('benchEnabled'):
             mode = "aram"
-        elif len(data['myTeam']) == 2:
+        elif len(view.myTeam) == 2:
             mode = 'arena'
         else:
             mode = ""
@@ -1490,7 +1634,7 @@ async def showOpggBuild(data, selection: ChampionSelection):
     return True
 
 
-async def autoPick(data, selection: ChampionSelection):
+async def autoPick(view: ChampSelectView, selection: ChampionSelection):
     """
     自动选用英雄
     """
@@ -1498,24 +1642,14 @@ async def autoPick(data, selection: ChampionSelection):
     if not cfg.get(cfg.enableAutoSelectChampion) or selection.isChampionPicked:
         return
 
-    localPlayerCellId = data['localPlayerCellId']
-
-    for player in data['myTeam']:
-        if player["cellId"] != localPlayerCellId:
-            continue
-
-        if bool(player['championId']) or bool(player['championPickIntent']):
-            selection.isChampionPicked = True
-            return
-
-        break
+    if view.me is None:
+        return
 
-    bans = itertools.chain(data["bans"]['myTeamBans'],
-                           data["bans"]['theirTeamBans'])
+    if view.championId or view.pickIntent:
+        selection.isChampionPicked = True
+        return
 
-    pos = next(filter(lambda x: x['cellId'] ==
-               localPlayerCellId, data['myTeam']), None)
-    pos = pos.get('assignedPosition')
+    pos = view.position
 
     if pos == 'top':
         candidates = deepcopy(cfg.get(cfg.autoSelectChampionTop))
@@ -1532,7 +1666,7 @@ async def autoPick(data, selection: ChampionSelection):
 
     candidates.extend(cfg.get(cfg.autoSelectChampion))
 
-    candidates = [x for x in candidates if x not in bans]
+    candidates = [x for x in candidates if x not in view.bans]
 
     if not candidates:
         selection.isChampionPicked = True
@@ -1540,183 +1674,158 @@ async def autoPick(data, selection: ChampionSelection):
 
     championId = candidates[0]
 
-    for actionGroup in reversed(data['actions']):
-        for action in actionGroup:
-            if (action["actorCellId"] == localPlayerCellId
-                    and action['type'] == "pick"):
-
-                await connector.selectChampion(action['id'], championId)
-                selection.isChampionPicked = True
-                return True
+    if action := view.lastPickAction:
+        await connector.selectChampion(action['id'], championId)
+        deadlineScheduler.record("autoPick", view)
+        selection.isChampionPicked = True
+        return True
 
 
-async def autoComplete(data, selection: ChampionSelection):
+async def autoComplete(view: ChampSelectView, selection: ChampionSelection):
     """
     超时自动选定（当前选中英雄）
+
+    在截止时间前 4 秒左右锁定, 到点时按最新推送的 session 重新判断
     """
     isAutoCompleted = cfg.get(cfg.enableAutoSelectTimeoutCompleted)
     if not isAutoCompleted or selection.isChampionPickedCompleted:
         return
 
-    if not (localPlayerCellId := data.get('localPlayerCellId', None)):
+    if not view.cellId:
         return
 
-    for actionGroup in reversed(data['actions']):
-        for action in actionGroup:
-            if action['actorCellId'] != localPlayerCellId:
-                continue
-
-            if action['type'] != 'pick':
-                continue
+    if action := view.lastPickAction:
+        if not action['isInProgress']:
+            return False
 
-            if not action['isInProgress']:
-                return False
+        if action['completed']:
+            selection.isChampionPickedCompleted = True
+            return False
 
-            if action['completed']:
-                selection.isChampionPickedCompleted = True
-                return False
-
-            break
+    # 没有截止时间 (如自定义对局) 就谈不上超时
+    if math.isinf(view.deadline):
+        return False
 
     selection.isChampionPickedCompleted = True
 
-    sleepTime = int(data['timer']['adjustedTimeLeftInPhase'] / 1000) - 4
-    await asyncio.sleep(sleepTime)
-
-    data = await connector.getChampSelectSession()
+    async def complete(view: ChampSelectView):
+        if not view.myPickActions:
+            return False
 
-    if not data:
-        return
+        if any(action['completed'] for action in view.myPickActions):
+            return False
 
-    # 双方选过的英雄
-    cantSelect = []
+        # 现在亮着的英雄
+        championIntent = view.myPickActions[-1]['championId']
+        actionId = view.myPickActions[-1]['id']
 
-    # 双方 ban 掉的英雄
-    bans = itertools.chain(data["bans"]['myTeamBans'],
-                           data["bans"]['theirTeamBans'])
+        if not championIntent:
+            return False
 
-    championIntent = 0
-    for actionGroup in data['actions']:
-        for action in actionGroup:
-            if (action['type'] == 'pick' and action['completed']
-                    and action['actorCellId'] != localPlayerCellId):
-                cantSelect.append(action['championId'])
+        # 双方选过的英雄, 以及双方 ban 掉的英雄
+        cantSelect = view.bans.union(view.completedPicksByOthers)
 
-            if action['actorCellId'] != localPlayerCellId:
-                continue
+        if championIntent not in cantSelect:
+            await connector.selectChampion(actionId, championIntent, True)
+            return True
 
-            if action['type'] != 'pick':
-                continue
+        pos = view.position
+
+        if pos == 'top':
+            candidates = deepcopy(cfg.get(cfg.autoSelectChampionTop))
+        elif pos == 'jungle':
+            candidates = deepcopy(cfg.get(cfg.autoSelectChampionJug))
+        elif pos == 'middle':
+            candidates = deepcopy(cfg.get(cfg.autoSelectChampionMid))
+        elif pos == 'bottom':
+            candidates = deepcopy(cfg.get(cfg.autoSelectChampionBot))
+        elif pos == 'utility':
+            candidates = deepcopy(cfg.get(cfg.autoSelectChampionSup))
+        else:
+            candidates = []
 
-            if action['completed']:
-                return
+        candidates.extend(cfg.get(cfg.autoSelectChampion))
 
-            # 现在亮着的英雄
-            championIntent = action['championId']
-            actionId = action['id']
+        candidates = [x for x in candidates if x not in cantSelect]
 
-    if not championIntent:
-        return
+        if len(candidates) == 0:
+            return False
 
-    cantSelect.extend(bans)
+        await connector.selectChampion(actionId, candidates[0], True)
 
-    if championIntent not in cantSelect:
-        await connector.selectChampion(actionId, championIntent, True)
         return True
 
-    pos = next(filter(lambda x: x['cellId'] ==
-               localPlayerCellId, data['myTeam']), None)
-    pos = pos.get('assignedPosition')
+    # 只受截止时间限制, 在结束前 `margin` 秒执行
+    deadlineScheduler.schedule(
+        "autoComplete", complete, delay=view.timeLeft(), margin=4)
 
-    if pos == 'top':
-        candidates = deepcopy(cfg.get(cfg.autoSelectChampionTop))
-    elif pos == 'jungle':
-        candidates = deepcopy(cfg.get(cfg.autoSelectChampionJug))
-    elif pos == 'middle':
-        candidates = deepcopy(cfg.get(cfg.autoSelectChampionMid))
-    elif pos == 'bottom':
-        candidates = deepcopy(cfg.get(cfg.autoSelectChampionBot))
-    elif pos == 'utility':
-        candidates = deepcopy(cfg.get(cfg.autoSelectChampionSup))
-    else:
-        candidates = []
-
-    candidates.extend(cfg.get(cfg.autoSelectChampion))
-
-    candidates = [x for x in candidates if x not in cantSelect]
-
-    if len(candidates) == 0:
-        return
-
-    await connector.selectChampion(actionId, candidates[0], True)
-
-    return True
+    # 真正的操作在之后才执行, 不挡住本帧后面的功能
+    return False
 
 
-async def autoBan(data, selection: ChampionSelection):
+async def autoBan(view: ChampSelectView, selection: ChampionSelection):
     """
     自动禁用英雄
+
+    等 `autoBanDelay` 秒给队友预选, 但不会晚于这一轮结束前 2 秒;
+    到点时按最新推送的 session 重新挑选要禁用的英雄
     """
     isAutoBan = cfg.get(cfg.enableAutoBanChampion)
 
     if not isAutoBan or selection.isChampionBanned:
         return
 
-    localPlayerCellId = data['localPlayerCellId']
-    for actionGroup in data['actions']:
-        for action in actionGroup:
-            if (action["actorCellId"] == localPlayerCellId
-                    and action['type'] == 'ban'
-                    and action["isInProgress"]):
-
-                pos = next(
-                    filter(lambda x: x['cellId'] == localPlayerCellId, data['myTeam']), None)
-                pos = pos.get('assignedPosition')
-
-                if pos == 'top':
-                    candidates = deepcopy(cfg.get(cfg.autoBanChampionTop))
-                elif pos == 'jungle':
-                    candidates = deepcopy(cfg.get(cfg.autoBanChampionJug))
-                elif pos == 'middle':
-                    candidates = deepcopy(cfg.get(cfg.autoBanChampionMid))
-                elif pos == 'bottom':
-                    candidates = deepcopy(cfg.get(cfg.autoBanChampionBot))
-                elif pos == 'utility':
-                    candidates = deepcopy(cfg.get(cfg.autoBanChampionSup))
-                else:
-                    candidates = []
+    if not (action := view.inProgressBan):
+        return
+
+    actionId = action['id']
+
+    async def ban(view: ChampSelectView):
+        action = view.inProgressBan
 
-                candidates.extend(cfg.get(cfg.autoBanChampion))
+        if selection.isChampionBanned or not action or action['id'] != actionId:
+            return False
 
-                bans = itertools.chain(data["bans"]['myTeamBans'],
-                                       data["bans"]['theirTeamBans'])
-                candidates = [x for x in candidates if x not in bans]
+        pos = view.position
 
-                # 给队友一点预选的时间
-                await asyncio.sleep(cfg.get(cfg.autoBanDelay))
+        if pos == 'top':
+            candidates = deepcopy(cfg.get(cfg.autoBanChampionTop))
+        elif pos == 'jungle':
+            candidates = deepcopy(cfg.get(cfg.autoBanChampionJug))
+        elif pos == 'middle':
+            candidates = deepcopy(cfg.get(cfg.autoBanChampionMid))
+        elif pos == 'bottom':
+            candidates = deepcopy(cfg.get(cfg.autoBanChampionBot))
+        elif pos == 'utility':
+            candidates = deepcopy(cfg.get(cfg.autoBanChampionSup))
+        else:
+            candidates = []
+
+        candidates.extend(cfg.get(cfg.autoBanChampion))
 
-                isFriendly = cfg.get(cfg.pretentBan)
-                if isFriendly:
-                    myTeam = (await connector.getChampSelectSession()).get("myTeam")
+        candidates = [x for x in candidates if x not in view.bans]
 
-                    if not myTeam:
-                        return
+        # 不禁用队友预选的英雄
+        if cfg.get(cfg.pretentBan):
+            candidates = [x for x in candidates if x not in view.intents]
 
-                    intents = [player["championPickIntent"]
-                               for player in myTeam]
-                    candidates = [x for x in candidates if x not in intents]
+        if not candidates:
+            return False
 
-                if not candidates:
-                    return
+        await connector.banChampion(actionId, candidates[0], True)
+        selection.isChampionBanned = True
 
-                championId = candidates[0]
-                await connector.banChampion(action['id'], championId, True)
-                selection.isChampionBanned = True
+        return True
 
-                return True
+    # 给队友一点预选的时间
+    deadlineScheduler.schedule(
+        "autoBan", ban, delay=cfg.get(cfg.autoBanDelay), margin=2)
+
+    # 真正的操作在之后才执行, 不挡住本帧后面的功能
+    return False
 
 
-async def autoSetSummonerSpell(data, selection: ChampionSelection):
+async def autoSetSummonerSpell(view: ChampSelectView, selection: ChampionSelection):
     if selection.isSummonerSpellSetted:
         return False
 
@@ -1725,14 +1834,7 @@ async def autoSetSummonerSpell(data, selection: ChampionSelection):
     if not cfg.get(cfg.enableAutoSetSpells):
         return False
 
-    cellId = data['localPlayerCellId']
-
-    for player in data['myTeam']:
-        if player['cellId'] != cellId:
-            continue
-
-        pos = player.get("assignedPosition", None)
-        break
+    pos = view.position
 
     if pos == 'top':
         spells = deepcopy(cfg.get(cfg.autoSetSummonerSpellTop))
@@ -1756,7 +1858,7 @@ async def autoSetSummonerSpell(data, selection: ChampionSelection):
     await connector.setSummonerSpells(spells[0], spells[1])
 
 
-async def autoShow(data, selection: ChampionSelection):
+async def autoShow(view: ChampSelectView, selection: ChampionSelection):
     '''在 B/P 前展示英雄'''
     if selection.isChampionShowed:
         return
@@ -1764,20 +1866,14 @@ async def autoShow(data, selection: ChampionSelection):
     if not cfg.get(cfg.enableAutoSelectChampion):
         return
 
-    cellId = data['localPlayerCellId']
-
-    for player in data['myTeam']:
-        if player['cellId'] != cellId:
-            continue
-
-        if (player['championId'] != 0
-                or player['championPickIntent'] != 0):
-            selection.isChampionShowed = True
-            return
+    if view.me is None:
+        return
 
-        pos = player.get("assignedPosition", None)
+    if view.championId != 0 or view.pickIntent != 0:
+        selection.isChampionShowed = True
+        return
 
-        break
+    pos = view.position
 
     if pos == 'top':
         candidates = deepcopy(cfg.get(cfg.autoSelectChampionTop))
@@ -1800,15 +1896,43 @@ async def autoShow(data, selection: ChampionSelection):
         return
 
     championId = candidates[0]
-    for actionGroup in reversed(data['actions']):
-        for action in actionGroup:
-            if (action['actorCellId'] == cellId and
-                    action['type'] == 'pick'):
 
-                await connector.selectChampion(action['id'], championId)
-                selection.isChampionShowed = True
+    if action := view.lastPickAction:
+        await connector.selectChampion(action['id'], championId)
+        selection.isChampionShowed = True
+
+        return True
+
 
-                return True
+def createChampSelectEngine(selection: ChampionSelection):
+    """
+    注册英雄选择阶段的各个自动功能, 以及它们各自关心的输入;
+    输入和上次执行时一样的功能这一帧直接跳过
+    """
+    engine = ChampSelectEngine(selection)
+    actionKey = ChampSelectView.actionKey
+
+    def pickInputs(view: ChampSelectView):
+        return (view.championId, view.pickIntent, view.position,
+                view.bans, actionKey(view.lastPickAction))
+
+    engine.addFeature(('PLANNING', 'BAN_PICK', 'FINALIZATION'), autoSetSummonerSpell,
+                      lambda view: view.position)
+    engine.addFeature(('PLANNING', ), autoShow, pickInputs)
+    engine.addFeature(('BAN_PICK', ), autoBan,
+                      lambda view: (actionKey(view.inProgressBan), view.bans, view.position))
+    engine.addFeature(('BAN_PICK', ), autoPick, pickInputs)
+    engine.addFeature(('BAN_PICK', ), autoComplete,
+                      lambda view: actionKey(view.lastPickAction))
+    engine.addFeature(('BAN_PICK', ), autoSwap,
+                      lambda view: tuple(swap['id'] for swap in view.receivedSwaps))
+    engine.addFeature(('FINALIZATION', ), autoTrade,
+                      lambda view: tuple(trade['id'] for trade in view.receivedTrades))
+    engine.addFeature(('BAN_PICK', 'FINALIZATION'), showOpggBuild,
+                      lambda view: (view.championId, view.pickIntent, view.position,
+                                    tuple(actionKey(action) for action in view.myPickActions)))
+
+    return engine
 
 
 async def rollAndSwapBack():
@@ -678,157 +678,157 @@ If champions set by lane are not available, default settings will be used.</sour
 <context>
     <name>CareerInterface</name>
     <message>
-        <location filename="../../view/career_interface.py" line="139"/>
+        <location filename="../../view/career_interface.py" line="141"/>
         <source>Game Type</source>
         <translation>类型</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="139"/>
+        <location filename="../../view/career_interface.py" line="141"/>
         <source>Total</source>
         <translation>总场次</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="139"/>
+        <location filename="../../view/career_interface.py" line="141"/>
         <source>Win Rate</source>
         <translation>胜率</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="139"/>
+        <location filename="../../view/career_interface.py" line="141"/>
         <source>Wins</source>
         <translation>胜场</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="139"/>
+        <location filename="../../view/career_interface.py" line="141"/>
         <source>Losses</source>
         <translation>负场</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="139"/>
+        <location filename="../../view/career_interface.py" line="141"/>
         <source>Tier</source>
         <translation>段位</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="139"/>
+        <location filename="../../view/career_interface.py" line="141"/>
         <source>LP</source>
         <translation>胜点</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="452"/>
+        <location filename="../../view/career_interface.py" line="470"/>
         <source>Ranked Solo</source>
         <translation>单 / 双排</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="454"/>
+        <location filename="../../view/career_interface.py" line="472"/>
         <source>Ranked Flex</source>
         <translation>灵活排位</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="58"/>
+        <location filename="../../view/career_interface.py" line="59"/>
         <source>Connecting...</source>
         <translation>连接中...</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="157"/>
+        <location filename="../../view/career_interface.py" line="159"/>
         <source>All</source>
         <translation>全部</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="157"/>
+        <location filename="../../view/career_interface.py" line="159"/>
         <source>Normal</source>
         <translation>匹配模式</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="157"/>
+        <location filename="../../view/career_interface.py" line="159"/>
         <source>A.R.A.M.</source>
         <translation>极地大乱斗</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="79"/>
+        <location filename="../../view/career_interface.py" line="80"/>
         <source>Wins:</source>
         <translation>胜：</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="80"/>
+        <location filename="../../view/career_interface.py" line="81"/>
         <source>Losses:</source>
         <translation>负：</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="76"/>
+        <location filename="../../view/career_interface.py" line="77"/>
         <source>Recent matches</source>
         <translation>近期对局</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="76"/>
+        <location filename="../../view/career_interface.py" line="77"/>
         <source>(Last</source>
         <translation>（最近</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="76"/>
+        <location filename="../../view/career_interface.py" line="77"/>
         <source>games)</source>
         <translation>场）</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="173"/>
+        <location filename="../../view/career_interface.py" line="175"/>
         <source>Remakes or Customs do not count in statistics</source>
         <translation>重开或自定义对局不计入统计</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="67"/>
+        <location filename="../../view/career_interface.py" line="68"/>
         <source>Back to me</source>
         <translation>回到我</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="69"/>
+        <location filename="../../view/career_interface.py" line="70"/>
         <source>Game history</source>
         <translation>历史战绩</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="113"/>
+        <location filename="../../view/career_interface.py" line="115"/>
         <source>Copy summoner name to ClipBoard</source>
         <translation>复制召唤师名及编号</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="81"/>
+        <location filename="../../view/career_interface.py" line="82"/>
         <source>KDA:</source>
         <translation>KDA：</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="139"/>
+        <location filename="../../view/career_interface.py" line="141"/>
         <source>Highest tier</source>
         <translation>赛季最高</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="139"/>
+        <location filename="../../view/career_interface.py" line="141"/>
         <source>Previous end tier</source>
         <translation>上赛季结算</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="84"/>
+        <location filename="../../view/career_interface.py" line="85"/>
         <source>Recent teammates</source>
         <translation>最近队友</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="68"/>
+        <location filename="../../view/career_interface.py" line="69"/>
         <source>Refresh</source>
         <translation>刷新</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="397"/>
+        <location filename="../../view/career_interface.py" line="404"/>
         <source>Get summoner infomation error</source>
         <translation>获取召唤师信息失败</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="397"/>
+        <location filename="../../view/career_interface.py" line="404"/>
         <source>The server returned abnormal content.</source>
         <translation>服务器返回了不正常的内容</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="560"/>
+        <location filename="../../view/career_interface.py" line="578"/>
         <source>(</source>
         <translation>（</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="562"/>
+        <location filename="../../view/career_interface.py" line="580"/>
         <source>)</source>
         <translation>）</translation>
     </message>
@@ -911,22 +911,22 @@ If champions set by lane are not available, default settings will be used.</sour
 <context>
     <name>ChampionsCard</name>
     <message>
-        <location filename="../../view/career_interface.py" line="730"/>
+        <location filename="../../view/career_interface.py" line="748"/>
         <source>Total: </source>
         <translation>总：</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="731"/>
+        <location filename="../../view/career_interface.py" line="749"/>
         <source>Wins: </source>
         <translation>胜：</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="732"/>
+        <location filename="../../view/career_interface.py" line="750"/>
         <source>Losses: </source>
         <translation>负：</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="733"/>
+        <location filename="../../view/career_interface.py" line="751"/>
         <source>Win Rate: </source>
         <translation>胜率：</translation>
     </message>
@@ -1174,52 +1174,52 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">重开</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="380"/>
+        <location filename="../../view/search_interface.py" line="367"/>
         <source>1st</source>
         <translation>第一名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="383"/>
+        <location filename="../../view/search_interface.py" line="370"/>
         <source>2nd</source>
         <translation>第二名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="401"/>
+        <location filename="../../view/search_interface.py" line="388"/>
         <source>3rd</source>
         <translation>第三名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="404"/>
+        <location filename="../../view/search_interface.py" line="391"/>
         <source>4th</source>
         <translation>第四名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="407"/>
+        <location filename="../../view/search_interface.py" line="394"/>
         <source>5th</source>
         <translation>第五名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="410"/>
+        <location filename="../../view/search_interface.py" line="397"/>
         <source>6th</source>
         <translation>第六名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="413"/>
+        <location filename="../../view/search_interface.py" line="400"/>
         <source>7th</source>
         <translation>第七名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="416"/>
+        <location filename="../../view/search_interface.py" line="403"/>
         <source>8th</source>
         <translation>第八名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="365"/>
+        <location filename="../../view/search_interface.py" line="352"/>
         <source>Get game infomation failed</source>
         <translation>获取对局详细信息失败</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="365"/>
+        <location filename="../../view/search_interface.py" line="352"/>
         <source>The server returned abnormal content.</source>
         <translation>服务器返回了不正常的内容</translation>
     </message>
@@ -1283,42 +1283,42 @@ If champions set by lane are not available, default settings will be used.</sour
 <context>
     <name>GameTitleBar</name>
     <message>
-        <location filename="../../view/search_interface.py" line="906"/>
+        <location filename="../../view/search_interface.py" line="893"/>
         <source>Copy game ID</source>
         <translation>复制游戏 ID</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="965"/>
+        <location filename="../../view/search_interface.py" line="952"/>
         <source>Game ID: </source>
         <translation>游戏 ID：</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="932"/>
+        <location filename="../../view/search_interface.py" line="919"/>
         <source>Remake</source>
         <translation>重开</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="935"/>
+        <location filename="../../view/search_interface.py" line="922"/>
         <source>Win</source>
         <translation>胜利</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="938"/>
+        <location filename="../../view/search_interface.py" line="925"/>
         <source>Lose</source>
         <translation>失败</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="944"/>
+        <location filename="../../view/search_interface.py" line="931"/>
         <source>1st</source>
         <translation>第一名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="946"/>
+        <location filename="../../view/search_interface.py" line="933"/>
         <source>2nd</source>
         <translation>第二名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="948"/>
+        <location filename="../../view/search_interface.py" line="935"/>
         <source>3rd</source>
         <translation>第三名</translation>
     </message>
@@ -1328,27 +1328,27 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">第四名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="950"/>
+        <location filename="../../view/search_interface.py" line="937"/>
         <source>4rd</source>
         <translation>第四名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="952"/>
+        <location filename="../../view/search_interface.py" line="939"/>
         <source>5rd</source>
         <translation>第五名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="954"/>
+        <location filename="../../view/search_interface.py" line="941"/>
         <source>6rd</source>
         <translation>第六名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="956"/>
+        <location filename="../../view/search_interface.py" line="943"/>
         <source>7rd</source>
         <translation>第七名</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="958"/>
+        <location filename="../../view/search_interface.py" line="945"/>
         <source>8th</source>
         <translation>第八名</translation>
     </message>
@@ -1472,27 +1472,27 @@ If champions set by lane are not available, default settings will be used.</sour
 <context>
     <name>MainWindow</name>
     <message>
-        <location filename="../../view/main_window.py" line="412"/>
+        <location filename="../../view/main_window.py" line="420"/>
         <source>Career</source>
         <translation>生涯</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="414"/>
+        <location filename="../../view/main_window.py" line="422"/>
         <source>Game Information</source>
         <translation>对局信息</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="618"/>
+        <location filename="../../view/main_window.py" line="628"/>
         <source>Start LOL</source>
         <translation>启动游戏</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="417"/>
+        <location filename="../../view/main_window.py" line="425"/>
         <source>Settings</source>
         <translation>设置</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="415"/>
+        <location filename="../../view/main_window.py" line="423"/>
         <source>Auxiliary Functions</source>
         <translation>其他功能</translation>
     </message>
@@ -1502,92 +1502,92 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">客户端已连接</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="693"/>
+        <location filename="../../view/main_window.py" line="703"/>
         <source>Invalid path</source>
         <translation>路径非法</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="693"/>
+        <location filename="../../view/main_window.py" line="703"/>
         <source>Please set the correct directory of the LOL client in the setting page</source>
         <translation>请在设置页面中设置正确的 LOL 客户端路径</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="154"/>
+        <location filename="../../view/main_window.py" line="162"/>
         <source>Start</source>
         <translation>启动页</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="682"/>
+        <location filename="../../view/main_window.py" line="692"/>
         <source>Start LOL successfully</source>
         <translation>启动客户端成功</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="785"/>
+        <location filename="../../view/main_window.py" line="798"/>
         <source>Home</source>
         <translation>游戏大厅</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="788"/>
+        <location filename="../../view/main_window.py" line="801"/>
         <source>Selecting Champions</source>
         <translation>英雄选择</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="806"/>
+        <location filename="../../view/main_window.py" line="824"/>
         <source>Gaming</source>
         <translation>游戏中</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="813"/>
+        <location filename="../../view/main_window.py" line="832"/>
         <source>Waiting for status</source>
         <translation>等待游戏结果</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="815"/>
+        <location filename="../../view/main_window.py" line="834"/>
         <source>End of game</source>
         <translation>游戏结束</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="817"/>
+        <location filename="../../view/main_window.py" line="836"/>
         <source>Lobby</source>
         <translation>房间组队中</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="825"/>
+        <location filename="../../view/main_window.py" line="844"/>
         <source>Ready check</source>
         <translation>匹配确认</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="828"/>
+        <location filename="../../view/main_window.py" line="847"/>
         <source>Match making</source>
         <translation>匹配中</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="1042"/>
+        <location filename="../../view/main_window.py" line="1078"/>
         <source>Exception occurred 😥</source>
         <translation>程序出现异常 😥</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="413"/>
+        <location filename="../../view/main_window.py" line="421"/>
         <source>Search 👀</source>
         <translation>战绩查询 👀</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="736"/>
+        <location filename="../../view/main_window.py" line="746"/>
         <source>Exit</source>
         <translation>直接退出</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="735"/>
+        <location filename="../../view/main_window.py" line="745"/>
         <source>Minimize</source>
         <translation>最小化到任务栏</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="418"/>
+        <location filename="../../view/main_window.py" line="426"/>
         <source>Quit</source>
         <translation>退出</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="728"/>
+        <location filename="../../view/main_window.py" line="738"/>
         <source>Do you wish to exit?</source>
         <translation>你第一次点击了关闭按钮</translation>
     </message>
@@ -1598,47 +1598,47 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">请选择点击关闭按钮的默认行为</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="358"/>
+        <location filename="../../view/main_window.py" line="366"/>
         <source>Check Update Failed</source>
         <translation>检查更新失败</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="358"/>
+        <location filename="../../view/main_window.py" line="366"/>
         <source>Failed to check for updates, possibly unable to connect to Github.</source>
         <translation>请确保能连接至 GitHub</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="307"/>
+        <location filename="../../view/main_window.py" line="315"/>
         <source>Connect API</source>
         <translation>请求 API</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="298"/>
+        <location filename="../../view/main_window.py" line="306"/>
         <source>The server returned abnormal content, which may be under maintenance.</source>
         <translation>服务器返回了不正常内容，可能其正在维护中</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="301"/>
+        <location filename="../../view/main_window.py" line="309"/>
         <source>Exceeded maximum retry attempts.</source>
         <translation>超出最大尝试次数</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="307"/>
+        <location filename="../../view/main_window.py" line="315"/>
         <source>LCU request error</source>
         <translation>客户端信息请求失败</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="794"/>
+        <location filename="../../view/main_window.py" line="809"/>
         <source>Blue Team</source>
         <translation>蓝色方</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="796"/>
+        <location filename="../../view/main_window.py" line="811"/>
         <source>Red Team</source>
         <translation>红色方</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="831"/>
+        <location filename="../../view/main_window.py" line="850"/>
         <source>Waiting reconnect</source>
         <translation>等待重新连接</translation>
     </message>
@@ -1653,7 +1653,7 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">tasklist.exe 似乎在您的电脑上不可用</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="188"/>
+        <location filename="../../view/main_window.py" line="196"/>
         <source>Notice</source>
         <translation>公告</translation>
     </message>
@@ -1663,47 +1663,47 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">复制错误信息并退出</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="178"/>
+        <location filename="../../view/main_window.py" line="186"/>
         <source>Back to Lobby</source>
         <translation>修复无限加载</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="369"/>
+        <location filename="../../view/main_window.py" line="377"/>
         <source>Fetch notice Failed</source>
         <translation>拉取公告失败</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="369"/>
+        <location filename="../../view/main_window.py" line="377"/>
         <source>Failed to fetch notice, possibly unable to connect to Github.</source>
         <translation>请确保能连接至 GitHub</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="600"/>
+        <location filename="../../view/main_window.py" line="610"/>
         <source> (</source>
         <translation>（</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="600"/>
+        <location filename="../../view/main_window.py" line="610"/>
         <source>)</source>
         <translation>）</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="605"/>
+        <location filename="../../view/main_window.py" line="615"/>
         <source>, </source>
         <translation>，</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="397"/>
+        <location filename="../../view/main_window.py" line="405"/>
         <source>Get cmdline error</source>
         <translation>获取启动参数失败</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="397"/>
+        <location filename="../../view/main_window.py" line="405"/>
         <source>Try running Seraphine as an administrator</source>
         <translation>请尝试使用管理员身份启动 Seraphine</translation>
     </message>
     <message>
-        <location filename="../../view/main_window.py" line="728"/>
+        <location filename="../../view/main_window.py" line="738"/>
         <source>Choose action for close button (you can modify it at any time in the settings page)</source>
         <translation>请选择点击关闭按钮的默认行为</translation>
     </message>
@@ -2575,12 +2575,12 @@ If champions set by lane are not available, default settings will be used.</sour
 <context>
     <name>SearchInterface</name>
     <message>
-        <location filename="../../view/search_interface.py" line="1129"/>
+        <location filename="../../view/search_interface.py" line="1119"/>
         <source>Career</source>
         <translation>生涯</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="1200"/>
+        <location filename="../../view/search_interface.py" line="1187"/>
         <source>Summoner not found</source>
         <translation>召唤师未找到</translation>
     </message>
@@ -2590,32 +2590,32 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">请检查召唤师名后重试</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="1147"/>
+        <location filename="../../view/search_interface.py" line="1134"/>
         <source>Please input summoner name</source>
         <translation>请输入同大区召唤师名及编号</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="1154"/>
+        <location filename="../../view/search_interface.py" line="1141"/>
         <source>All</source>
         <translation>全部</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="1154"/>
+        <location filename="../../view/search_interface.py" line="1141"/>
         <source>Normal</source>
         <translation>匹配模式</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="1154"/>
+        <location filename="../../view/search_interface.py" line="1141"/>
         <source>A.R.A.M.</source>
         <translation>极地大乱斗</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="1154"/>
+        <location filename="../../view/search_interface.py" line="1141"/>
         <source>Ranked Solo</source>
         <translation>单 / 双排</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="1154"/>
+        <location filename="../../view/search_interface.py" line="1141"/>
         <source>Ranked Flex</source>
         <translation>灵活排位</translation>
     </message>
@@ -2630,7 +2630,7 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">没有找到该玩家相关对局</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="1200"/>
+        <location filename="../../view/search_interface.py" line="1187"/>
         <source>Please check the summoner&apos;s name and retry</source>
         <translation>请检查召唤师名后重试</translation>
     </message>
@@ -2646,122 +2646,122 @@ If champions set by lane are not available, default settings will be used.</sour
 <context>
     <name>SettingInterface</name>
     <message>
-        <location filename="../../view/setting_interface.py" line="33"/>
+        <location filename="../../view/setting_interface.py" line="39"/>
         <source>Settings</source>
         <translation>设置</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="95"/>
+        <location filename="../../view/setting_interface.py" line="101"/>
         <source>General</source>
         <translation>通用</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="98"/>
+        <location filename="../../view/setting_interface.py" line="104"/>
         <source>Choose folder</source>
         <translation>选择文件夹</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="98"/>
+        <location filename="../../view/setting_interface.py" line="104"/>
         <source>Client Path</source>
         <translation>客户端路径</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="135"/>
+        <location filename="../../view/setting_interface.py" line="157"/>
         <source>Auto-start LOL</source>
         <translation>自动启动游戏</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="135"/>
+        <location filename="../../view/setting_interface.py" line="157"/>
         <source>Launch LOL client upon opening Seraphine automatically</source>
         <translation>启动 Seraphine 时自动启动 LOL 客户端</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="158"/>
+        <location filename="../../view/setting_interface.py" line="189"/>
         <source>Personalization</source>
         <translation>个性化</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="169"/>
+        <location filename="../../view/setting_interface.py" line="200"/>
         <source>Application theme</source>
         <translation>应用主题</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="169"/>
+        <location filename="../../view/setting_interface.py" line="200"/>
         <source>Change the appearance of Seraphine</source>
         <translation>调整 Seraphine 的外观主题</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="169"/>
+        <location filename="../../view/setting_interface.py" line="200"/>
         <source>Light</source>
         <translation>浅色</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="169"/>
+        <location filename="../../view/setting_interface.py" line="200"/>
         <source>Dark</source>
         <translation>深色</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="210"/>
+        <location filename="../../view/setting_interface.py" line="241"/>
         <source>Use system setting</source>
         <translation>跟随系统设置</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="184"/>
+        <location filename="../../view/setting_interface.py" line="215"/>
         <source>Theme color</source>
         <translation>主题色</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="184"/>
+        <location filename="../../view/setting_interface.py" line="215"/>
         <source>Change the theme color of Seraphine</source>
         <translation>调整 Seraphine 的主题色</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="200"/>
+        <location filename="../../view/setting_interface.py" line="231"/>
         <source>Interface zoom</source>
         <translation>界面缩放</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="200"/>
+        <location filename="../../view/setting_interface.py" line="231"/>
         <source>Change the size of widgets and fonts</source>
         <translation>调整部件和字体的大小</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="349"/>
+        <location filename="../../view/setting_interface.py" line="418"/>
         <source>Updated successfully</source>
         <translation>更新成功</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="343"/>
+        <location filename="../../view/setting_interface.py" line="412"/>
         <source>Configuration takes effect after restart</source>
         <translation>设置在重启软件后生效</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="210"/>
+        <location filename="../../view/setting_interface.py" line="241"/>
         <source>Language</source>
         <translation>语言</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="210"/>
+        <location filename="../../view/setting_interface.py" line="241"/>
         <source>Set your preferred language for Seraphine</source>
         <translation>选择 Seraphine 所使用的语言</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="35"/>
+        <location filename="../../view/setting_interface.py" line="41"/>
         <source>Functions</source>
         <translation>功能</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="47"/>
+        <location filename="../../view/setting_interface.py" line="53"/>
         <source>Default games number</source>
         <translation>默认对局数量</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="47"/>
+        <location filename="../../view/setting_interface.py" line="53"/>
         <source>Setting the maximum number of games shows in the career interface</source>
         <translation>调整在个人生涯界面中显示的最大对局数量</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="64"/>
+        <location filename="../../view/setting_interface.py" line="70"/>
         <source>Show tier in game information</source>
         <translation>对局详情中显示段位</translation>
     </message>
@@ -2772,52 +2772,97 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">在对局详情界面中显示段位图标，启动该选项将影响加载该界面的速度</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="244"/>
+        <location filename="../../view/setting_interface.py" line="275"/>
         <source>About</source>
         <translation>关于</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="235"/>
+        <location filename="../../view/setting_interface.py" line="266"/>
         <source>Provide feedback</source>
         <translation>提供反馈</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="235"/>
+        <location filename="../../view/setting_interface.py" line="266"/>
         <source>Help us improve Seraphine by providing feedback</source>
         <translation>通过提供反馈帮助我们改善 Seraphine</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="244"/>
+        <location filename="../../view/setting_interface.py" line="275"/>
         <source>Copyright</source>
         <translation>版权所有</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="244"/>
+        <location filename="../../view/setting_interface.py" line="275"/>
         <source>Version</source>
         <translation>当前版本</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="141"/>
+        <location filename="../../view/setting_interface.py" line="163"/>
         <source>Delete</source>
         <translation>删除</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="141"/>
+        <location filename="../../view/setting_interface.py" line="163"/>
         <source>Delete cache</source>
         <translation>清除缓存</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="141"/>
+        <location filename="../../view/setting_interface.py" line="163"/>
         <source>Delete all game resources (Apply it when game resources update)</source>
         <translation>删除所有游戏资源的缓存（建议在游戏资源有更新时使用）</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="244"/>
+        <location filename="../../view/setting_interface.py" line="149"/>
+        <source>Export</source>
+        <translation>导出</translation>
+    </message>
+    <message>
+        <location filename="../../view/setting_interface.py" line="141"/>
+        <source>API statistics</source>
+        <translation>接口统计</translation>
+    </message>
+    <message>
+        <location filename="../../view/setting_interface.py" line="141"/>
+        <source>Export latency, error and retry statistics of LCU / SGP requests to the log directory</source>
+        <translation>将 LCU / SGP 请求的耗时、错误与重试统计导出到日志目录</translation>
+    </message>
+    <message>
+        <location filename="../../view/setting_interface.py" line="149"/>
+        <source>Timing trace</source>
+        <translation>耗时追踪</translation>
+    </message>
+    <message>
+        <location filename="../../view/setting_interface.py" line="149"/>
+        <source>Export recent champ select / game start timings as Chrome trace and speedscope files to the log directory</source>
+        <translation>将最近英雄选择 / 游戏开始各环节的耗时导出为 Chrome trace 与 speedscope 文件, 保存到日志目录</translation>
+    </message>
+    <message>
+        <location filename="../../view/setting_interface.py" line="392"/>
+        <source>Exported successfully</source>
+        <translation>导出成功</translation>
+    </message>
+    <message>
+        <location filename="../../view/setting_interface.py" line="171"/>
+        <source>Prefetch game resources</source>
+        <translation>预下载游戏资源</translation>
+    </message>
+    <message>
+        <location filename="../../view/setting_interface.py" line="169"/>
+        <source>Download all champion, item, spell and rune icons in background after connecting to the client</source>
+        <translation>连接客户端后在后台下载所有英雄、装备、召唤师技能与符文图标</translation>
+    </message>
+    <message>
+        <location filename="../../view/setting_interface.py" line="399"/>
+        <source>Downloading game resources: </source>
+        <translation>正在下载游戏资源: </translation>
+    </message>
+    <message>
+        <location filename="../../view/setting_interface.py" line="275"/>
         <source>View GitHub</source>
         <translation>查看 GitHub</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="375"/>
+        <location filename="../../view/setting_interface.py" line="446"/>
         <source>Really?</source>
         <translation>真的要删除吗？</translation>
     </message>
@@ -2829,32 +2874,32 @@ If champions set by lane are not available, default settings will be used.</sour
                 这有可能会消耗更多的时间</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="383"/>
+        <location filename="../../view/setting_interface.py" line="454"/>
         <source>Confirm delete</source>
         <translation>确定删除</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="161"/>
+        <location filename="../../view/setting_interface.py" line="192"/>
         <source>Mica effect</source>
         <translation>云母效果</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="161"/>
+        <location filename="../../view/setting_interface.py" line="192"/>
         <source>Apply semi transparent to windows and surfaces (only available on Win11)</source>
         <translation>窗口和表面显示半透明（仅在 Win11 上可用）</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="151"/>
+        <location filename="../../view/setting_interface.py" line="182"/>
         <source>Minimize to tray on close</source>
         <translation>最小化到任务栏托盘</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="151"/>
+        <location filename="../../view/setting_interface.py" line="182"/>
         <source>Minimize to system tray when clicking close</source>
         <translation>点击右上角关闭时将程序最小化到托盘</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="349"/>
+        <location filename="../../view/setting_interface.py" line="418"/>
         <source>Settings have been applied</source>
         <translation>设置已应用</translation>
     </message>
@@ -2869,17 +2914,17 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">打开此选项后，当你在排位时，对局信息界面将只显示排位模式对局战绩</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="222"/>
+        <location filename="../../view/setting_interface.py" line="253"/>
         <source>Check for updates</source>
         <translation>检查更新</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="222"/>
+        <location filename="../../view/setting_interface.py" line="253"/>
         <source>Automatically check for updates when software starts</source>
         <translation>在 Seraphine 启动时自动检查更新</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="47"/>
+        <location filename="../../view/setting_interface.py" line="53"/>
         <source>Number of games:</source>
         <translation>显示对局数量：</translation>
     </message>
@@ -2894,12 +2939,12 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">在游戏时通过避免渲染窗口以减少 CPU 使用</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="117"/>
+        <location filename="../../view/setting_interface.py" line="123"/>
         <source>Log Level</source>
         <translation>日志等级</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="117"/>
+        <location filename="../../view/setting_interface.py" line="123"/>
         <source>The level of logging for Seraphine (take effect after restart)</source>
         <translation>修改 Seraphine 记录日志的等级（重启后生效）</translation>
     </message>
@@ -2909,37 +2954,37 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">HTTP 代理</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="228"/>
+        <location filename="../../view/setting_interface.py" line="259"/>
         <source>Using a proxy when connecting to GitHub</source>
         <translation>连接 GitHub 时启用 HTTP 代理</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="219"/>
+        <location filename="../../view/setting_interface.py" line="250"/>
         <source>Update</source>
         <translation>软件更新</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="38"/>
+        <location filename="../../view/setting_interface.py" line="44"/>
         <source>LCU API concurrency number</source>
         <translation>LCU API 并发数</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="38"/>
+        <location filename="../../view/setting_interface.py" line="44"/>
         <source>Number of concurrency:</source>
         <translation>最大并发数量：</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="38"/>
+        <location filename="../../view/setting_interface.py" line="44"/>
         <source>Setting the maximum number of API concurrency.</source>
         <translation>该值越大数据加载速度越快，但越可能引起客户端闪退</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="188"/>
+        <location filename="../../view/setting_interface.py" line="219"/>
         <source>Game tabs color</source>
         <translation>对局卡片颜色</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="188"/>
+        <location filename="../../view/setting_interface.py" line="219"/>
         <source>Change the color of game tabs</source>
         <translation>改变对局卡片提示胜利 / 失败的颜色</translation>
     </message>
@@ -2949,17 +2994,17 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">HTTP 代理</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="124"/>
+        <location filename="../../view/setting_interface.py" line="130"/>
         <source>Open</source>
         <translation>打开文件夹</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="124"/>
+        <location filename="../../view/setting_interface.py" line="130"/>
         <source>Log file</source>
         <translation>日志文件</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="124"/>
+        <location filename="../../view/setting_interface.py" line="130"/>
         <source>Open log directory</source>
         <translation>打开日志文件夹</translation>
     </message>
@@ -2969,22 +3014,22 @@ If champions set by lane are not available, default settings will be used.</sour
         <translation type="obsolete">设置客户端路径及顺序（第一个会被作为默认值）</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="98"/>
+        <location filename="../../view/setting_interface.py" line="104"/>
         <source>Set client path and order</source>
         <translation>设置客户端路径以及顺序</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="115"/>
+        <location filename="../../view/setting_interface.py" line="121"/>
         <source>Log</source>
         <translation>日志</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="64"/>
+        <location filename="../../view/setting_interface.py" line="70"/>
         <source>Show tier icon in game information interface. Enabling this option affects APP&apos;s performance</source>
         <translation>在搜索界面对局详情界面中显示段位，启动该选项将影响加载该界面的速度</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="375"/>
+        <location filename="../../view/setting_interface.py" line="446"/>
         <source>Game resources will be downloaded again
 when they are used by Seraphine, which will cost more time</source>
         <translation>游戏资源将会在它们要被 Seraphine 使用时重新下载，
@@ -3001,12 +3046,12 @@ when they are used by Seraphine, which will cost more time</source>
         <translation type="obsolete">在英雄选择开始时自动显示 OPGG 窗口</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="80"/>
+        <location filename="../../view/setting_interface.py" line="86"/>
         <source>Show OP.GG window automatically</source>
         <translation>自动显示 OP.GG 窗口</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="80"/>
+        <location filename="../../view/setting_interface.py" line="86"/>
         <source>Show OP.GG window automatically when champion selection starts</source>
         <translation>在英雄选择开始时自动显示 OP.GG 窗口</translation>
     </message>
@@ -3021,72 +3066,72 @@ when they are used by Seraphine, which will cost more time</source>
         <translation type="obsolete">在回到大厅或组队房间时清空对局信息界面</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="70"/>
+        <location filename="../../view/setting_interface.py" line="76"/>
         <source>Reserve Game Information interface</source>
         <translation>保留对局信息界面内容</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="70"/>
+        <location filename="../../view/setting_interface.py" line="76"/>
         <source>Reserve Game Information interface until the next champion selection starts</source>
         <translation>保留上一局的对局信息内容直到下一次对局开始</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="194"/>
+        <location filename="../../view/setting_interface.py" line="225"/>
         <source>Deaths number color</source>
         <translation>死亡数字体颜色</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="194"/>
+        <location filename="../../view/setting_interface.py" line="225"/>
         <source>Change the color of Deaths number of KDA</source>
         <translation>改变 KDA 标签中死亡数字的字体颜色</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="108"/>
+        <location filename="../../view/setting_interface.py" line="114"/>
         <source>Silently start</source>
         <translation>静默启动</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="108"/>
+        <location filename="../../view/setting_interface.py" line="114"/>
         <source>Show Seraphine window minimized when it starts</source>
         <translation>启动 Seraphine 后最小化窗口到任务栏托盘</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="77"/>
+        <location filename="../../view/setting_interface.py" line="83"/>
         <source>OP.GG</source>
         <translation>OP.GG</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="84"/>
+        <location filename="../../view/setting_interface.py" line="90"/>
         <source>Show OP.GG window on top</source>
         <translation>置顶 OP.GG 窗口</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="84"/>
+        <location filename="../../view/setting_interface.py" line="90"/>
         <source>Show OP.GG window in front of other windows while selecting champions</source>
         <translation>在英雄选择时将 OP.GG 窗口置顶</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="57"/>
+        <location filename="../../view/setting_interface.py" line="63"/>
         <source>Game Infomation filter</source>
         <translation>对局信息过滤</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="57"/>
+        <location filename="../../view/setting_interface.py" line="63"/>
         <source>Show game modes in Game Infomation interface based on your current game mode</source>
         <translation>基于你所处的游戏模式筛选对局信息界面显示的战绩</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="90"/>
+        <location filename="../../view/setting_interface.py" line="96"/>
         <source>OP.GG HTTP proxy</source>
         <translation>OP.GG HTTP 代理</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="90"/>
+        <location filename="../../view/setting_interface.py" line="96"/>
         <source>Using a proxy when connecting to OP.GG</source>
         <translation>连接 OP.GG 时启用 HTTP 代理</translation>
     </message>
     <message>
-        <location filename="../../view/setting_interface.py" line="228"/>
+        <location filename="../../view/setting_interface.py" line="259"/>
         <source>GitHub HTTP proxy</source>
         <translation>GitHub HTTP 代理</translation>
     </message>
@@ -3256,7 +3301,7 @@ when they are used by Seraphine, which will cost more time</source>
 <context>
     <name>SummonerInfoBar</name>
     <message>
-        <location filename="../../view/search_interface.py" line="802"/>
+        <location filename="../../view/search_interface.py" line="789"/>
         <source>Unranked</source>
         <translation>未定级</translation>
     </message>
@@ -3316,32 +3361,32 @@ when they are used by Seraphine, which will cost more time</source>
 <context>
     <name>TeamView</name>
     <message>
-        <location filename="../../view/search_interface.py" line="630"/>
+        <location filename="../../view/search_interface.py" line="617"/>
         <source>Winner</source>
         <translation>胜方</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="634"/>
+        <location filename="../../view/search_interface.py" line="621"/>
         <source>Loser</source>
         <translation>败方</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="521"/>
+        <location filename="../../view/search_interface.py" line="508"/>
         <source>Tower destroyed</source>
         <translation>摧毁防御塔</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="522"/>
+        <location filename="../../view/search_interface.py" line="509"/>
         <source>Inhibitor destroyed</source>
         <translation>摧毁召唤水晶</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="523"/>
+        <location filename="../../view/search_interface.py" line="510"/>
         <source>Baron Nashor killed</source>
         <translation>击杀男爵</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="524"/>
+        <location filename="../../view/search_interface.py" line="511"/>
         <source>Dragon killed</source>
         <translation>击杀巨龙</translation>
     </message>
@@ -3351,27 +3396,27 @@ when they are used by Seraphine, which will cost more time</source>
         <translation type="obsolete">击杀峡谷先锋</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="539"/>
+        <location filename="../../view/search_interface.py" line="526"/>
         <source>Minions killed</source>
         <translation>小兵及野怪击杀</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="540"/>
+        <location filename="../../view/search_interface.py" line="527"/>
         <source>Gold earned</source>
         <translation>获取金钱</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="541"/>
+        <location filename="../../view/search_interface.py" line="528"/>
         <source>Damage dealed to champions</source>
         <translation>对英雄造成伤害</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="442"/>
+        <location filename="../../view/search_interface.py" line="429"/>
         <source>Bans</source>
         <translation>禁用英雄</translation>
     </message>
     <message>
-        <location filename="../../view/search_interface.py" line="525"/>
+        <location filename="../../view/search_interface.py" line="512"/>
         <source>Rift Herald / Horde killed</source>
         <translation>击杀峡谷先锋 / 虚空巢虫</translation>
     </message>
@@ -3379,17 +3424,17 @@ when they are used by Seraphine, which will cost more time</source>
 <context>
     <name>TeammateInfoBar</name>
     <message>
-        <location filename="../../view/career_interface.py" line="672"/>
+        <location filename="../../view/career_interface.py" line="690"/>
         <source>Total: </source>
         <translation>总：</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="674"/>
+        <location filename="../../view/career_interface.py" line="692"/>
         <source>Wins: </source>
         <translation>胜：</translation>
     </message>
     <message>
-        <location filename="../../view/career_interface.py" line="676"/>
+        <location filename="../../view/career_interface.py" line="694"/>
         <source>Losses: </source>
         <translation>负：</translation>
     </message>
@@ -3425,47 +3470,47 @@ when they are used by Seraphine, which will cost more time</source>
 <context>
     <name>ToolsTranslator</name>
     <message>
-        <location filename="../../lol/tools.py" line="33"/>
+        <location filename="../../lol/tools.py" line="36"/>
         <source>TOP</source>
         <translation>上路</translation>
     </message>
     <message>
-        <location filename="../../lol/tools.py" line="34"/>
+        <location filename="../../lol/tools.py" line="37"/>
         <source>JUG</source>
         <translation>打野</translation>
     </message>
     <message>
-        <location filename="../../lol/tools.py" line="35"/>
+        <location filename="../../lol/tools.py" line="38"/>
         <source>MID</source>
         <translation>中路</translation>
     </message>
     <message>
-        <location filename="../../lol/tools.py" line="36"/>
+        <location filename="../../lol/tools.py" line="39"/>
         <source>BOT</source>
         <translation>下路</translation>
     </message>
     <message>
-        <location filename="../../lol/tools.py" line="37"/>
+        <location filename="../../lol/tools.py" line="40"/>
         <source>SUP</source>
         <translation>辅助</translation>
     </message>
     <message>
-        <location filename="../../lol/tools.py" line="47"/>
+        <location filename="../../lol/tools.py" line="50"/>
         <source>Ranked Solo</source>
         <translation>单 / 双排</translation>
     </message>
     <message>
-        <location filename="../../lol/tools.py" line="48"/>
+        <location filename="../../lol/tools.py" line="51"/>
         <source>Ranked Flex</source>
         <translation>灵活排位</translation>
     </message>
     <message>
-        <location filename="../../lol/tools.py" line="50"/>
+        <location filename="../../lol/tools.py" line="53"/>
         <source>Unranked</source>
         <translation>未定级</translation>
     </message>
     <message>
-        <location filename="../../lol/tools.py" line="51"/>
+        <location filename="../../lol/tools.py" line="54"/>
         <source>Unknown</source>
         <translation>未知</translation>
     </message>
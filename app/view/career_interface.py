@@ -22,6 +22,7 @@ from app.common.icons import Icon
 from app.common.signals import signalBus
 from app.common.config import cfg
 from app.lol.connector import connector
+from app.lol.request import TaskScope
 from app.lol.tools import (parseGames, parseSummonerData,
                            getRecentTeammates, parseDetailRankInfo, SERVERS_NAME, SERVERS_SUBSET)
 from ..components.seraphine_interface import SeraphineInterface
@@ -94,7 +95,8 @@ class CareerInterface(SeraphineInterface):
 
         self.games = []
 
-        self.loadGamesTask = None
+        # 当前查看的人的请求与解析, 换人时全部取消
+        self.scope = TaskScope()
 
         self.__initWidget()
         self.__initLayout()
@@ -383,6 +385,9 @@ class CareerInterface(SeraphineInterface):
         # 不能同时为空
         assert summoner or puuid
 
+        # 上一个人还没加载完就换了人, 它的请求与解析就不用再跑了
+        self.scope.cancel()
+
         self.setLoadingPageEnabled(True)
         self.recentTeammatesInfo = None
 
@@ -390,10 +395,12 @@ class CareerInterface(SeraphineInterface):
             self.recentTeammatesFlyout.close()
             self.recentTeammatesFlyout = None
 
-        if summoner is None:
-            summoner = await connector.getSummonerByPuuid(puuid)
+        info = await self.scope.run(self.__loadSummonerData(puuid, summoner))
 
-        if 'errorCode' in summoner:
+        if info is None:
+            return
+
+        if 'errorCode' in info:
             InfoBar.error(self.tr("Get summoner infomation error"),
                           self.tr("The server returned abnormal content."),
                           orient=Qt.Vertical,
@@ -404,13 +411,24 @@ class CareerInterface(SeraphineInterface):
             self.setLoadingPageEnabled(False)
             return
 
-        self.loadGamesTask = asyncio.create_task(
+        await self.repaintInterface(info)
+
+    async def __loadSummonerData(self, puuid, summoner):
+        '''
+        @return: `parseSummonerData()` 的结果; 查不到召唤师时返回带 `errorCode` 的 `summoner`
+        '''
+        if summoner is None:
+            summoner = await connector.getSummonerByPuuid(puuid)
+
+        if 'errorCode' in summoner:
+            return summoner
+
+        gamesTask = self.scope.spawn(
             connector.getSummonerGamesByPuuid(summoner['puuid'], 0, cfg.get(cfg.careerGamesNumber) - 1))
-        rankTask = asyncio.create_task(
+        rankTask = self.scope.spawn(
             connector.getRankedStatsByPuuid(summoner['puuid']))
 
-        info = await parseSummonerData(summoner, rankTask, self.loadGamesTask)
-        await self.repaintInterface(info)
+        return await parseSummonerData(summoner, rankTask, gamesTask)
 
     async def repaintInterface(self, info):
         name = info['name'] if info['isPublic'] else f"{info['name']}🔒"
@@ -497,7 +515,7 @@ class CareerInterface(SeraphineInterface):
         self.setLoadingPageEnabled(False)
 
         if self.games:
-            asyncio.create_task(self.__updateRecentTeammates())
+            self.scope.spawn(self.__updateRecentTeammates())
 
     def __updateGameInfo(self):
         for i in reversed(range(self.gameInfoLayout.count())):
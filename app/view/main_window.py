@@ -34,6 +34,8 @@ from app.common.icons import Icon
 from app.common.config import cfg, VERSION, BETA
 from app.common.logger import logger
 from app.common.signals import signalBus
+from app.common.session import sessionFactory
+from app.common.trace import tracer, traced
 from app.components.message_box import (UpdateMessageBox, NoticeMessageBox,
                                         WaitingForLolMessageBox, ExceptionMessageBox,
                                         ChangeDpiMessageBox)
@@ -41,11 +43,12 @@ from app.lol.exceptions import (SummonerGamesNotFound, RetryMaximumAttempts,
                                 SummonerNotFound, SummonerNotInGame, SummonerRankInfoNotFound)
 from app.lol.listener import (LolProcessExistenceListener, StoppableThread)
 from app.lol.connector import connector
+from app.lol.metrics import apiMetrics
+from app.lol.request import requestPriority, CRITICAL
+from app.lol.champ_select import LatestWinsDispatcher, ChampSelectView
 from app.lol.tools import (parseAllyGameInfo, parseGameInfoByGameflowSession,
-                           getAllyOrderByGameRole, getTeamColor, autoBan, autoPick,
-                           autoComplete, autoSwap, autoTrade, ChampionSelection,
-                           SERVERS_NAME, SERVERS_SUBSET, showOpggBuild, autoShow,
-                           autoSetSummonerSpell)
+                           getAllyOrderByGameRole, getTeamColor, ChampionSelection,
+                           SERVERS_NAME, SERVERS_SUBSET, createChampSelectEngine)
 from app.lol.aram import AramBuff
 from app.lol.champions import ChampionAlias
 from app.lol.opgg import opgg
@@ -99,6 +102,14 @@ class MainWindow(FluentWindow):
         self.isTrayExit = False
         self.tasklistEnabled = True
         self.championSelection = ChampionSelection()
+        self.champSelectEngine = self.__createChampSelectEngine()
+
+        # 英雄选择 session 的推送很密集, 处理不过来时只处理最新的一帧
+        self.champSelectDispatcher = LatestWinsDispatcher(
+            self.__onChampSelectChanged, "champSelectChanged")
+
+        # 等待重连阶段发出的重连请求, 阶段一变就取消
+        self.reconnectTask: asyncio.Task = None
 
         self.lastTipsTime = time.time()
         self.lastTipsType = None
@@ -231,7 +242,7 @@ class MainWindow(FluentWindow):
         signalBus.gameStatusChanged.connect(
             self.__onGameStatusChanged)
         signalBus.champSelectChanged.connect(
-            self.__onChampSelectChanged)
+            self.champSelectDispatcher.push)
         signalBus.lcuApiExceptionRaised.connect(
             self.__onShowLcuConnectError)
         signalBus.getCmdlineError.connect(
@@ -566,9 +577,15 @@ class MainWindow(FluentWindow):
     async def __onLolClientEnded(self):
         logger.critical("League of Legends client ended", TAG)
 
-        if self.searchInterface.gameLoadingTask:
-            self.searchInterface.puuid = 0
-            self.searchInterface.gameLoadingTask = None
+        # 还在跑的查询与解析都是上一个客户端的, 全部取消
+        self.searchInterface.scope.cancel()
+        self.searchInterface.detailScope.cancel()
+        self.searchInterface.puuid = 0
+        self.careerInterface.scope.cancel()
+
+        if self.reconnectTask:
+            self.reconnectTask.cancel()
+            self.reconnectTask = None
 
         await connector.close()
         await opgg.close()
@@ -742,6 +759,7 @@ class MainWindow(FluentWindow):
         if not cfg.get(cfg.enableCloseToTray) or self.isTrayExit:
             self.__terminateListeners()
             self.opggWindow.close()
+            await sessionFactory.close()
 
             cfg.set(cfg.windowSize, self.windowSize)
 
@@ -789,27 +807,33 @@ class MainWindow(FluentWindow):
         elif status == 'ChampSelect':
             title = self.tr("Selecting Champions")
 
-            # 在标题添加所处队伍
-            side = await connector.getMapSide()
-            if side:
-                if side == 'blue':
-                    mapSide = self.tr("Blue Team")
-                else:
-                    mapSide = self.tr("Red Team")
+            # 从进入英雄选择到五个队友全部画出来的总耗时
+            with tracer.span("champSelect", log=True), requestPriority(CRITICAL):
+                # 在标题添加所处队伍
+                side = await connector.getMapSide()
+                if side:
+                    if side == 'blue':
+                        mapSide = self.tr("Blue Team")
+                    else:
+                        mapSide = self.tr("Red Team")
 
-                title = title + " - " + mapSide
+                    title = title + " - " + mapSide
 
-            await self.__onChampionSelectBegin()
+                await self.__onChampionSelectBegin()
         elif status == 'GameStart':
             title = self.tr("Gaming")
-            await self.__onGameStart()
+
+            with tracer.span("gameStart", log=True):
+                await self.__onGameStart()
+
             isGaming = True
         elif status == 'InProgress':
             title = self.tr("Gaming")
 
             # 重连或正常进入游戏 (走 GameStart), 不需要更新数据
             if not self.isGaming:
-                await self.__onGameStart()
+                with tracer.span("gameStart", log=True):
+                    await self.__onGameStart()
             isGaming = True
         elif status == 'WaitingForStatus':
             title = self.tr("Waiting for status")
@@ -835,8 +859,15 @@ class MainWindow(FluentWindow):
 
         self.isGaming = isGaming
 
+        # 已经重连上 (Reconnect -> InProgress) 或者离开了这局, 不用再重连
+        if status != "Reconnect" and self.reconnectTask:
+            self.reconnectTask.cancel()
+            self.reconnectTask = None
+
         if status != 'ChampSelect':
             self.opggWindow.setStaysOnTopEnabled(False)
+            self.champSelectDispatcher.reset()
+            self.champSelectEngine.reset()
 
         if title != None:
             self.setWindowTitle("Seraphine - " + title)
@@ -848,6 +879,8 @@ class MainWindow(FluentWindow):
         async def accept():
             timeDelay = cfg.get(cfg.autoAcceptMatchingDelay)
             await asyncio.sleep(timeDelay)
+
+            # 等待期间的变化 (如手动拒绝) 由 websocket 推送, 断开时才去请求
             status = await connector.getReadyCheckStatus()
 
             if status.get("errorCode"):
@@ -856,19 +889,28 @@ class MainWindow(FluentWindow):
             if not status['playerResponse'] == 'Declined':
                 await connector.acceptMatchMaking()
 
-        asyncio.create_task(accept())
+        with requestPriority(CRITICAL):
+            asyncio.create_task(accept())
 
     async def __onReconnect(self):
+        """
+        进入等待重连阶段时发重连请求, 重连上之后 gameflow 阶段的推送会取消它
+
+        掉线立刻重连会无效, 所以先等一下; 一直没有等到阶段变化时再退避着重试几次
+        """
         if not cfg.get(cfg.enableAutoReconnect):
             return
 
+        if self.reconnectTask and not self.reconnectTask.done():
+            return
+
         async def reconnect():
-            while await connector.getGameStatus() == "Reconnect":
-                # 掉线立刻重连会无效
-                await asyncio.sleep(.3)
+            for delay in (.3, 1., 3., 5.):
+                await asyncio.sleep(delay)
                 await connector.reconnect()
 
-        asyncio.create_task(reconnect())
+        with requestPriority(CRITICAL):
+            self.reconnectTask = asyncio.create_task(reconnect())
 
     # 进入英雄选择界面时触发
     async def __onChampionSelectBegin(self):
@@ -893,28 +935,35 @@ class MainWindow(FluentWindow):
 
         currentSummonerId = self.currentSummoner['summonerId']
         info = await parseAllyGameInfo(cSession, currentSummonerId, queueId, useSGP=True)
-        self.gameInfoInterface.updateAllySummoners(info)
 
-    # 英雄选择时，英雄改变 / 楼层改变时触发
-    @asyncSlot(dict)
-    async def __onChampSelectChanged(self, data):
-        data = data['data']
+        with tracer.span("updateAllySummoners"):
+            self.gameInfoInterface.updateAllySummoners(info)
 
-        phase = {
-            'PLANNING': [autoSetSummonerSpell, autoShow],
-            'BAN_PICK': [autoSetSummonerSpell, autoBan, autoPick, autoComplete, autoSwap, showOpggBuild],
-            'FINALIZATION': [autoSetSummonerSpell, autoTrade, showOpggBuild],
-        }
+        # 队友信息加载完之前收到的推送没能更新头像和楼层, 这里用最新的一帧补上
+        if view := self.champSelectEngine.view:
+            await self.__updateAllyTeam(view)
 
-        for func in phase.get(data['timer']['phase'], []):
-            if await func(data, self.championSelection):
-                break
+    def __createChampSelectEngine(self):
+        engine = createChampSelectEngine(self.championSelection)
+
+        engine.addWatcher(self.__updateAllyTeam,
+                          lambda view: view.teamKey())
+
+        return engine
 
+    # 英雄选择时，英雄改变 / 楼层改变时触发
+    # 由 `self.champSelectDispatcher` 调用, 同一时间只会有一个在跑
+    async def __onChampSelectChanged(self, data):
+        # 自动禁用 / 选择 / 锁定等都在这里发出, 在期限 task 里的也会继承优先级
+        with requestPriority(CRITICAL):
+            await self.champSelectEngine.update(data['data'])
+
+    async def __updateAllyTeam(self, view: ChampSelectView):
         # 更新头像
-        await self.gameInfoInterface.updateAllyIcon(data['myTeam'])
+        await self.gameInfoInterface.updateAllyIcon(view.myTeam)
 
         # 更新楼层顺序
-        self.gameInfoInterface.updateAllySummonersOrder(data['myTeam'])
+        self.gameInfoInterface.updateAllySummonersOrder(view.myTeam)
 
     # 进入游戏后触发
     async def __onGameStart(self):
@@ -926,6 +975,7 @@ class MainWindow(FluentWindow):
             return
 
         # 如果是进游戏后开的软件，需要先把友方信息更新上去
+        @traced()
         async def paintAllySummonersInfo():
             # TODO 自定义时, 若队伍成员<5, 会触发重新加载导致性能浪费
             if self.gameInfoInterface.allyChampions and len(self.gameInfoInterface.allyChampions) >= 5:
@@ -940,15 +990,18 @@ class MainWindow(FluentWindow):
             self.gameInfoInterface.summonersView.ally.clear()
             self.gameInfoInterface.allyGamesView.clear()
 
-            self.gameInfoInterface.updateAllySummoners(info)
+            with tracer.span("updateAllySummoners"):
+                self.gameInfoInterface.updateAllySummoners(info)
 
         # 将敌方的召唤师基本信息绘制上去
+        @traced()
         async def paintEnemySummonersInfo():
             info = await parseGameInfoByGameflowSession(
                 session, currentSummonerId, 'enemy', useSGP=True)
 
             # 这个 info 是已经按照游戏位置排序过的了（若排位）
-            self.gameInfoInterface.updateEnemySummoners(info)
+            with tracer.span("updateEnemySummoners"):
+                self.gameInfoInterface.updateEnemySummoners(info)
 
         # 更新己方召唤师楼层顺序至角色顺序
         async def sortAllySummonersByGameRole():
@@ -1052,6 +1105,21 @@ class MainWindow(FluentWindow):
         for call in connector.callStack:
             logger.error(call, "Crash")
 
+        logger.error(f"retry stats: {connector.retryStats.getStats()}", "Crash")
+        logger.error(f"single flight stats: {connector.singleFlight.getStats()}", "Crash")
+        logger.error(f"profile cache stats: {connector.profileCache.getStats()}", "Crash")
+        logger.error(f"client state stats: {connector.state.getStats()}", "Crash")
+        logger.error(f"match history stats: {connector.matchHistory.getStats()}", "Crash")
+
+        if connector.scheduler:
+            logger.error(f"request scheduler: {connector.scheduler.getStats()}", "Crash")
+
+        logger.error(f"api metrics:\n{apiMetrics.dump()}", "Crash")
+        logger.error(
+            f"champ select dispatcher: {self.champSelectDispatcher.getStats()}", "Crash")
+        logger.error(
+            f"champ select engine: {self.champSelectEngine.getStats()}", "Crash")
+
         logger.error(str(self.searchInterface), "Crash")
         logger.error(str(self.gameInfoInterface), "Crash")
         logger.error(str(self.careerInterface), "Crash")
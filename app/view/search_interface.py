@@ -29,28 +29,15 @@ from app.components.summoner_name_button import SummonerName
 from app.components.animation_frame import ColorAnimationFrame, CardWidget
 from app.components.color_label import ColorLabel, DeathsLabel
 from app.lol.connector import connector
+from app.lol.request import TaskScope, requestPriority, BACKGROUND
 from app.lol.exceptions import SummonerGamesNotFound, SummonerNotFound
-from app.lol.tools import parseGameData, parseGameDetailData, parseGamesDataConcurrently
+from app.lol.tools import parseGameDetailData, parseGamesDataConcurrently
 from ..components.seraphine_interface import SeraphineInterface
 
 
 TAG = "SearchInterface"
 
 
-def asyncLockDecorator(lockName):
-    """
-    给任何一个方法加锁, return时释放
-    args[0]是self, 通过getattr找到lockName
-    """
-    def decorator(func):
-        async def wrapper(*args, **kwargs):
-            lock = getattr(args[0], lockName)
-            async with lock:
-                return await func(*args, **kwargs)
-        return wrapper
-    return decorator
-
-
 class GamesTab(QFrame):
     tabClicked = pyqtSignal(str)
     gameDetailReady = pyqtSignal(dict)
@@ -1120,7 +1107,10 @@ class SearchInterface(SeraphineInterface):
         super().__init__(parent)
 
         self.puuid = 0
-        self.gameLoadingTask: asyncio.Task = None
+
+        # 当前查询的人的请求、解析与后台翻页; 对局详情单独一个, 点别的对局时只取消它
+        self.scope = TaskScope()
+        self.detailScope = TaskScope()
 
         self.vBoxLayout = QVBoxLayout(self)
 
@@ -1132,11 +1122,8 @@ class SearchInterface(SeraphineInterface):
         self.gamesView = GamesView()
         self.currentSummonerName = None
 
-        self.detailViewLoadTask = None
         self.loadingGameId = 0
 
-        self.loadFirstPageLock = asyncio.Lock()
-
         self.__initWidget()
         self.__initLayout()
         self.__connectSignalToSlot()
@@ -1206,13 +1193,24 @@ class SearchInterface(SeraphineInterface):
             parent=self
         )
 
-    # Fix: 超快速的在候选栏选中两次同样puuid会起两个task加载战绩, 100%干掉客户端 -- By Hpero4
-    @asyncLockDecorator('loadFirstPageLock')
     async def searchAndShowFirstPage(self, puuid=None):
         name = self.searchLineEdit.text()
         if name == "":
             return False
 
+        # NOTE 如果是生涯和搜索反复横跳, 就不重新启 loadgames 任务了
+        # 否则 (包括超快速地选中两次同一个人) 之前那次还没跑完的请求、解析与翻页全部取消
+        reload = puuid != self.puuid
+
+        if reload:
+            self.scope.cancel()
+
+            if self.detailScope.cancel():
+                self.gamesView.gameDetailView.setLoadingPageEnabled(False)
+
+        return bool(await self.scope.run(self.__searchAndShowFirstPage(name, reload)))
+
+    async def __searchAndShowFirstPage(self, name, reload):
         if re.match(r"\S+-\S+-\S+-\S+-\S+", name):
             summoner = await connector.getSummonerByPuuid(name)
         else:
@@ -1229,15 +1227,7 @@ class SearchInterface(SeraphineInterface):
 
         self.gamesView.gameDetailView.clear()
 
-        # NOTE 如果是生涯和搜索反复横跳, 就不重新启 loadgames 任务了
-        if puuid != self.puuid:
-            if self.gameLoadingTask:
-                self.gameLoadingTask.cancel()
-
-                while not self.gameLoadingTask.cancelled() \
-                        and not self.gameLoadingTask.done():
-                    await asyncio.sleep(.3)
-
+        if reload:
             self.puuid = summoner['puuid']
             self.gamesView.gamesTab.clear()
 
@@ -1259,10 +1249,9 @@ class SearchInterface(SeraphineInterface):
             self.gamesView.gamesTab.updateQueueIdMap(games)
 
             # 启动任务，往 gamesTab 里丢数据
-            # NOTE 既然创建新任务, 并且刷新了self.puuid 就应该用self的, 否则就违背了loadGames判断的初衷
-
-            self.gameLoadingTask = asyncio.create_task(
-                self.__loadGames(self.puuid))
+            # 后台翻页的请求会给详情、生涯等界面上的请求让行
+            with requestPriority(BACKGROUND):
+                self.scope.spawn(self.__loadGames(self.puuid))
 
         self.gamesView.gamesTab.showTheFirstPage()
         self.gamesView.setLoadingPageEnable(False)
@@ -1316,26 +1305,10 @@ class SearchInterface(SeraphineInterface):
         begIdx = 20
         endIdx = 29
 
-        logger.debug(f"welcome load games task: {puuid}", TAG)
-
-        # NOTE 换了查询目标, 若之前正在查, 先等 task 被 release 掉 -- By Hpero4
-        while self.gameLoadingTask \
-                and not self.gameLoadingTask.done() \
-                and puuid != self.puuid:
-            await asyncio.sleep(.2)
-
         logger.debug(f"start load {puuid}", TAG)
-        # 连续查多个人时, 将前面正在查的task给release掉
-        while self.puuid == puuid:
-            # 为加载战绩详情让行
-            while (
-                (self.detailViewLoadTask and not self.detailViewLoadTask.done())
-                or
-                (self.window().careerInterface.loadGamesTask and not self.window(
-                ).careerInterface.loadGamesTask.done())
-            ):
-                await asyncio.sleep(.2)
 
+        # 换了查询目标时整个 task 会被 `self.scope` 取消
+        while True:
             t1 = time.time()
             try:
                 games = await connector.getSummonerGamesByPuuidSlowly(
@@ -1348,18 +1321,14 @@ class SearchInterface(SeraphineInterface):
             t2 = time.time()
 
             logger.debug(
-                f"load games {self.puuid} [{begIdx}-{endIdx}] finish {t2-t1}s", TAG)
+                f"load games {puuid} [{begIdx}-{endIdx}] finish {t2-t1}s", TAG)
             # 1000 局搜完了，或者正好上一次就是最后
-            # 在切换了puuid时, 就不要再把数据刷到Games上了 -- By Hpero4
-            if games['gameCount'] == 0 or self.puuid != puuid:
+            if games['gameCount'] == 0:
                 return
 
             # 处理数据，交给 gamesTab，更新其 games 成员以及 queueIdMap
             games = await parseGamesDataConcurrently(games['games'])
 
-            if self.puuid != puuid:
-                return
-
             self.gamesView.gamesTab.updateQueueIdMap(games)
 
             # 如果用户下一页点得太猛，在还没加载完的时候点到了能绘制的最后一页
@@ -1403,22 +1372,24 @@ class SearchInterface(SeraphineInterface):
         if True:
             self.gamesView.gameDetailView.setLoadingPageEnabled(True)
 
-        # NOTE self.detailViewLoadTask 用于标记详情正在加载, self.loadGame会为其让行 -- By Hpero4
-        self.detailViewLoadTask = asyncio.create_task(
-            connector.getGameDetailByGameId(gameId))
-        game = await self.detailViewLoadTask
+        # 还没加载完就点了别的对局, 或者换了搜索对象, 之前的就不用再加载了
+        self.detailScope.cancel()
+        game = await self.detailScope.run(
+            self.__loadGameDetail(gameId, puuid), default=False)
 
-        # 加载GameDetail的过程中, 切换了搜索对象(self.puuid变更), 将后续任务pass -- By Hpero4
-        if puuid == self.puuid:
-            self.detailViewLoadTask = asyncio.create_task(
-                parseGameDetailData(puuid, game))
-            game = await self.detailViewLoadTask
-            self.gamesView.gameDetailView.updateGame(game)
+        if game is False:
+            return
+
+        self.gamesView.gameDetailView.updateGame(game)
 
         # if cfg.get(cfg.showTierInGameInfo):
         if True:
             self.gamesView.gameDetailView.setLoadingPageEnabled(False)
 
+    async def __loadGameDetail(self, gameId, puuid):
+        game = await connector.getGameDetailByGameId(gameId)
+        return await parseGameDetailData(puuid, game)
+
     @asyncSlot(int)
     async def __onFilterComboxChanged(self, index):
         self.gamesView.gameDetailView.clear()
@@ -1,5 +1,6 @@
 # coding:utf-8
 import os
+import time
 
 from app.common.qfluentwidgets import (SettingCardGroup, SwitchSettingCard, ComboBoxSettingCard,
                                        PushSettingCard, ExpandLayout, InfoBar,
@@ -10,15 +11,20 @@ from PyQt5.QtGui import QDesktopServices
 from PyQt5.QtWidgets import QWidget, QLabel, QFileDialog
 
 from app.common.icons import Icon
+from app.common.signals import signalBus
 from app.common.config import (cfg, YEAR, AUTHOR, VERSION, FEEDBACK_URL, GITHUB_URL, isWin11,
                                BETA)
 from app.common.style_sheet import StyleSheet
+from app.common.trace import tracer
 from app.components.seraphine_interface import SeraphineInterface
 from app.components.setting_cards import (LineEditSettingCard, GameTabColorSettingCard,
                                           LooseSwitchSettingCard, ProxySettingCard,
                                           DeathsNumberColorSettingCard, ThemeColorSettingCard,
                                           QueueFilterCard)
 from app.components.message_box import MultiPathSettingMsgBox
+from app.lol.assets import assetStore
+from app.lol.connector import connector
+from app.lol.metrics import apiMetrics
 
 
 class SettingInterface(SeraphineInterface):
@@ -132,6 +138,22 @@ class SettingInterface(SeraphineInterface):
         self.viewLogCard.button.setStyleSheet(
             "QPushButton {padding-left: 0; padding-right: 0;}")
 
+        self.dumpMetricsCard = PushSettingCard(
+            self.tr("Export"), Icon.TEXTCHECK, self.tr("API statistics"),
+            self.tr("Export latency, error and retry statistics of LCU / SGP requests to the log directory"),
+            self.logGroup)
+        self.dumpMetricsCard.button.setFixedWidth(100)
+        self.dumpMetricsCard.button.setStyleSheet(
+            "QPushButton {padding-left: 0; padding-right: 0;}")
+
+        self.dumpTraceCard = PushSettingCard(
+            self.tr("Export"), Icon.PAGE, self.tr("Timing trace"),
+            self.tr("Export recent champ select / game start timings as Chrome trace and speedscope files to the log directory"),
+            self.logGroup)
+        self.dumpTraceCard.button.setFixedWidth(100)
+        self.dumpTraceCard.button.setStyleSheet(
+            "QPushButton {padding-left: 0; padding-right: 0;}")
+
         self.enableStartLolWithApp = SwitchSettingCard(
             Icon.CIRCLERIGHT,
             self.tr("Auto-start LOL"),
@@ -144,6 +166,15 @@ class SettingInterface(SeraphineInterface):
             tr("Delete all game resources (Apply it when game resources update)"
                ), self.generalGroup)
 
+        self.assetsWarmUpContent = self.tr(
+            "Download all champion, item, spell and rune icons in background after connecting to the client")
+        self.assetsWarmUpCard = SwitchSettingCard(
+            Icon.UPDATE,
+            self.tr("Prefetch game resources"),
+            self.assetsWarmUpContent,
+            configItem=cfg.enableAssetsWarmUp,
+            parent=self.generalGroup)
+
         self.deleteResourceCard.button.setFixedWidth(100)
         self.deleteResourceCard.button.setStyleSheet(
             "QPushButton {padding-left: 0; padding-right: 0;}")
@@ -285,11 +316,14 @@ class SettingInterface(SeraphineInterface):
         self.generalGroup.addSettingCard(self.lolFolderCard)
         self.generalGroup.addSettingCard(self.enableStartLolWithApp)
         self.generalGroup.addSettingCard(self.deleteResourceCard)
+        self.generalGroup.addSettingCard(self.assetsWarmUpCard)
         self.generalGroup.addSettingCard(self.enableCloseToTray)
         self.generalGroup.addSettingCard(self.silentCard)
 
         self.logGroup.addSettingCard(self.logLevelCard)
         self.logGroup.addSettingCard(self.viewLogCard)
+        self.logGroup.addSettingCard(self.dumpMetricsCard)
+        self.logGroup.addSettingCard(self.dumpTraceCard)
 
         self.personalizationGroup.addSettingCard(self.micaCard)
         self.personalizationGroup.addSettingCard(self.themeCard)
@@ -332,6 +366,44 @@ class SettingInterface(SeraphineInterface):
         self.viewLogCard.clicked.connect(
             lambda: os.system(f'explorer {os.getcwd()}\\log')
         )
+        self.dumpMetricsCard.clicked.connect(self.__onDumpMetricsCardClicked)
+        self.dumpTraceCard.clicked.connect(self.__onDumpTraceCardClicked)
+        signalBus.assetsWarmUpProgress.connect(self.__onAssetsWarmUpProgress)
+
+    def __onDumpMetricsCardClicked(self):
+        path = os.path.join(
+            os.getcwd(), 'log', f"api_metrics_{time.strftime('%Y%m%d_%H%M%S')}.txt")
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(apiMetrics.dump(connector.retryStats.getStats(), {
+                'connector': connector.singleFlight.getStats(),
+                'assets': assetStore.singleFlight.getStats(),
+            }))
+
+        InfoBar.success(self.tr("Exported successfully"),
+                        path,
+                        duration=3000,
+                        parent=self)
+
+    def __onDumpTraceCardClicked(self):
+        path = os.path.join(
+            os.getcwd(), 'log', f"trace_{time.strftime('%Y%m%d_%H%M%S')}")
+
+        tracer.export(f"{path}.json", "chrome")
+        tracer.export(f"{path}.speedscope.json", "speedscope")
+
+        InfoBar.success(self.tr("Exported successfully"),
+                        f"{path}.json",
+                        duration=3000,
+                        parent=self)
+
+    def __onAssetsWarmUpProgress(self, done, total):
+        if done < total:
+            content = self.tr("Downloading game resources: ") + f"{done} / {total}"
+        else:
+            content = self.assetsWarmUpContent
+
+        self.assetsWarmUpCard.setContent(content)
 
     def __onLolFolderCardClicked(self):
         current = cfg.get(cfg.lolFolder)
@@ -371,6 +443,8 @@ class SettingInterface(SeraphineInterface):
 
                 os.remove(filePath)
 
+        assetStore.reindex()
+
     def __showFlyout(self):
         view = TeachingTipView(
             title=self.tr("Really?"),
@@ -0,0 +1,148 @@
+"""
+JSON 解码 micro-benchmark, 对比 `app/common/decoder.py` 中各个可用后端
+
+用法 (在仓库根目录下):
+
+    python benchmark/bench_json.py
+    python benchmark/bench_json.py --recording ws.rec            # 额外测试录制下来的 websocket 帧
+    python benchmark/bench_json.py --payloads path/to/recorded   # 额外测试录制下来的 *.json
+
+fixtures.py 生成的数据 (SGP 战绩页、对局详情、英雄选择推送等) 只有结构和真实的一样,
+字段取值、字符串长度和真实数据有出入, 结果只能当作参考; 要判断快速解码器值不值得,
+用 `--recording` 测真实录制的帧 (录制方法见 ws_replay.py), 帧按原始文本解码, 不经过重新编码
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.common.decoder import JsonDecoder  # noqa: E402
+from app.lol.recording import loadRecording  # noqa: E402
+from benchmark import fixtures  # noqa: E402
+
+
+def builtinPayloads():
+    players = fixtures.makePlayers()
+
+    return {
+        "sgp SUMMARY page (20 games)": fixtures.sgpSummaryPage(players[0]['puuid']),
+        "lcu match history (20 games)": fixtures.lcuMatchHistory(players[0]['puuid']),
+        "lcu game detail": fixtures.lcuGame(8000000000, players),
+        "lcu ranked stats": fixtures.rankedStats(players[0]['puuid']),
+        "ws champ-select session": fixtures.wsEvent(
+            "/lol-champ-select/v1/session", fixtures.champSelectSession(players)),
+        "ws gameflow session": fixtures.wsEvent(
+            "/lol-gameflow/v1/session", fixtures.gameflowSession(players)),
+    }
+
+
+def recordedPayloads(folder):
+    res = {}
+
+    for path in sorted(glob.glob(os.path.join(folder, "**", "*.json"), recursive=True)):
+        with open(path, encoding='utf-8') as f:
+            res[os.path.relpath(path, folder)] = json.load(f)
+
+    return res
+
+
+def recordingFrames(path, top=8):
+    """
+    把录制的帧按 uri 分组, 取总字节数最多的 `top` 组, 再加上全部帧一组
+
+    @return: {名称: [原始文本, ...]}
+    """
+    _, frames = loadRecording(path)
+    groups = {}
+
+    for _, raw in frames:
+        try:
+            uri = json.loads(raw)[2]['uri']
+        except (ValueError, LookupError, TypeError):
+            uri = "(other)"
+
+        groups.setdefault(uri, []).append(raw)
+
+    def size(raws):
+        return sum(len(raw) for raw in raws)
+
+    names = sorted(groups, key=lambda uri: size(groups[uri]), reverse=True)[:top]
+
+    res = {f"ws {uri}": groups[uri] for uri in names}
+    res["ws (all frames)"] = [raw for _, raw in frames]
+
+    return res
+
+
+def measure(loads, raws, number):
+    """
+    @return: 把 `raws` 整组解码一遍的耗时 (秒)
+    """
+    def loadsAll():
+        for raw in raws:
+            loads(raw)
+
+    return min(timeit.repeat(loadsAll, number=number, repeat=5)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--payloads", help="folder of recorded *.json payloads")
+    parser.add_argument("--recording", help="websocket recording made with SERAPHINE_WS_RECORD")
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    payloads = builtinPayloads()
+    if args.payloads:
+        payloads.update(recordedPayloads(args.payloads))
+
+    decoder = JsonDecoder()
+    backends = decoder.getAvailable()
+
+    print(f"backends: {', '.join(backends)}")
+    print()
+
+    header = f"{'payload':<34} {'KB':>8}" + \
+        "".join(f" {name + ' us':>12}" for name in backends)
+    if len(backends) > 1:
+        header += f" {'speedup':>8}"
+
+    print(header)
+
+    def report(name, raws):
+        """
+        @param raws: 一组原始文本, 耗时为整组解码一遍的时间
+        """
+        expected = [json.loads(raw) for raw in raws]
+
+        times = []
+        for backend in backends:
+            decoder.use(backend)
+            assert [decoder.loads(raw) for raw in raws] == expected
+            times.append(measure(decoder.loads, raws, args.number))
+
+        size = sum(len(raw.encode('utf-8')) for raw in raws)
+        line = f"{name:<34} {size / 1024:>8.1f}" + \
+            "".join(f" {t * 1e6:>12.1f}" for t in times)
+        if len(backends) > 1:
+            line += f" {times[-1] / min(times[:-1]):>7.1f}x"
+
+        print(line)
+
+    for name, payload in payloads.items():
+        # 和线上一致: websocket 收到的是 str, http 响应解码前也会先转成 str
+        report(name, [json.dumps(payload, ensure_ascii=False)])
+
+    if args.recording:
+        print()
+        for name, raws in recordingFrames(args.recording).items():
+            report(name[:34], raws)
+
+
+if __name__ == "__main__":
+    main()
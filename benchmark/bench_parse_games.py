@@ -0,0 +1,193 @@
+"""
+对比改动前后战绩页的解析耗时: 改动前 (逐局依次查图标, 每次都 `os.path.exists`, 同步写文件)
+与现在 (整页去重后一起查, 经过 `AssetStore`)
+
+两边跑的都是各自目录树里原本的代码, 改动前的用 git worktree 检出:
+
+    git worktree add ../seraphine-base <改动前的提交>
+    python benchmark/standin_server.py --app-port=2999 --remoting-auth-token=seraphine \
+        --rso_platform_id=HN1
+    python benchmark/bench_parse_games.py --standin-pid <pid> --baseline-tree ../seraphine-base
+
+每个目录树在单独的进程里跑 (两边都有 `app` 包), 数据为 fixtures.py 生成的
+20 局 LCU 战绩与 20 局 SGP 战绩:
+
+- cold: 清空图标目录后解析一次, 图标都要从替身服务器下载, 相当于第一次打开或删除缓存之后
+- warm: 图标都已经在本地时的耗时, 也就是翻页、查队友时最常见的情况
+
+注意 cold 会清空两个目录树下 `app/resource/game` 中的英雄、装备、技能、符文图标
+(和设置里的 "删除缓存" 一样, 用到时会重新下载)
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+
+ICON_FOLDERS = ["champion icons", "item icons", "rune icons", "summoner spell icons"]
+
+
+def loadBenchModule(name):
+    """
+    直接从本目录加载, 不经过 `benchmark` 包, 免得和被测的目录树混在一起
+    """
+    spec = importlib.util.spec_from_file_location(name, os.path.join(BENCH_DIR, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def clearIcons():
+    for folder in ICON_FOLDERS:
+        path = f"app/resource/game/{folder}"
+
+        if not os.path.exists(path):
+            os.makedirs(path)
+            continue
+
+        for name in os.listdir(path):
+            os.remove(os.path.join(path, name))
+
+    try:
+        from app.lol.assets import assetStore
+    except ImportError:
+        # 改动前没有 AssetStore
+        return
+
+    assetStore.reindex()
+
+
+def getPageParser(tools):
+    """
+    @return: `await parse(games, puuid)`, 用这个目录树里战绩页原本的解析方式
+    """
+    if hasattr(tools, "parseSGPGamesData"):
+        async def parse(games, puuid):
+            if puuid is None:
+                return await tools.parseGamesDataConcurrently(games)
+
+            return await tools.parseSGPGamesData(games, puuid)
+    else:
+        async def parse(games, puuid):
+            if puuid is None:
+                return await tools.parseGamesDataConcurrently(games)
+
+            return await asyncio.gather(
+                *[tools.parseGamesDataFromSGP(game, puuid) for game in games])
+
+    return parse
+
+
+async def runWorker(standinPid, rounds, coldRounds):
+    """
+    在被测目录树下运行, 每个结果输出一行 json
+    """
+    from app.lol.connector import connector
+    from app.lol import tools
+
+    fixtures = loadBenchModule("fixtures")
+    parse = getPageParser(tools)
+
+    await connector.start(standinPid)
+
+    player = fixtures.makePlayers()[0]
+    pages = {
+        'lcu': (fixtures.lcuMatchHistory(player['puuid'])['games']['games'], None),
+        'sgp': (fixtures.sgpSummaryPage(player['puuid'])['games'], player['puuid']),
+    }
+
+    try:
+        for name, (games, puuid) in pages.items():
+            cold = []
+            for _ in range(coldRounds):
+                clearIcons()
+
+                start = time.perf_counter()
+                await parse(games, puuid)
+                cold.append(time.perf_counter() - start)
+
+            warm = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                await parse(games, puuid)
+                warm.append(time.perf_counter() - start)
+
+            for cache, durations in (("cold", cold), ("warm", warm)):
+                print(json.dumps({'page': name, 'cache': cache, 'durations': durations}),
+                      flush=True)
+    finally:
+        await connector.close()
+
+
+def runTree(tree, args):
+    """
+    @return: [{'page', 'cache', 'durations'}, ...]
+    """
+    cmd = [sys.executable, os.path.abspath(__file__), "--worker",
+           "--standin-pid", str(args.standin_pid),
+           "--rounds", str(args.rounds), "--cold-rounds", str(args.cold_rounds)]
+
+    env = dict(os.environ, PYTHONPATH=tree)
+    out = subprocess.run(cmd, cwd=tree, env=env, check=True,
+                         stdout=subprocess.PIPE, universal_newlines=True).stdout
+
+    res = []
+    for line in out.splitlines():
+        if line.startswith("{"):
+            res.append(json.loads(line))
+
+    return res
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--standin-pid", type=int, required=True,
+                        help="pid of a running standin_server.py")
+    parser.add_argument("--baseline-tree",
+                        help="checkout of the commit before the change (git worktree)")
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--cold-rounds", type=int, default=5)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        asyncio.run(runWorker(args.standin_pid, args.rounds, args.cold_rounds))
+        return
+
+    if not args.baseline_tree:
+        parser.error("--baseline-tree is required")
+
+    sys.path.insert(0, ROOT)
+    from benchmark.ws_replay import percentiles
+
+    results = {
+        'baseline': runTree(os.path.abspath(args.baseline_tree), args),
+        'current': runTree(ROOT, args),
+    }
+
+    print(f"{'page':<6} {'cache':<6} {'tree':<10} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+
+    for page in ('lcu', 'sgp'):
+        for cache in ('cold', 'warm'):
+            for tree, rows in results.items():
+                for row in rows:
+                    if row['page'] != page or row['cache'] != cache:
+                        continue
+
+                    durations = row['durations']
+                    p = percentiles(durations)
+
+                    print(f"{page:<6} {cache:<6} {tree:<10} {p[50] * 1000:>8.2f} "
+                          f"{p[95] * 1000:>8.2f} {max(durations) * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
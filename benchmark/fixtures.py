@@ -0,0 +1,637 @@
+"""
+按 LCU / SGP 接口的真实结构生成的测试数据, 供 benchmark 和本地的替身服务器使用
+
+数据由固定的随机种子生成, 每次运行结果一致; 字段名与数量尽量贴近真实返回值,
+这样解码 / 解析的耗时才有参考意义
+"""
+
+import random
+import uuid
+
+AI_PUUID = "00000000-0000-0000-0000-000000000000"
+
+# SGP 对局记录里每个玩家大约有这么多数值型字段
+PARTICIPANT_STAT_FIELDS = [
+    "allInPings", "assistMePings", "baronKills", "basicPings", "bountyLevel",
+    "champExperience", "championTransform", "commandPings", "consumablesPurchased",
+    "damageDealtToBuildings", "damageDealtToObjectives", "damageDealtToTurrets",
+    "damageSelfMitigated", "dangerPings", "detectorWardsPlaced", "doubleKills",
+    "dragonKills", "enemyMissingPings", "enemyVisionPings", "firstBloodAssist",
+    "getBackPings", "goldSpent", "holdPings", "inhibitorKills", "inhibitorTakedowns",
+    "inhibitorsLost", "itemsPurchased", "killingSprees", "largestCriticalStrike",
+    "largestKillingSpree", "largestMultiKill", "longestTimeSpentLiving",
+    "magicDamageDealt", "magicDamageDealtToChampions", "magicDamageTaken",
+    "needVisionPings", "nexusKills", "nexusTakedowns", "nexusLost", "objectivesStolen",
+    "objectivesStolenAssists", "onMyWayPings", "pentaKills", "physicalDamageDealt",
+    "physicalDamageDealtToChampions", "physicalDamageTaken", "pushPings",
+    "quadraKills", "sightWardsBoughtInGame", "spell1Casts", "spell2Casts",
+    "spell3Casts", "spell4Casts", "summoner1Casts", "summoner2Casts",
+    "timeCCingOthers", "timePlayed", "totalAllyJungleMinionsKilled",
+    "totalDamageDealt", "totalDamageShieldedOnTeammates", "totalDamageTaken",
+    "totalEnemyJungleMinionsKilled", "totalHeal", "totalHealsOnTeammates",
+    "totalTimeCCDealt", "totalTimeSpentDead", "totalUnitsHealed", "tripleKills",
+    "trueDamageDealt", "trueDamageDealtToChampions", "trueDamageTaken",
+    "turretKills", "turretTakedowns", "turretsLost", "unrealKills",
+    "visionClearedPings", "visionScore", "visionWardsBoughtInGame",
+    "wardsKilled", "wardsPlaced",
+]
+
+CHAMPION_IDS = list(range(1, 170))
+ITEM_IDS = [0, 1001, 1055, 2003, 3006, 3020, 3031, 3036, 3047, 3071, 3078,
+            3089, 3153, 3157, 3340, 3363, 6672, 6675]
+SPELL_IDS = [1, 3, 4, 6, 7, 11, 12, 14, 21]
+RUNE_IDS = [8005, 8008, 8010, 8021, 8112, 8128, 8214, 8229, 8230, 8351,
+            8360, 8369, 8437, 8439, 8465, 9923]
+STYLE_IDS = [8000, 8100, 8200, 8300, 8400]
+LANES = [("TOP", "SOLO"), ("JUNGLE", "NONE"), ("MIDDLE", "SOLO"),
+         ("BOTTOM", "CARRY"), ("BOTTOM", "SUPPORT")]
+
+TIERS = ["IRON", "BRONZE", "SILVER", "GOLD", "PLATINUM", "EMERALD", "DIAMOND"]
+DIVISIONS = ["I", "II", "III", "IV"]
+
+
+def makePuuid(rng: random.Random):
+    return str(uuid.UUID(int=rng.getrandbits(128)))
+
+
+def makePlayers(seed=0, count=10):
+    """
+    @return: [{'puuid', 'summonerId', 'gameName', 'tagLine', 'profileIcon'}, ...]
+    """
+    rng = random.Random(seed)
+
+    return [{
+        'puuid': makePuuid(rng),
+        'summonerId': rng.randint(10 ** 9, 10 ** 10),
+        'gameName': f"Player{seed}_{i}",
+        'tagLine': str(rng.randint(10000, 99999)),
+        'profileIcon': rng.randint(1, 5000),
+    } for i in range(count)]
+
+
+def makePerks(rng):
+    primary, sub = rng.sample(STYLE_IDS, 2)
+
+    return {
+        'statPerks': {'defense': 5002, 'flex': 5008, 'offense': 5005},
+        'styles': [
+            {'description': 'primaryStyle', 'style': primary, 'selections': [
+                {'perk': rng.choice(RUNE_IDS), 'var1': rng.randint(0, 3000),
+                 'var2': rng.randint(0, 100), 'var3': 0} for _ in range(4)]},
+            {'description': 'subStyle', 'style': sub, 'selections': [
+                {'perk': rng.choice(RUNE_IDS), 'var1': rng.randint(0, 3000),
+                 'var2': 0, 'var3': 0} for _ in range(2)]},
+        ],
+    }
+
+
+def sgpGame(gameId, players, queueId=420, seed=0):
+    """
+    SGP `/match-history-query/v1/products/lol/player/{puuid}/SUMMARY` 里的一局
+    """
+    rng = random.Random(seed * 7919 + gameId)
+    creation = 1700000000000 + gameId * 1000
+    duration = rng.randint(900, 2400)
+    blueWin = rng.random() < .5
+
+    participants = []
+
+    for i, player in enumerate(players):
+        teamId = 100 if i < 5 else 200
+        lane, role = LANES[i % 5]
+        win = blueWin if teamId == 100 else not blueWin
+
+        item = {
+            'puuid': player['puuid'],
+            'summonerId': player['summonerId'],
+            'summonerName': "",
+            'riotIdGameName': player['gameName'],
+            'riotIdTagline': player['tagLine'],
+            'profileIcon': player['profileIcon'],
+            'participantId': i + 1,
+            'teamId': teamId,
+            'championId': rng.choice(CHAMPION_IDS),
+            'championName': "",
+            'champLevel': rng.randint(8, 18),
+            'spell1Id': rng.choice(SPELL_IDS),
+            'spell2Id': rng.choice(SPELL_IDS),
+            'kills': rng.randint(0, 20),
+            'deaths': rng.randint(0, 15),
+            'assists': rng.randint(0, 25),
+            'goldEarned': rng.randint(5000, 20000),
+            'totalMinionsKilled': rng.randint(0, 300),
+            'neutralMinionsKilled': rng.randint(0, 150),
+            'totalDamageDealtToChampions': rng.randint(3000, 60000),
+            'lane': lane,
+            'role': role,
+            'teamPosition': lane,
+            'individualPosition': lane,
+            'win': win,
+            'gameEndedInEarlySurrender': False,
+            'gameEndedInSurrender': False,
+            'teamEarlySurrendered': False,
+            'firstBloodKill': False,
+            'firstTowerKill': False,
+            'subteamPlacement': 0,
+            'playerSubteamId': 0,
+            'perks': makePerks(rng),
+            'challenges': {f"challenge{k}": rng.random() * 100 for k in range(40)},
+            'missions': {f"playerScore{k}": 0 for k in range(12)},
+        }
+
+        for k in range(7):
+            item[f"item{k}"] = rng.choice(ITEM_IDS)
+
+        for field in PARTICIPANT_STAT_FIELDS:
+            item[field] = rng.randint(0, 50000)
+
+        participants.append(item)
+
+    teams = [{
+        'teamId': teamId,
+        'win': blueWin if teamId == 100 else not blueWin,
+        'bans': [{'championId': rng.choice(CHAMPION_IDS), 'pickTurn': k + 1} for k in range(5)],
+        'objectives': {name: {'first': rng.random() < .5, 'kills': rng.randint(0, 5)}
+                       for name in ("baron", "champion", "dragon", "horde",
+                                    "inhibitor", "riftHerald", "tower")},
+    } for teamId in (100, 200)]
+
+    return {
+        'metadata': {
+            'product': "LOL",
+            'tags': [f"q_{queueId}"],
+            'participants': [player['puuid'] for player in players],
+            'timestamp': str(creation),
+            'data_version': "5",
+            'info_type': "lol_match_summary",
+            'match_id': f"HN1_{gameId}",
+        },
+        'json': {
+            'endOfGameResult': "GameComplete",
+            'gameCreation': creation,
+            'gameDuration': duration,
+            'gameEndTimestamp': creation + duration * 1000,
+            'gameId': gameId,
+            'gameMode': "CLASSIC",
+            'gameName': "teambuilder-match",
+            'gameStartTimestamp': creation + 30000,
+            'gameType': "MATCHED_GAME",
+            'gameVersion': "14.20.627.2031",
+            'mapId': 11,
+            'platformId': "HN1",
+            'queueId': queueId,
+            'participants': participants,
+            'teams': teams,
+        },
+    }
+
+
+def sgpSummaryPage(puuid=None, count=20, seed=0):
+    """
+    SGP 战绩一页, 第一个玩家固定为 `puuid`
+    """
+    games = []
+
+    for i in range(count):
+        players = makePlayers(seed * 1000 + i)
+
+        if puuid is not None:
+            players[0]['puuid'] = puuid
+
+        games.append(sgpGame(7000000000 + seed * 1000 + i, players, seed=seed))
+
+    return {'games': games}
+
+
+def lcuGame(gameId, players, queueId=420, seed=0):
+    """
+    LCU `/lol-match-history/v1/games/{gameId}`
+    """
+    rng = random.Random(seed * 104729 + gameId)
+    blueWin = rng.random() < .5
+
+    identities = []
+    participants = []
+
+    for i, player in enumerate(players):
+        teamId = 100 if i < 5 else 200
+        lane, role = LANES[i % 5]
+
+        identities.append({
+            'participantId': i + 1,
+            'player': {
+                'accountId': player['summonerId'],
+                'currentAccountId': player['summonerId'],
+                'currentPlatformId': "HN1",
+                'gameName': player['gameName'],
+                'tagLine': player['tagLine'],
+                'matchHistoryUri': "",
+                'platformId': "HN1",
+                'profileIcon': player['profileIcon'],
+                'puuid': player['puuid'],
+                'summonerId': player['summonerId'],
+                'summonerName': "",
+            },
+        })
+
+        stats = {
+            'participantId': i + 1,
+            'win': blueWin if teamId == 100 else not blueWin,
+            'champLevel': rng.randint(8, 18),
+            'kills': rng.randint(0, 20),
+            'deaths': rng.randint(0, 15),
+            'assists': rng.randint(0, 25),
+            'goldEarned': rng.randint(5000, 20000),
+            'totalMinionsKilled': rng.randint(0, 300),
+            'neutralMinionsKilled': rng.randint(0, 150),
+            'totalDamageDealtToChampions': rng.randint(3000, 60000),
+            'gameEndedInEarlySurrender': False,
+            'gameEndedInSurrender': False,
+            'causedEarlySurrender': False,
+            'earlySurrenderAccomplice': False,
+            'teamEarlySurrendered': False,
+            'subteamPlacement': 0,
+            'playerSubteamId': 0,
+            'perkPrimaryStyle': rng.choice(STYLE_IDS),
+            'perkSubStyle': rng.choice(STYLE_IDS),
+        }
+
+        for k in range(6):
+            stats[f"perk{k}"] = rng.choice(RUNE_IDS)
+            stats[f"perk{k}Var1"] = rng.randint(0, 3000)
+            stats[f"perk{k}Var2"] = 0
+            stats[f"perk{k}Var3"] = 0
+
+        for k in range(7):
+            stats[f"item{k}"] = rng.choice(ITEM_IDS)
+
+        for field in PARTICIPANT_STAT_FIELDS[:60]:
+            stats[field] = rng.randint(0, 50000)
+
+        participants.append({
+            'participantId': i + 1,
+            'teamId': teamId,
+            'championId': rng.choice(CHAMPION_IDS),
+            'spell1Id': rng.choice(SPELL_IDS),
+            'spell2Id': rng.choice(SPELL_IDS),
+            'highestAchievedSeasonTier': "",
+            'stats': stats,
+            'timeline': {
+                'lane': lane,
+                'role': role,
+                'participantId': i + 1,
+                'csDiffPerMinDeltas': {},
+                'goldPerMinDeltas': {},
+                'xpDiffPerMinDeltas': {},
+                'xpPerMinDeltas': {},
+                'damageTakenPerMinDeltas': {},
+                'damageTakenDiffPerMinDeltas': {},
+                'creepsPerMinDeltas': {},
+            },
+        })
+
+    teams = [{
+        'teamId': teamId,
+        'win': "Win" if (blueWin if teamId == 100 else not blueWin) else "Fail",
+        'bans': [{'championId': rng.choice(CHAMPION_IDS), 'pickTurn': k + 1} for k in range(5)],
+        'baronKills': rng.randint(0, 2),
+        'dragonKills': rng.randint(0, 4),
+        'riftHeraldKills': rng.randint(0, 1),
+        'hordeKills': rng.randint(0, 6),
+        'towerKills': rng.randint(0, 11),
+        'inhibitorKills': rng.randint(0, 3),
+        'vilemawKills': 0,
+        'dominionVictoryScore': 0,
+        'firstBaron': False,
+        'firstBlood': False,
+        'firstDargon': False,
+        'firstInhibitor': False,
+        'firstTower': False,
+    } for teamId in (100, 200)]
+
+    return {
+        'gameCreation': 1700000000000 + gameId * 1000,
+        'gameCreationDate': "2024-10-01T12:00:00.000Z",
+        'gameDuration': rng.randint(900, 2400),
+        'gameId': gameId,
+        'gameMode': "CLASSIC",
+        'gameType': "MATCHED_GAME",
+        'gameVersion': "14.20.627.2031",
+        'mapId': 11,
+        'platformId': "HN1",
+        'queueId': queueId,
+        'seasonId': 14,
+        'participantIdentities': identities,
+        'participants': participants,
+        'teams': teams,
+    }
+
+
+def lcuMatchHistory(puuid, begIndex=0, endIndex=19, seed=0):
+    """
+    LCU `/lol-match-history/v1/products/lol/{puuid}/matches`, 每局只有本人的数据
+    """
+    games = []
+
+    for i in range(begIndex, endIndex + 1):
+        players = makePlayers(seed * 1000 + i)
+        players[0]['puuid'] = puuid
+
+        game = lcuGame(8000000000 + seed * 1000 + i, players, seed=seed)
+        game['participantIdentities'] = game['participantIdentities'][:1]
+        game['participants'] = game['participants'][:1]
+
+        games.append(game)
+
+    return {
+        'accountId': 0,
+        'platformId': "HN1",
+        'games': {
+            'gameBeginDate': "",
+            'gameCount': len(games),
+            'gameEndDate': "",
+            'gameIndexBegin': begIndex,
+            'gameIndexEnd': endIndex,
+            'games': games,
+        },
+    }
+
+
+def summoner(player, privacy="PUBLIC"):
+    """
+    LCU `/lol-summoner/v2/summoners/puuid/{puuid}`
+    """
+    return {
+        'accountId': player['summonerId'],
+        'displayName': player['gameName'],
+        'gameName': player['gameName'],
+        'internalName': player['gameName'],
+        'nameChangeFlag': False,
+        'percentCompleteForNextLevel': 42,
+        'privacy': privacy,
+        'profileIconId': player['profileIcon'],
+        'puuid': player['puuid'],
+        'rerollPoints': {'currentPoints': 0, 'maxRolls': 2, 'numberOfRolls': 0,
+                         'pointsCostToRoll': 250, 'pointsToReroll': 250},
+        'summonerId': player['summonerId'],
+        'summonerLevel': 300,
+        'tagLine': player['tagLine'],
+        'unnamed': False,
+        'xpSinceLastLevel': 1000,
+        'xpUntilNextLevel': 3000,
+    }
+
+
+def rankedStats(puuid, seed=0):
+    """
+    LCU `/lol-ranked/v1/ranked-stats/{puuid}`
+    """
+    rng = random.Random(f"{puuid}{seed}")
+
+    def queue(queueType):
+        return {
+            'division': rng.choice(DIVISIONS),
+            'isProvisional': False,
+            'leaguePoints': rng.randint(0, 99),
+            'losses': rng.randint(0, 200),
+            'wins': rng.randint(0, 200),
+            'queueType': queueType,
+            'tier': rng.choice(TIERS),
+            'highestTier': "",
+            'highestDivision': "NA",
+            'previousSeasonEndTier': "",
+            'previousSeasonEndDivision': "",
+            'miniSeriesProgress': "",
+            'provisionalGameThreshold': 5,
+            'provisionalGamesRemaining': 0,
+            'ratedRating': 0,
+            'ratedTier': "NONE",
+            'warnings': None,
+        }
+
+    queueMap = {name: queue(name) for name in (
+        "RANKED_SOLO_5x5", "RANKED_FLEX_SR", "RANKED_TFT", "RANKED_TFT_DOUBLE_UP",
+        "RANKED_TFT_TURBO", "CHERRY")}
+
+    return {
+        'queueMap': queueMap,
+        'queues': list(queueMap.values()),
+        'highestRankedEntry': queueMap["RANKED_SOLO_5x5"],
+        'highestRankedEntrySR': queueMap["RANKED_SOLO_5x5"],
+        'earnedRegaliaRewardIds': [],
+        'splitsProgress': {},
+    }
+
+
+def sgpRankedStats(puuid, seed=0):
+    """
+    SGP `/leagues-ledge/v2/rankedStats/puuid/{puuid}`
+    """
+    stats = rankedStats(puuid, seed)
+
+    return {'queues': [{
+        'queueType': item['queueType'],
+        'tier': item['tier'],
+        'rank': item['division'],
+        'leaguePoints': item['leaguePoints'],
+        'wins': item['wins'],
+        'losses': item['losses'],
+    } for item in stats['queues']]}
+
+
+def champSelectSession(players, localCellId=0, phase="BAN_PICK", seed=0):
+    """
+    LCU `/lol-champ-select/v1/session`, `players` 前五个是己方
+    """
+    rng = random.Random(seed)
+
+    def member(player, cellId, team):
+        lane, _ = LANES[cellId % 5]
+
+        return {
+            'assignedPosition': lane.lower() if lane != "BOTTOM" else "bottom",
+            'cellId': cellId,
+            'championId': rng.choice(CHAMPION_IDS + [0] * 40),
+            'championPickIntent': 0,
+            'nameVisibilityType': "VISIBLE" if team == 1 else "HIDDEN",
+            'obfuscatedPuuid': "",
+            'obfuscatedSummonerId': 0,
+            'puuid': player['puuid'] if team == 1 else "",
+            'selectedSkinId': 0,
+            'spell1Id': rng.choice(SPELL_IDS),
+            'spell2Id': rng.choice(SPELL_IDS),
+            'summonerId': player['summonerId'] if team == 1 else 0,
+            'team': team,
+            'wardSkinId': -1,
+        }
+
+    myTeam = [member(player, i, 1) for i, player in enumerate(players[:5])]
+    theirTeam = [member(player, i + 5, 2) for i, player in enumerate(players[5:10])]
+
+    actions = []
+    actionId = 0
+
+    for type in ("ban", "pick"):
+        for cellId in range(10):
+            actions.append([{
+                'actorCellId': cellId,
+                'championId': 0,
+                'completed': False,
+                'id': actionId,
+                'isAllyAction': cellId < 5,
+                'isInProgress': False,
+                'pickTurn': cellId + 1,
+                'type': type,
+            }])
+            actionId += 1
+
+    return {
+        'actions': actions,
+        'allowBattleBoost': False,
+        'allowDuplicatePicks': False,
+        'allowLockedEvents': False,
+        'allowRerolling': False,
+        'allowSkinSelection': True,
+        'bans': {'myTeamBans': [], 'numBans': 10, 'theirTeamBans': []},
+        'benchChampions': [],
+        'benchEnabled': False,
+        'boostableSkinCount': 1,
+        'chatDetails': {'mucJwtDto': {}, 'multiUserChatId': "", 'multiUserChatPassword': ""},
+        'counter': 1,
+        'gameId': 7000000000 + seed,
+        'hasSimultaneousBans': False,
+        'hasSimultaneousPicks': False,
+        'isCustomGame': False,
+        'isSpectating': False,
+        'localPlayerCellId': localCellId,
+        'lockedEventIndex': -1,
+        'myTeam': myTeam,
+        'pickOrderSwaps': [],
+        'recoveryCounter': 0,
+        'rerollsRemaining': 0,
+        'skipChampionSelect': False,
+        'theirTeam': theirTeam,
+        'timer': {
+            'adjustedTimeLeftInPhase': 30000,
+            'internalNowInEpochMs': 1700000000000,
+            'isInfinite': False,
+            'phase': phase,
+            'totalTimeInPhase': 30000,
+        },
+        'trades': [],
+    }
+
+
+def gameflowSession(players, queueId=420, phase="InProgress", seed=0):
+    """
+    LCU `/lol-gameflow/v1/session`
+    """
+    rng = random.Random(seed)
+
+    def member(player, i):
+        lane, _ = LANES[i % 5]
+
+        return {
+            'championId': rng.choice(CHAMPION_IDS),
+            'lastSelectedSkinIndex': 0,
+            'profileIconId': player['profileIcon'],
+            'puuid': player['puuid'],
+            'selectedPosition': lane if lane != "BOTTOM" else "BOTTOM",
+            'selectedRole': "",
+            'summonerId': player['summonerId'],
+            'summonerInternalName': player['gameName'],
+            'summonerName': player['gameName'],
+            'teamOwner': False,
+            'teamParticipantId': None,
+        }
+
+    return {
+        'gameClient': {'observerServerIp': "", 'observerServerPort': 0, 'running': True,
+                       'serverIp': "127.0.0.1", 'serverPort': 7000, 'visible': True},
+        'gameData': {
+            'gameId': 7000000000 + seed,
+            'gameName': "",
+            'isCustomGame': False,
+            'password': "",
+            'playerChampionSelections': [],
+            'queue': {'id': queueId, 'mapId': 11, 'gameMode': "CLASSIC",
+                      'type': "RANKED_SOLO_5x5", 'isRanked': True},
+            'spectatorsAllowed': False,
+            'teamOne': [member(player, i) for i, player in enumerate(players[:5])],
+            'teamTwo': [member(player, i) for i, player in enumerate(players[5:10])],
+        },
+        'gameDodge': {'dodgeIds': [], 'phase': "None", 'state': "Invalid"},
+        'map': {'id': 11, 'name': "召唤师峡谷", 'mapStringId': "SR"},
+        'phase': phase,
+    }
+
+
+def wsEvent(uri, data, eventType="Update"):
+    """
+    websocket 推送的一帧, 形如 `[8, "OnJsonApiEvent", {...}]`
+    """
+    event = "OnJsonApiEvent" + uri.replace("/", "_")
+
+    return [8, event, {'data': data, 'eventType': eventType, 'uri': uri}]
+
+
+def gameData(locale="zh_CN"):
+    """
+    连接客户端时 `JsonManager` 需要的几份游戏数据, 只保留用得到的字段
+
+    @return: {LCU 路径: 数据}
+    """
+    assets = "/lol-game-data/assets"
+
+    items = [{'id': id, 'name': f"Item {id}", 'iconPath': f"{assets}/ASSETS/Items/Icons2D/{id}.png"}
+             for id in ITEM_IDS if id]
+
+    # `JsonManager` 会丢掉最后三个 (客户端里是几个特殊模式的技能)
+    spells = [{'id': id, 'name': f"Spell {id}",
+               'iconPath': f"{assets}/DATA/Spells/Icons2D/{id}.png"}
+              for id in SPELL_IDS + [30, 31, 39]]
+
+    perks = [{'id': id, 'name': f"Rune {id}", 'longDesc': f"<b>Rune</b> {id}<br>",
+              'iconPath': f"{assets}/v1/perk-images/{id}.png"}
+             for id in RUNE_IDS + [5002, 5005, 5008]]
+
+    styles = [{
+        'id': id,
+        'name': f"Style {id}",
+        'iconPath': f"{assets}/v1/perk-images/Styles/{id}.png",
+        'slots': [{'perks': RUNE_IDS[i * 4:(i + 1) * 4]} for i in range(4)],
+    } for id in STYLE_IDS]
+
+    queues = [{'id': id, 'mapId': mapId, 'name': name} for id, mapId, name in [
+        (420, 11, "单双排位"), (430, 11, "匹配模式"), (440, 11, "灵活组排"),
+        (450, 12, "极地大乱斗"), (1700, 30, "斗魂竞技场"), (1900, 11, "无限火力"),
+    ]]
+
+    champions = [{'id': id, 'name': f"Champion {id}", 'alias': f"Champion{id}",
+                  'squarePortraitPath': f"{assets}/v1/champion-icons/{id}.png"}
+                 for id in [-1] + CHAMPION_IDS]
+
+    skins = {str(id * 1000): {
+        'id': id * 1000,
+        'name': f"Champion {id}",
+        'splashPath': f"{assets}/v1/champion-splashes/{id}/{id * 1000}.jpg",
+        'uncenteredSplashPath': f"{assets}/v1/champion-splashes/uncentered/{id}/{id * 1000}.jpg",
+    } for id in CHAMPION_IDS}
+
+    augments = [{'id': id, 'nameTRA': f"Augment {id}", 'rarity': "kSilver",
+                 'augmentSmallIconPath': f"{assets}/v1/augments/{id}.png"}
+                for id in range(1, 30)]
+
+    return {
+        "/lol-game-data/assets/v1/items.json": items,
+        "/lol-game-data/assets/v1/summoner-spells.json": spells,
+        "/lol-game-data/assets/v1/perks.json": perks,
+        "/lol-game-data/assets/v1/perkstyles.json": {'schemaVersion': 2, 'styles': styles},
+        "/lol-game-queues/v1/queues": queues,
+        "/lol-game-data/assets/v1/champion-summary.json": champions,
+        "/lol-game-data/assets/v1/skins.json": skins,
+        "/lol-game-data/assets/v1/cherry-augments.json": augments,
+        "/lol-patch/v1/game-version": "14.20.620.9876",
+        "/riotclient/region-locale": {'locale': locale, 'region': "TENCENT",
+                                      'webLanguage': locale[:2], 'webRegion': "cn"},
+    }
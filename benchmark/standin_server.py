@@ -0,0 +1,518 @@
+"""
+LCU / SGP 的本地替身服务器, 没有英雄联盟客户端时用来跑 Seraphine 和做性能分析
+
+用法 (在仓库根目录下):
+
+    python benchmark/standin_server.py --app-port=2999 --remoting-auth-token=seraphine \
+        --rso_platform_id=HN1 [--fixtures path/to/recorded] [--scenario champ-select]
+
+- 命令行参数的写法和 LeagueClientUx 一致, 所以 `connector.start(本进程 pid)` 不用改就能连上;
+  也可以用 `--lockfile` 写一个 lockfile
+- 同一个端口上同时提供 LCU 的 HTTPS 接口、websocket 和 SGP 接口;
+  让 SGP 也走这里需要设置环境变量 `SERAPHINE_SGP_URL=https://127.0.0.1:<port>`
+- 数据优先取 `--fixtures` 目录下录制的 JSON (`<目录>/<uri 路径>.json`, 图片等为 `<目录>/<uri 路径>`),
+  没有时由 fixtures.py 按固定种子生成
+- 可以注入延迟 (`--latency`, `--jitter`)、429 (`--too-many-requests`) 和 5xx (`--failures`)
+- `POST /standin/events` (body 为 `{"uri", "eventType", "data"}`) 推送一条 websocket 事件,
+  并更新对应 GET 接口的返回值
+- `--replay ws.rec --speed N` 把录制的 websocket 帧 (见 ws_replay.py) 按 N 倍速推给客户端
+
+只依赖 aiohttp 和 openssl 命令行 (生成自签名证书), 在 Linux 上也能跑
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import re
+import ssl
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+
+from aiohttp import web, WSMsgType
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import fixtures  # noqa: E402
+from benchmark.ws_replay import replay  # noqa: E402
+from app.lol.recording import loadRecording  # noqa: E402
+
+# 1x1 透明 PNG, 所有图片资源都返回它
+PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg==")
+
+SGP_PREFIXES = ("/match-history-query/", "/leagues-ledge/",
+                "/summoner-ledge/", "/gsm/")
+
+
+def lcuError(status, message="", errorCode="RPC_ERROR"):
+    """
+    LCU 出错时的返回格式
+    """
+    return web.json_response({
+        'errorCode': errorCode,
+        'httpStatus': status,
+        'implementationDetails': {},
+        'message': message,
+    }, status=status)
+
+
+def eventName(uri):
+    return "OnJsonApiEvent" + uri.replace("/", "_")
+
+
+class FaultInjector:
+    """
+    给每个请求加上延迟, 并按概率返回 429 或 5xx
+    """
+
+    def __init__(self, latency=0., jitter=0., tooManyRequests=0., failures=0., seed=0):
+        """
+        @param latency: 平均延迟, 毫秒
+        @param jitter: 延迟的随机浮动范围, 毫秒
+        @param tooManyRequests: 返回 429 的概率
+        @param failures: 返回 500 / 503 的概率
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.tooManyRequests = tooManyRequests
+        self.failures = failures
+
+        self.rng = random.Random(seed)
+
+        self.requests = 0
+        self.injected = {429: 0, 500: 0, 503: 0}
+
+    async def apply(self):
+        """
+        @return: 需要直接返回的错误响应, 正常时返回 `None`
+        """
+        self.requests += 1
+
+        delay = self.latency + self.rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        roll = self.rng.random()
+
+        if roll < self.tooManyRequests:
+            self.injected[429] += 1
+            return web.json_response(
+                {'errorCode': "TOO_MANY_REQUESTS", 'httpStatus': 429, 'message': ""},
+                status=429, headers={'Retry-After': "1"})
+
+        if roll < self.tooManyRequests + self.failures:
+            status = self.rng.choice((500, 503))
+            self.injected[status] += 1
+            return lcuError(status, "injected failure")
+
+        return None
+
+
+class StandInServer:
+    def __init__(self, port, token, server="HN1", fixturesDir=None,
+                 faults: FaultInjector = None, seed=0):
+        self.port = port
+        self.token = token
+        self.server = server
+        self.fixturesDir = fixturesDir
+        self.faults = faults or FaultInjector()
+        self.seed = seed
+
+        self.sgpToken = f"sgp-{token}"
+        self.auth = "Basic " + \
+            base64.b64encode(f"riot:{token}".encode()).decode()
+
+        self.players = fixtures.makePlayers(seed)
+        self.playersByPuuid = {p['puuid']: p for p in self.players}
+        self.playersById = {p['summonerId']: p for p in self.players}
+
+        self.gameData = fixtures.gameData()
+
+        # 会随 websocket 事件变化的资源, uri -> 数据, 不在这里的 uri 返回 404
+        self.state = {
+            "/lol-summoner/v1/current-summoner": fixtures.summoner(self.players[0]),
+            "/lol-gameflow/v1/gameflow-phase": "None",
+            "/entitlements/v1/token": {'accessToken': self.sgpToken, 'token': "", 'entitlements': []},
+        }
+
+        # (websocket, 订阅的事件名集合)
+        self.sockets = []
+
+        self.app = web.Application(middlewares=[self.__middleware])
+        self.__initRoutes()
+
+    def __initRoutes(self):
+        r = self.app.router
+
+        r.add_get("/", self.__onWebSocket)
+        r.add_post("/standin/events", self.__onPushEvent)
+
+        # LCU
+        r.add_get("/lol-summoner/v2/summoners/puuid/{puuid}", self.__getSummoner)
+        r.add_get("/lol-summoner/v1/summoners/{summonerId}", self.__getSummonerById)
+        r.add_get("/lol-summoner/v2/summoners", self.__getSummonersByIds)
+        r.add_get("/lol-ranked/v1/ranked-stats/{puuid}", self.__getRankedStats)
+        r.add_get("/lol-match-history/v1/products/lol/{puuid}/matches",
+                  self.__getMatchHistory)
+        r.add_get("/lol-match-history/v1/games/{gameId}", self.__getGame)
+
+        # SGP
+        r.add_get("/match-history-query/v1/products/lol/player/{puuid}/SUMMARY",
+                  self.__getSgpSummary)
+        r.add_get("/leagues-ledge/v2/rankedStats/puuid/{puuid}",
+                  self.__getSgpRankedStats)
+        r.add_get("/summoner-ledge/v1/regions/{region}/summoners/puuid/{puuid}",
+                  self.__getSummoner)
+
+        r.add_route("*", "/{tail:.*}", self.__fallback)
+
+    # ---- 中间件: 鉴权、故障注入、录制的数据 ----
+
+    @web.middleware
+    async def __middleware(self, request: web.Request, handler):
+        path = request.path
+
+        if path.startswith("/standin/"):
+            return await handler(request)
+
+        authorization = request.headers.get("Authorization", "")
+
+        if path.startswith(SGP_PREFIXES):
+            if authorization != f"Bearer {self.sgpToken}":
+                return lcuError(401, "bad sgp token", "UNAUTHORIZED")
+        elif authorization != self.auth:
+            return lcuError(401, "bad auth", "UNAUTHORIZED")
+
+        if path != "/" and (res := await self.faults.apply()):
+            return res
+
+        if request.method == "GET" and (res := self.__loadRecorded(path)):
+            return res
+
+        return await handler(request)
+
+    def __loadRecorded(self, path):
+        if not self.fixturesDir:
+            return None
+
+        local = os.path.join(self.fixturesDir, *path.strip("/").split("/"))
+
+        if os.path.isfile(local + ".json"):
+            with open(local + ".json", "rb") as f:
+                return web.Response(body=f.read(), content_type="application/json")
+
+        if os.path.isfile(local):
+            with open(local, "rb") as f:
+                return web.Response(body=f.read())
+
+        return None
+
+    # ---- 生成的数据 ----
+
+    def __playerFor(self, puuid):
+        player = self.playersByPuuid.get(puuid)
+
+        if player is None:
+            # 不认识的 puuid 也给一个固定的玩家, 同一个 puuid 每次结果一样
+            player = fixtures.makePlayers(zlib.crc32(puuid.encode()), 1)[0]
+            player['puuid'] = puuid
+
+            self.playersByPuuid[puuid] = player
+            self.playersById[player['summonerId']] = player
+
+        return player
+
+    async def __getSummoner(self, request):
+        return web.json_response(fixtures.summoner(self.__playerFor(request.match_info['puuid'])))
+
+    async def __getSummonerById(self, request):
+        player = self.playersById.get(int(request.match_info['summonerId']))
+
+        if player is None:
+            return lcuError(404, "summoner not found")
+
+        return web.json_response(fixtures.summoner(player))
+
+    async def __getSummonersByIds(self, request):
+        ids = json.loads(request.query.get('ids', "[]"))
+
+        return web.json_response([fixtures.summoner(self.playersById[id])
+                                  for id in ids if id in self.playersById])
+
+    async def __getRankedStats(self, request):
+        return web.json_response(fixtures.rankedStats(request.match_info['puuid']))
+
+    async def __getSgpRankedStats(self, request):
+        return web.json_response(fixtures.sgpRankedStats(request.match_info['puuid']))
+
+    async def __getMatchHistory(self, request):
+        begIndex = int(request.query.get('begIndex', 0))
+        endIndex = int(request.query.get('endIndex', 19))
+
+        return web.json_response(fixtures.lcuMatchHistory(
+            request.match_info['puuid'], begIndex, endIndex))
+
+    async def __getGame(self, request):
+        gameId = int(request.match_info['gameId'])
+
+        return web.json_response(fixtures.lcuGame(gameId, fixtures.makePlayers(gameId % 1000)))
+
+    async def __getSgpSummary(self, request):
+        startIndex = int(request.query.get('startIndex', 0))
+        count = int(request.query.get('count', 20))
+
+        return web.json_response(fixtures.sgpSummaryPage(
+            request.match_info['puuid'], count, seed=startIndex))
+
+    async def __fallback(self, request: web.Request):
+        path = request.path
+
+        if request.method != "GET":
+            return web.Response(status=204)
+
+        if path in self.state:
+            return web.json_response(self.__withTimer(path, self.state[path]))
+
+        if path in self.gameData:
+            return web.json_response(self.gameData[path])
+
+        if re.search(r"\.(png|jpg|jpeg)$", path, re.I):
+            return web.Response(body=PNG, content_type="image/png")
+
+        return lcuError(404, f"No resource for {path}", "RESOURCE_NOT_FOUND")
+
+    @staticmethod
+    def __withTimer(uri, data):
+        # 英雄选择的计时器以返回时为准, 和真实客户端一样
+        if uri == "/lol-champ-select/v1/session" and 'timer' in data:
+            data['timer']['internalNowInEpochMs'] = int(time.time() * 1000)
+
+        return data
+
+    # ---- websocket ----
+
+    async def __onWebSocket(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        events = set()
+        item = (ws, events)
+        self.sockets.append(item)
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+
+                opcode, *args = json.loads(msg.data)
+
+                if opcode == 5:
+                    events.add(args[0])
+                elif opcode == 6:
+                    events.discard(args[0])
+        finally:
+            self.sockets.remove(item)
+
+        return ws
+
+    async def push(self, uri, data, eventType="Update"):
+        """
+        推送一条事件并更新对应的资源
+        """
+        if eventType == "Delete":
+            self.state.pop(uri, None)
+        else:
+            self.state[uri] = self.__withTimer(uri, data)
+
+        name = eventName(uri)
+        message = json.dumps(fixtures.wsEvent(uri, data, eventType))
+
+        for ws, events in list(self.sockets):
+            if name in events and not ws.closed:
+                await ws.send_str(message)
+
+    def pushRaw(self, raw):
+        """
+        原样推送一帧录制下来的文本, 同时更新对应的资源
+        """
+        _, name, event = json.loads(raw)
+        uri = event['uri']
+
+        if event['eventType'] == "Delete":
+            self.state.pop(uri, None)
+        else:
+            self.state[uri] = event['data']
+
+        for ws, events in list(self.sockets):
+            if name in events and not ws.closed:
+                # 不 await, 保持录制时的节奏; aiohttp 会把数据排进发送缓冲区
+                asyncio.ensure_future(ws.send_str(raw))
+
+    async def __onPushEvent(self, request):
+        body = await request.json()
+        await self.push(body['uri'], body.get('data'), body.get('eventType', "Update"))
+
+        return web.Response(status=204)
+
+    # ---- 脚本化的场景 ----
+
+    async def runChampSelect(self, rate=20., duration=10.):
+        """
+        进入英雄选择, 以 `rate` 帧每秒推送 session 更新 (队友悬停 / 锁定英雄),
+        `duration` 秒后进入游戏
+
+        @param rate: 每秒推送的 session 帧数
+        """
+        rng = random.Random(self.seed)
+
+        session = fixtures.champSelectSession(self.players, seed=self.seed)
+        session['timer']['adjustedTimeLeftInPhase'] = int(duration * 1000)
+        session['timer']['totalTimeInPhase'] = int(duration * 1000)
+
+        await self.push("/lol-gameflow/v1/session", fixtures.gameflowSession(
+            self.players, phase="ChampSelect", seed=self.seed))
+        await self.push("/lol-champ-select/v1/session", session, "Create")
+        await self.push("/lol-gameflow/v1/gameflow-phase", "ChampSelect")
+
+        start = time.time()
+        frames = int(rate * duration)
+
+        for i in range(frames):
+            await asyncio.sleep(1 / rate)
+
+            member = rng.choice(session['myTeam'])
+            member['championPickIntent'] = rng.choice(fixtures.CHAMPION_IDS)
+
+            session['counter'] += 1
+            session['timer']['adjustedTimeLeftInPhase'] = max(
+                0, int((duration - (time.time() - start)) * 1000))
+
+            await self.push("/lol-champ-select/v1/session", session)
+
+        await self.push("/lol-champ-select/v1/session", None, "Delete")
+        await self.push("/lol-gameflow/v1/session", fixtures.gameflowSession(
+            self.players, phase="GameStart", seed=self.seed))
+        await self.push("/lol-gameflow/v1/gameflow-phase", "GameStart")
+
+    async def waitForSubscriber(self, event):
+        while not any(event in events for _, events in self.sockets):
+            await asyncio.sleep(.1)
+
+    async def start(self, sslContext, host="127.0.0.1"):
+        runner = web.AppRunner(self.app, access_log=None)
+        await runner.setup()
+
+        site = web.TCPSite(runner, host, self.port, ssl_context=sslContext)
+        await site.start()
+
+        return runner
+
+
+def makeSslContext(cert=None, key=None):
+    """
+    没有指定证书时用 openssl 生成一个自签名的; connector 本来就不校验 LCU 的证书
+    """
+    if not (cert and key):
+        folder = tempfile.mkdtemp(prefix="seraphine-standin-")
+        cert = os.path.join(folder, "cert.pem")
+        key = os.path.join(folder, "key.pem")
+
+        subprocess.check_call([
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key, "-out", cert, "-days", "30", "-subj", "/CN=127.0.0.1",
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert, key)
+
+    return context
+
+
+def parseArgs(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+
+    # 和 LeagueClientUx 的命令行参数同名, psutil 读到的 cmdline 与真实客户端格式一致
+    parser.add_argument("--app-port", type=int, default=2999)
+    parser.add_argument("--remoting-auth-token", default="seraphine")
+    parser.add_argument("--rso_platform_id", default="HN1")
+
+    parser.add_argument("--lockfile", help="write a LeagueClient lockfile here")
+    parser.add_argument("--fixtures", help="folder of recorded responses")
+    parser.add_argument("--cert")
+    parser.add_argument("--key")
+    parser.add_argument("--seed", type=int, default=0)
+
+    parser.add_argument("--latency", type=float, default=0., help="ms")
+    parser.add_argument("--jitter", type=float, default=0., help="ms")
+    parser.add_argument("--too-many-requests", type=float, default=0.,
+                        help="probability of a 429 response")
+    parser.add_argument("--failures", type=float, default=0.,
+                        help="probability of a 500 / 503 response")
+
+    parser.add_argument("--scenario", choices=["champ-select"],
+                        help="scripted websocket events, started when a client subscribes")
+    parser.add_argument("--rate", type=float, default=20.,
+                        help="champ-select session frames per second")
+    parser.add_argument("--duration", type=float, default=10.,
+                        help="champ-select length in seconds")
+
+    parser.add_argument("--replay", help="websocket recording to play back "
+                        "once a client subscribes")
+    parser.add_argument("--speed", type=float, default=1.,
+                        help="replay speed, 0 for as fast as possible")
+
+    return parser.parse_args(argv)
+
+
+async def main():
+    args = parseArgs()
+
+    faults = FaultInjector(args.latency, args.jitter, args.too_many_requests,
+                           args.failures, args.seed)
+    server = StandInServer(args.app_port, args.remoting_auth_token, args.rso_platform_id,
+                           args.fixtures, faults, args.seed)
+
+    runner = await server.start(makeSslContext(args.cert, args.key))
+
+    if args.lockfile:
+        with open(args.lockfile, "w") as f:
+            f.write(f"LeagueClient:{os.getpid()}:{args.app_port}:"
+                    f"{args.remoting_auth_token}:https")
+
+    print(f"stand-in LCU listening on https://127.0.0.1:{args.app_port}, pid {os.getpid()}")
+    print(f"set SERAPHINE_SGP_URL=https://127.0.0.1:{args.app_port} to route SGP here",
+          flush=True)
+
+    try:
+        if args.scenario == "champ-select":
+            await server.waitForSubscriber(
+                eventName("/lol-champ-select/v1/session"))
+            await server.runChampSelect(args.rate, args.duration)
+
+        if args.replay:
+            _, frames = loadRecording(args.replay)
+
+            await server.waitForSubscriber(
+                eventName("/lol-champ-select/v1/session"))
+            late = await replay(frames, args.speed, server.pushRaw)
+
+            print(f"replayed {len(frames)} frames, "
+                  f"max lateness {max(late, default=0.) * 1000:.1f} ms")
+
+        await asyncio.Event().wait()
+    finally:
+        print(f"requests: {faults.requests}, injected: {faults.injected}")
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,162 @@
+"""
+回放录制下来的 LCU websocket 帧, 测英雄选择处理链路在真实突发流量下的延迟
+
+录制: 启动 Seraphine 前设置环境变量 `SERAPHINE_WS_RECORD=ws.rec`, 正常排一局即可
+
+用法 (在仓库根目录下):
+
+    python benchmark/ws_replay.py ws.rec               # 原速
+    python benchmark/ws_replay.py ws.rec --speed 4     # 4 倍速
+    python benchmark/ws_replay.py ws.rec --speed 0     # 不等待, 尽可能快
+    python benchmark/ws_replay.py ws.rec --standin-pid <pid>
+
+帧从 `LcuWebSocket.onMessage()` 进入, 经过和线上相同的解码、订阅分发、
+`LatestWinsDispatcher` 与 `createChampSelectEngine()` 注册的自动禁用 / 选择 / 锁定等功能;
+指定 `--standin-pid` 时 connector 会先连上 standin_server.py, 这些功能发出的请求真的会被处理
+
+需要连同界面一起测 (如 `updateAllyIcon`) 时, 用 `standin_server.py --replay ws.rec`
+把录制的帧推给正在运行的 Seraphine
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.lol.recording import loadRecording  # noqa: E402
+
+
+async def replay(frames, speed, onFrame):
+    """
+    按录制时的时间间隔回放
+
+    @param frames: [(相对时间, 原始文本), ...]
+    @param speed: 倍速, 0 表示不等待
+    @param onFrame: `onFrame(raw)`, 同步调用
+    @return: 每一帧实际送达时间比计划晚了多少秒
+    """
+    late = []
+
+    if not frames:
+        return late
+
+    origin = frames[0][0]
+    start = time.perf_counter()
+
+    for t, raw in frames:
+        if speed > 0:
+            at = start + (t - origin) / speed
+            wait = at - time.perf_counter()
+
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            late.append(max(0., time.perf_counter() - at))
+        else:
+            # 让出事件循环, 处理函数才有机会跑
+            await asyncio.sleep(0)
+
+        onFrame(raw)
+
+    return late
+
+
+def percentiles(values, ps=(50, 95, 99)):
+    if not values:
+        return {p: 0. for p in ps}
+
+    values = sorted(values)
+
+    return {p: values[min(len(values) - 1, int(len(values) * p / 100))] for p in ps}
+
+
+async def runHandlers(frames, speed, standinPid=None):
+    from app.lol.connector import connector, LcuWebSocket
+    from app.lol.champ_select import LatestWinsDispatcher
+    from app.lol.tools import ChampionSelection, createChampSelectEngine
+
+    if standinPid:
+        await connector.start(standinPid)
+
+    selection = ChampionSelection()
+    engine = createChampSelectEngine(selection)
+
+    durations = []
+
+    async def onChampSelectChanged(event):
+        start = time.perf_counter()
+        await engine.update(event['data'])
+        durations.append(time.perf_counter() - start)
+
+    dispatcher = LatestWinsDispatcher(onChampSelectChanged, "replay")
+
+    # 不连接, 只用它的解码与分发
+    listener = LcuWebSocket(0, "")
+
+    @listener.subscribe(event='OnJsonApiEvent_lol-champ-select_v1_session',
+                        uri='/lol-champ-select/v1/session',
+                        type=('Update',))
+    async def onSession(event):
+        dispatcher.push(event)
+
+    @listener.subscribe(event='OnJsonApiEvent_lol-gameflow_v1_gameflow-phase',
+                        uri='/lol-gameflow/v1/gameflow-phase',
+                        type=('Update',))
+    async def onPhase(event):
+        if event['data'] == 'ChampSelect':
+            selection.reset()
+        else:
+            print(f"phase {event['data']}: dispatcher {dispatcher.getStats()}, "
+                  f"engine {engine.getStats()}")
+            dispatcher.reset()
+            engine.reset()
+
+    start = time.perf_counter()
+    late = await replay(frames, speed, listener.onMessage)
+
+    # 等最后一帧处理完
+    while dispatcher.task and not dispatcher.task.done():
+        await asyncio.sleep(.01)
+
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(frames)} frames in {elapsed:.2f} s "
+          f"({len(frames) / elapsed if elapsed else 0:.0f} frames/s)")
+
+    if late:
+        p = percentiles(late)
+        print(f"delivery lateness ms: p50 {p[50] * 1000:.2f}, p95 {p[95] * 1000:.2f}, "
+              f"max {max(late) * 1000:.2f}")
+
+    p = percentiles(durations)
+    print(f"champ select handler ms ({len(durations)} runs): p50 {p[50] * 1000:.3f}, "
+          f"p95 {p[95] * 1000:.3f}, p99 {p[99] * 1000:.3f}, "
+          f"max {max(durations, default=0.) * 1000:.3f}")
+    print(f"dispatcher: {dispatcher.getStats()}")
+    print(f"engine: {engine.getStats()}")
+
+    if standinPid:
+        await connector.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("recording")
+    parser.add_argument("--speed", type=float, default=1.,
+                        help="playback speed, 0 for as fast as possible")
+    parser.add_argument("--standin-pid", type=int,
+                        help="start the connector against standin_server.py with this pid")
+    args = parser.parse_args()
+
+    header, frames = loadRecording(args.recording)
+    print(f"recording from {time.ctime(header['startedAt'])}, {len(frames)} frames, "
+          f"{frames[-1][0] - frames[0][0] if frames else 0:.1f} s")
+
+    asyncio.run(runHandlers(frames, args.speed, args.standin_pid))
+
+
+if __name__ == "__main__":
+    main()
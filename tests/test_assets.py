@@ -0,0 +1,44 @@
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from app.lol.assets import AssetStore  # noqa: E402
+from app.lol.request import requestPriority, BACKGROUND  # noqa: E402
+
+
+def test_get_downloads_once_across_priorities(tmp_path, monkeypatch):
+    """
+    预下载 (后台) 与界面同时要同一个图标时只下载一次, 写出来的文件是完整的
+    """
+    monkeypatch.setattr(AssetStore, "ROOT", str(tmp_path))
+
+    async def main():
+        store = AssetStore()
+        store.init()
+        downloads = []
+
+        async def download():
+            downloads.append(1)
+            await asyncio.sleep(.01)
+            return b"png"
+
+        with requestPriority(BACKGROUND):
+            warmUp = asyncio.ensure_future(store.get("item icons", "1001.png", download))
+
+        await asyncio.sleep(0)
+        ui = asyncio.ensure_future(store.get("item icons", "1001.png", download))
+
+        paths = await asyncio.gather(warmUp, ui)
+
+        assert len(downloads) == 1
+        assert paths[0] == paths[1]
+
+        with open(paths[0], "rb") as f:
+            assert f.read() == b"png"
+
+        assert os.listdir(tmp_path / "item icons") == ["1001.png"]
+
+    asyncio.run(main())
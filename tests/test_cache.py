@@ -0,0 +1,61 @@
+from app.lol import cache
+from app.lol.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+
+    c = TTLCache(ttl=10.)
+    c.put("a", 1)
+    c.put("b", 2, ttl=30.)
+
+    clock.now += 9
+    assert c.get("a") == 1
+
+    clock.now += 2
+    assert c.get("a") is None
+    assert c.get("b") == 2
+
+    assert "a" not in c.data
+    assert (c.hits, c.misses) == (2, 1)
+
+
+def test_evicts_expired_then_oldest(monkeypatch):
+    """
+    超过 maxSize 时先清过期的, 还是超过再按写入顺序淘汰
+    """
+    clock = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+
+    c = TTLCache(ttl=10., maxSize=3)
+    c.put("short", 0, ttl=1.)
+    c.put("a", 1)
+    c.put("b", 2)
+
+    clock.now += 2
+    c.put("c", 3)
+    assert list(c.data) == ["a", "b", "c"]
+
+    # 重新写入的排到最后, 不会先被淘汰
+    c.put("a", 1)
+    c.put("d", 4)
+    assert list(c.data) == ["c", "a", "d"]
+
+
+def test_invalidate_by_predicate():
+    c = TTLCache()
+
+    for key in [("hn1", "summoner", "a"), ("hn1", "rank", "a"), ("hn1", "summoner", "b")]:
+        c.put(key, 1)
+
+    assert c.invalidate(lambda key: key[2] == "a") == 2
+    assert list(c.data) == [("hn1", "summoner", "b")]
@@ -0,0 +1,189 @@
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from app.lol import champ_select  # noqa: E402
+from app.lol.champ_select import (ChampSelectEngine, ChampSelectView,  # noqa: E402
+                                  DeadlineScheduler)
+
+
+def makeSession(phase="BAN_PICK", timeLeft=30., championId=0, intent=0, inProgress=True):
+    """
+    自己 (cellId 0) 一个 ban、一个 pick, 队友 (cellId 1) 已经锁了 157
+    """
+    return {
+        'localPlayerCellId': 0,
+        'timer': {
+            'phase': phase,
+            'isInfinite': False,
+            'internalNowInEpochMs': time.time() * 1000,
+            'adjustedTimeLeftInPhase': timeLeft * 1000,
+        },
+        'myTeam': [
+            {'cellId': 0, 'summonerId': 1, 'championId': championId,
+             'championPickIntent': intent, 'assignedPosition': 'middle'},
+            {'cellId': 1, 'summonerId': 2, 'championId': 157,
+             'championPickIntent': 0, 'assignedPosition': 'top'},
+        ],
+        'actions': [
+            [{'id': 1, 'actorCellId': 0, 'type': 'ban', 'championId': 0,
+              'isInProgress': inProgress, 'completed': False}],
+            [{'id': 2, 'actorCellId': 1, 'type': 'pick', 'championId': 157,
+              'isInProgress': False, 'completed': True},
+             {'id': 3, 'actorCellId': 0, 'type': 'pick', 'championId': championId,
+              'isInProgress': False, 'completed': False}],
+        ],
+        'bans': {'myTeamBans': [11], 'theirTeamBans': [22]},
+    }
+
+
+def test_view_indexes_session():
+    view = ChampSelectView(makeSession())
+
+    assert view.phase == 'BAN_PICK'
+    assert view.position == 'middle'
+    assert view.inProgressBan['id'] == 1
+    assert view.lastPickAction['id'] == 3
+    assert view.completedPicksByOthers == [157]
+    assert view.bans == {11, 22}
+    assert 29 < view.timeLeft() <= 30
+
+
+def test_view_falls_back_to_local_clock():
+    """
+    录制下来的数据时间戳对不上时, 用收到这一帧的时间算截止时间
+    """
+    session = makeSession(timeLeft=10.)
+    session['timer']['internalNowInEpochMs'] = 0
+
+    assert 9 < ChampSelectView(session).timeLeft() <= 10
+
+    session['timer']['isInfinite'] = True
+    assert ChampSelectView(session).timeLeft() == float('inf')
+
+
+def test_engine_skips_unchanged_inputs(monkeypatch):
+    """
+    输入没变的功能不再执行; 某个功能做了操作时本帧后面的功能不执行, 下一帧再判断
+    """
+    monkeypatch.setattr(champ_select, "deadlineScheduler", DeadlineScheduler())
+
+    calls = []
+
+    async def autoBan(view, selection):
+        calls.append("ban")
+        return view.inProgressBan is not None
+
+    async def showIntent(view, selection):
+        calls.append("intent")
+        return False
+
+    async def main():
+        engine = ChampSelectEngine(selection=None)
+        engine.addFeature(('BAN_PICK',), autoBan,
+                          lambda view: ChampSelectView.actionKey(view.inProgressBan))
+        engine.addFeature(('BAN_PICK',), showIntent, lambda view: view.intents)
+
+        await engine.update(makeSession())
+        assert calls == ["ban"]
+
+        # 计时器跳动, 其他都没变
+        await engine.update(makeSession(timeLeft=25.))
+        assert calls == ["ban", "intent"]
+
+        await engine.update(makeSession(timeLeft=20.))
+        assert calls == ["ban", "intent"]
+
+        await engine.update(makeSession(intent=103, inProgress=False))
+        assert calls == ["ban", "intent", "ban", "intent"]
+
+        assert engine.getStats()['runs'] == 4
+
+    asyncio.run(main())
+
+
+def test_engine_retries_failed_feature(monkeypatch):
+    monkeypatch.setattr(champ_select, "deadlineScheduler", DeadlineScheduler())
+
+    calls = []
+
+    async def watcher(view):
+        calls.append(view.championId)
+
+        if len(calls) == 1:
+            raise ConnectionError()
+
+    async def main():
+        engine = ChampSelectEngine(selection=None)
+        engine.addWatcher(watcher, lambda view: view.championId)
+
+        with pytest.raises(ConnectionError):
+            await engine.update(makeSession())
+
+        # 输入没变, 但上次失败了, 还要再执行
+        await engine.update(makeSession())
+        await engine.update(makeSession())
+        assert calls == [0, 0]
+
+    asyncio.run(main())
+
+
+def test_deadline_scheduler_runs_before_deadline():
+    """
+    操作最晚在截止时间前 margin 秒执行, 到点时拿到的是最新的一帧
+    """
+    async def main():
+        scheduler = DeadlineScheduler()
+        seen = []
+
+        async def action(view):
+            seen.append(view)
+            return True
+
+        scheduler.update(ChampSelectView(makeSession(timeLeft=10.)))
+        scheduler.schedule("autoLock", action, delay=60., margin=2.)
+
+        # 同名的还没执行, 不会重复安排
+        scheduler.schedule("autoLock", action, delay=0.)
+
+        # 新的一帧把截止时间提前到 2.2 秒后
+        latest = ChampSelectView(makeSession(timeLeft=2.2))
+        scheduler.update(latest)
+
+        await asyncio.sleep(.1)
+        assert seen == []
+
+        await asyncio.sleep(.3)
+        assert seen == [latest]
+
+        stats = scheduler.getStats()['autoLock']
+        assert stats['count'] == 1 and stats['late'] == 0
+        assert 1500 < stats['marginMinMs'] < 2200
+
+        scheduler.reset()
+
+    asyncio.run(main())
+
+
+def test_deadline_scheduler_reset_cancels_pending():
+    async def main():
+        scheduler = DeadlineScheduler()
+        seen = []
+
+        async def action(view):
+            seen.append(view)
+            return True
+
+        scheduler.update(ChampSelectView(makeSession(timeLeft=30.)))
+        scheduler.schedule("autoBan", action, delay=.1)
+
+        scheduler.reset()
+        await asyncio.sleep(.2)
+
+        assert seen == []
+        assert not scheduler.isPending("autoBan")
+
+    asyncio.run(main())
@@ -0,0 +1,170 @@
+import asyncio
+
+from app.lol.history import MatchHistoryIndex
+
+
+class FakeStorage:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, server, source, puuid):
+        return self.data.get((server, source, puuid))
+
+    async def put(self, server, source, puuid, history):
+        self.data[(server, source, puuid)] = history
+
+
+class FakeHistory:
+    """
+    接口那边的战绩, `games[0]` 为最近一局
+    """
+
+    def __init__(self, n):
+        self.games = [{'gameId': i} for i in range(n, 0, -1)]
+        self.calls = []
+
+    def play(self, n):
+        top = self.games[0]['gameId'] if self.games else 0
+        self.games[:0] = [{'gameId': i} for i in range(top + n, top, -1)]
+
+    async def fetch(self, begIndex, endIndex):
+        self.calls.append((begIndex, endIndex))
+        await asyncio.sleep(0)
+
+        return [dict(game) for game in self.games[begIndex:endIndex + 1]]
+
+
+def gameIdOf(game):
+    return game['gameId']
+
+
+def ids(games):
+    return [game['gameId'] for game in games]
+
+
+def getGames(index, history, begIndex, endIndex, puuid="a"):
+    return index.getGames("HN1", "lcu", puuid, begIndex, endIndex, history.fetch, gameIdOf)
+
+
+def test_head_sync_fetches_only_new_games():
+    """
+    再次查询时只拉比本地最新一局更新的部分, 其余的从索引里读
+    """
+    async def main():
+        index = MatchHistoryIndex(FakeStorage(), fresh=0., headPage=5)
+        history = FakeHistory(30)
+
+        assert ids(await getGames(index, history, 0, 19)) == list(range(30, 10, -1))
+        assert history.calls == [(0, 19)]
+
+        history.play(2)
+        history.calls.clear()
+
+        assert ids(await getGames(index, history, 0, 19)) == list(range(32, 12, -1))
+        assert history.calls == [(0, 4)]
+
+        # 没有新对局时只查一次头部
+        history.calls.clear()
+        assert ids(await getGames(index, history, 0, 9)) == list(range(32, 22, -1))
+        assert history.calls == [(0, 4)]
+
+    asyncio.run(main())
+
+
+def test_tail_fill_and_end_of_history():
+    """
+    本地不够时只补缺的部分, 到了战绩末尾之后不再请求尾部
+    """
+    async def main():
+        index = MatchHistoryIndex(FakeStorage(), fresh=60.)
+        history = FakeHistory(25)
+
+        await getGames(index, history, 0, 9)
+        assert ids(await getGames(index, history, 10, 29)) == list(range(15, 0, -1))
+        assert history.calls == [(0, 9), (10, 29)]
+
+        history.calls.clear()
+        assert ids(await getGames(index, history, 20, 39)) == [5, 4, 3, 2, 1]
+        assert history.calls == []
+
+    asyncio.run(main())
+
+
+def test_head_sync_resets_on_gap():
+    """
+    新对局多到接不上本地索引时, 丢掉旧的索引
+    """
+    async def main():
+        index = MatchHistoryIndex(FakeStorage(), fresh=0., headPage=5, pageSize=5)
+        history = FakeHistory(10)
+
+        await getGames(index, history, 0, 4)
+
+        history.play(20)
+        assert ids(await getGames(index, history, 0, 4)) == list(range(30, 25, -1))
+        assert index.resets == 1
+
+        # 旧索引里的 10 局不能接在后面
+        assert ids(await getGames(index, history, 5, 14)) == list(range(25, 15, -1))
+
+    asyncio.run(main())
+
+
+def test_index_persists_to_storage():
+    """
+    内存里的索引没了之后从磁盘读回来, 先查一次头部再用
+    """
+    async def main():
+        storage = FakeStorage()
+        history = FakeHistory(20)
+
+        await getGames(MatchHistoryIndex(storage, headPage=5), history, 0, 19)
+        assert ids(storage.data[("hn1", "lcu", "a")]['games']) == list(range(20, 0, -1))
+
+        history.play(1)
+        history.calls.clear()
+
+        index = MatchHistoryIndex(storage, headPage=5)
+        assert ids(await getGames(index, history, 0, 19)) == list(range(21, 1, -1))
+        assert history.calls == [(0, 4)]
+
+    asyncio.run(main())
+
+
+def test_concurrent_calls_sync_once_and_release_locks():
+    """
+    同一个人同时查询只同步一次; 用完的锁要删掉, 不会随着查过的人数一直变多
+    """
+    async def main():
+        index = MatchHistoryIndex(FakeStorage(), fresh=60.)
+        history = FakeHistory(30)
+
+        results = await asyncio.gather(*[getGames(index, history, 0, 9) for _ in range(3)])
+
+        assert all(ids(games) == list(range(30, 20, -1)) for games in results)
+        assert history.calls == [(0, 9)]
+        assert index.locks == {}
+
+        for puuid in ("b", "c", "d"):
+            await getGames(index, history, 0, 9, puuid)
+
+        assert index.locks == {}
+
+    asyncio.run(main())
+
+
+def test_lock_released_when_fetch_fails():
+    async def main():
+        index = MatchHistoryIndex(FakeStorage())
+
+        async def fetch(begIndex, endIndex):
+            raise ConnectionError()
+
+        try:
+            await index.getGames("HN1", "lcu", "a", 0, 9, fetch, gameIdOf)
+        except ConnectionError:
+            pass
+
+        assert index.locks == {}
+
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("win32api")
+pytest.importorskip("PyQt5")
+pytest.importorskip("qasync")
+
+from app.lol.request import TaskScope  # noqa: E402
+from app.view import main_window  # noqa: E402
+
+
+def test_client_ended_cancels_scopes_and_closes_connector(monkeypatch):
+    """
+    客户端退出时要取消搜索 / 生涯界面还在跑的 task, 并且一定要关掉 connector 与 opgg
+    """
+    closed = []
+
+    async def closeConnector():
+        closed.append("connector")
+
+    async def closeOpgg():
+        closed.append("opgg")
+
+    async def noop(*args):
+        pass
+
+    monkeypatch.setattr(main_window.connector, "close", closeConnector)
+    monkeypatch.setattr(main_window.opgg, "close", closeOpgg)
+
+    async def main():
+        pending = asyncio.ensure_future(asyncio.sleep(10))
+
+        search = SimpleNamespace(scope=TaskScope(), detailScope=TaskScope(), puuid="x")
+        search.scope.spawn(pending)
+
+        window = SimpleNamespace(
+            searchInterface=search,
+            careerInterface=SimpleNamespace(
+                scope=TaskScope(), setLoginSummonerPuuid=lambda puuid: None,
+                setLoadingPageEnabled=lambda enabled: None),
+            startInterface=SimpleNamespace(showLoadingPage=lambda: None),
+            opggWindow=SimpleNamespace(setHomeInterfaceEnabled=lambda enabled: None),
+            setWindowTitle=lambda title: None,
+            checkAndSwitchTo=lambda interface: None,
+            _MainWindow__updateAvatarIconName=noop,
+            _MainWindow__lockInterface=lambda: None,
+            reconnectTask=None,
+        )
+
+        slot = main_window.MainWindow._MainWindow__onLolClientEnded.__wrapped__
+        await slot(window)
+
+        assert closed == ["connector", "opgg"]
+        assert search.puuid == 0
+        assert pending.cancelled()
+        assert window.isClientProcessRunning is False
+
+    asyncio.run(main())
+
+
+def test_reconnect_stops_on_phase_event(monkeypatch):
+    """
+    进入 Reconnect 阶段时发重连请求, 收到 InProgress 的推送后不再重试, 也不轮询阶段
+    """
+    calls = []
+
+    async def reconnect():
+        calls.append("reconnect")
+
+    async def getGameStatus():
+        raise AssertionError("should not poll the gameflow phase")
+
+    monkeypatch.setattr(main_window.connector, "reconnect", reconnect)
+    monkeypatch.setattr(main_window.connector, "getGameStatus", getGameStatus)
+    monkeypatch.setattr(main_window.cfg, "get", lambda item: True)
+
+    async def main():
+        window = SimpleNamespace(
+            isGaming=True,
+            reconnectTask=None,
+            setWindowTitle=lambda title: None,
+            opggWindow=SimpleNamespace(setStaysOnTopEnabled=lambda enabled: None),
+            champSelectDispatcher=SimpleNamespace(reset=lambda: None),
+            champSelectEngine=SimpleNamespace(reset=lambda: None),
+            tr=lambda text: text,
+        )
+        window._MainWindow__onReconnect = \
+            lambda: main_window.MainWindow._MainWindow__onReconnect(window)
+
+        onStatus = main_window.MainWindow._MainWindow__onGameStatusChanged.__wrapped__
+
+        await onStatus(window, "Reconnect")
+        await asyncio.sleep(.4)
+        assert calls == ["reconnect"]
+
+        await onStatus(window, "InProgress")
+        assert window.reconnectTask is None
+
+        await asyncio.sleep(1.2)
+        assert calls == ["reconnect"]
+
+    asyncio.run(main())
@@ -0,0 +1,26 @@
+import asyncio
+
+from app.lol.metrics import ApiMetrics
+from app.lol.request import SingleFlight
+
+
+def test_dump_includes_single_flight_stats():
+    """
+    导出的统计里要有 single-flight 实际发出的请求数与被合并掉的调用数
+    """
+    async def main():
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0)
+            return 1
+
+        await asyncio.gather(*[flight.do("/summoner", fetch) for _ in range(4)])
+
+        return flight.getStats()
+
+    stats = asyncio.run(main())
+    text = ApiMetrics().dump(singleFlightStats={'connector': stats})
+
+    assert "single flight:" in text
+    assert "connector: total=1 coalesced=3 (75.0%) inFlight=0" in text
@@ -0,0 +1,196 @@
+import asyncio
+
+import pytest
+
+from app.lol.exceptions import RequestRateLimited
+from app.lol.request import (PriorityScheduler, SingleFlight, RetryPolicy, gatherByKind,
+                             getErrorStatus, recordResponseStatus, requestPriority,
+                             responseStatus, BACKGROUND, CRITICAL, INTERACTIVE)
+
+
+def test_cancel_queued_then_release():
+    """
+    排队中被取消, 之后占着位置的请求释放时 `__wakeUp()` 会先把它弹出队列;
+    取消方必须照常收到 CancelledError, 不能变成 ValueError
+    """
+    async def main():
+        scheduler = PriorityScheduler(1)
+        await scheduler.acquire(INTERACTIVE)
+
+        waiter = asyncio.ensure_future(scheduler.acquire(INTERACTIVE))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        scheduler.release(INTERACTIVE)
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert scheduler.running == 0
+        assert not scheduler.isBusy()
+
+    asyncio.run(main())
+
+
+def test_cancel_after_granted_returns_slot():
+    async def main():
+        scheduler = PriorityScheduler(1)
+        await scheduler.acquire(INTERACTIVE)
+
+        waiter = asyncio.ensure_future(scheduler.acquire(INTERACTIVE))
+        await asyncio.sleep(0)
+
+        scheduler.release(INTERACTIVE)
+        waiter.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert scheduler.running == 0
+
+    asyncio.run(main())
+
+
+def test_higher_priority_overtakes_queue():
+    async def main():
+        scheduler = PriorityScheduler(1)
+        order = []
+
+        async def job(name, priority):
+            async with scheduler.slot(priority):
+                order.append(name)
+                await asyncio.sleep(.01)
+
+        tasks = [asyncio.ensure_future(job("bg", BACKGROUND))]
+        await asyncio.sleep(0)
+
+        tasks.append(asyncio.ensure_future(job("bg2", BACKGROUND)))
+        tasks.append(asyncio.ensure_future(job("ui", INTERACTIVE)))
+        await asyncio.gather(*tasks)
+
+        assert order == ["bg", "ui", "bg2"]
+
+    asyncio.run(main())
+
+
+def test_single_flight_does_not_share_across_priorities():
+    async def main():
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(.01)
+            return len(calls)
+
+        with requestPriority(BACKGROUND):
+            background = asyncio.ensure_future(flight.do("key", fetch))
+
+        with requestPriority(CRITICAL):
+            critical = asyncio.ensure_future(flight.do("key", fetch))
+
+        interactive = asyncio.ensure_future(flight.do("key", fetch))
+        again = asyncio.ensure_future(flight.do("key", fetch))
+
+        await asyncio.gather(background, critical, interactive, again)
+
+        assert len(calls) == 3
+        assert flight.coalesced == 1
+
+    asyncio.run(main())
+
+
+def test_gather_by_kind_groups_results():
+    async def main():
+        async def value(v):
+            await asyncio.sleep(0)
+            return v
+
+        jobs = {('a', 1): value("a1"), ('b', 2): value("b2"), ('a', 3): value("a3")}
+        res = await gatherByKind(jobs, ('a', 'c'))
+
+        assert res == {'a': {1: "a1", 3: "a3"}, 'b': {2: "b2"}, 'c': {}}
+
+    asyncio.run(main())
+
+
+def test_single_flight_by_key_promotes_queued_request():
+    """
+    只按 key 合并时, 界面上的调用加入后台的同一个请求, 排着队的请求要挪到界面那一级
+    """
+    async def main():
+        scheduler = PriorityScheduler(1)
+        flight = SingleFlight(byPriority=False)
+        order = []
+
+        async def fetch(name):
+            async with scheduler.slot():
+                order.append(name)
+                await asyncio.sleep(.01)
+
+            return name
+
+        blocker = asyncio.ensure_future(fetch("blocker"))
+        await asyncio.sleep(0)
+
+        with requestPriority(BACKGROUND):
+            other = asyncio.ensure_future(fetch("other"))
+            await asyncio.sleep(0)
+
+            icon = asyncio.ensure_future(flight.do("icon", lambda: fetch("icon")))
+            await asyncio.sleep(0)
+
+        joined = asyncio.ensure_future(flight.do("icon", lambda: fetch("icon again")))
+
+        assert await joined == "icon"
+        await asyncio.gather(blocker, other, icon)
+
+        assert order == ["blocker", "icon", "other"]
+        assert flight.total == 1 and flight.coalesced == 1
+        assert scheduler.running == 0
+        assert scheduler.getStats()['interactive']['granted'] == 2
+
+    asyncio.run(main())
+
+
+def test_lcu_error_body_status():
+    assert getErrorStatus({'httpStatus': 404, 'errorCode': "RPC_ERROR"}) == 404
+    assert getErrorStatus({'httpStatus': 200}) is None
+    assert getErrorStatus({'puuid': "x"}) is None
+    assert getErrorStatus([{'httpStatus': 404}]) is None
+
+
+@pytest.mark.parametrize("status, retried", [
+    (400, False), (403, False), (404, False), (429, True), (500, True), (503, True), (None, True),
+])
+def test_retry_policy_by_status(status, retried):
+    """
+    LCU 的 4xx 不抛异常, 被装饰的函数在取字段时才失败; 靠记下来的状态码决定要不要重试
+    """
+    policy = RetryPolicy()
+
+    assert (policy.getDelay(1, KeyError('games'), status) is not None) == retried
+
+
+def test_retry_policy_rate_limited_uses_retry_after():
+    assert RetryPolicy().getDelay(1, RequestRateLimited(1.5), 429) == 1.5
+
+
+def test_response_status_records_last_response():
+    async def main():
+        async def request(status):
+            await asyncio.sleep(0)
+            recordResponseStatus(status)
+
+        with responseStatus() as last:
+            await request(200)
+            # 合并请求时真正的请求在另一个 task 里跑, 继承了同一个记录
+            await asyncio.ensure_future(request(404))
+
+        assert last.status == 404
+
+        # 不在 `responseStatus` 里时什么也不做
+        recordResponseStatus(500)
+        assert last.status == 404
+
+    asyncio.run(main())
@@ -0,0 +1,49 @@
+from app.lol.state import ClientState
+
+URI = "/lol-gameflow/v1/gameflow-phase"
+
+
+def test_hydrate_does_not_overwrite_newer_push():
+    """
+    请求期间收到推送时, 请求回来的旧数据不能覆盖推送的新数据
+    """
+    state = ClientState()
+
+    version = state.getVersion(URI)
+    state.update(URI, "ChampSelect")
+
+    assert state.hydrate(URI, version, "Lobby") is False
+    assert state.get(URI) == "ChampSelect"
+
+    version = state.getVersion(URI)
+    assert state.hydrate(URI, version, "InProgress") is True
+    assert state.get(URI) == "InProgress"
+
+
+def test_delete_bumps_version():
+    """
+    删除也算一次推送, 删除之前发出的请求回来后不能把资源写回去
+    """
+    state = ClientState()
+    state.update(URI, "Lobby")
+
+    version = state.getVersion(URI)
+    state.delete(URI)
+
+    assert state.hydrate(URI, version, "Lobby") is False
+    assert state.get(URI, "None") == "None"
+
+
+def test_stats_and_clear():
+    state = ClientState()
+    state.update(URI, "Lobby")
+
+    state.get(URI)
+    state.get("/lol-summoner/v1/current-summoner")
+
+    assert state.getStats() == {
+        'resources': 1, 'hits': 1, 'misses': 1, 'hitRate': .5}
+
+    state.clear()
+    assert state.get(URI) is None
+    assert state.getVersion(URI) == 0
@@ -0,0 +1,158 @@
+import asyncio
+import os
+import itertools
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from app.lol import storage as storageModule  # noqa: E402
+from app.lol.storage import (GameDataSnapshot, GameDetailStorage,  # noqa: E402
+                             MatchHistoryStorage)
+
+
+def test_game_detail_round_trip(tmp_path):
+    async def main():
+        storage = GameDetailStorage(str(tmp_path / "games.db"))
+
+        assert await storage.get("HN1", 1) is None
+
+        await storage.put("HN1", "1", {'gameId': 1, 'participants': ["提莫"]})
+
+        # server 不区分大小写, gameId 字符串或整数都行
+        assert await storage.get("hn1", 1) == {'gameId': 1, 'participants': ["提莫"]}
+        assert await storage.get("HN2", 1) is None
+
+        await storage.delete("HN1", 1)
+        assert await storage.get("HN1", 1) is None
+
+        storage.close()
+
+    asyncio.run(main())
+
+
+def test_evicts_least_recently_accessed(tmp_path, monkeypatch):
+    # 写得太快时访问时间可能一样, 换成每次加一的时钟
+    clock = itertools.count()
+    monkeypatch.setattr(storageModule, "time", SimpleNamespace(time=lambda: next(clock)))
+
+    async def main():
+        storage = GameDetailStorage(str(tmp_path / "games.db"), maxCount=10)
+
+        for gameId in range(10):
+            await storage.put("HN1", gameId, {'gameId': gameId})
+
+        # 读一次, 刷新访问时间
+        assert await storage.get("HN1", 0) == {'gameId': 0}
+
+        await storage.put("HN1", 10, {'gameId': 10})
+
+        # 超了之后一次删到 90%, 最久没访问的先删
+        left = [gameId for gameId in range(11) if await storage.get("HN1", gameId)]
+        assert left == [0, 3, 4, 5, 6, 7, 8, 9, 10]
+
+        storage.close()
+
+    asyncio.run(main())
+
+
+def test_corrupted_row_is_dropped(tmp_path):
+    async def main():
+        path = str(tmp_path / "histories.db")
+        storage = MatchHistoryStorage(path)
+        await storage.put("HN1", "sgp", "a", {'games': [], 'complete': True})
+        storage.close()
+
+        conn = sqlite3.connect(path)
+        conn.execute("UPDATE histories SET data = ?", (b"broken",))
+        conn.commit()
+        conn.close()
+
+        assert await storage.get("HN1", "sgp", "a") is None
+        assert storage.available
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT COUNT(*) FROM histories").fetchone()[0] == 0
+        conn.close()
+
+        storage.close()
+
+    asyncio.run(main())
+
+
+def test_schema_change_rebuilds_table(tmp_path):
+    async def main():
+        path = str(tmp_path / "games.db")
+        storage = GameDetailStorage(path)
+        await storage.put("HN1", 1, {'gameId': 1})
+        storage.close()
+
+        conn = sqlite3.connect(path)
+        conn.execute(f"PRAGMA user_version={GameDetailStorage.SCHEMA_VERSION + 1}")
+        conn.commit()
+        conn.close()
+
+        storage = GameDetailStorage(path)
+        assert await storage.get("HN1", 1) is None
+
+        await storage.put("HN1", 2, {'gameId': 2})
+        assert await storage.get("HN1", 2) == {'gameId': 2}
+
+        storage.close()
+
+    asyncio.run(main())
+
+
+def test_unusable_database_degrades_to_miss(tmp_path):
+    """
+    数据库打不开时不抛异常, 之后所有操作都当作 miss
+    """
+    async def main():
+        # 路径是个目录, sqlite 打不开
+        storage = GameDetailStorage(str(tmp_path))
+
+        assert await storage.get("HN1", 1) is None
+        assert not storage.available
+
+        await storage.put("HN1", 1, {'gameId': 1})
+        assert await storage.get("HN1", 1) is None
+
+    asyncio.run(main())
+
+
+def test_snapshot_round_trip_and_cleanup(tmp_path):
+    async def main():
+        snapshot = GameDataSnapshot(str(tmp_path), keep=2)
+
+        assert await snapshot.load("14.1", "zh_CN") is None
+
+        for version in ("14.1", "14.2", "14.3"):
+            await snapshot.save(version, "zh_CN", {'version': version, 'items': {1001: "boots"}})
+            # 按修改时间清理, 别让几次写入落在同一个时间戳上
+            await asyncio.sleep(.01)
+
+        assert await snapshot.load("14.3", "zh_CN") == {
+            'version': "14.3", 'items': {1001: "boots"}}
+
+        # 只留最近两个版本, 也没有留下临时文件
+        assert await snapshot.load("14.1", "zh_CN") is None
+        assert sorted(os.listdir(tmp_path)) == [
+            "14.2_zh_CN_v1.bin", "14.3_zh_CN_v1.bin"]
+
+    asyncio.run(main())
+
+
+def test_snapshot_corrupted_returns_none(tmp_path):
+    async def main():
+        snapshot = GameDataSnapshot(str(tmp_path))
+        await snapshot.save("14.1", "zh_CN", {'a': 1})
+
+        for name in os.listdir(tmp_path):
+            with open(tmp_path / name, "wb") as f:
+                f.write(b"broken")
+
+        assert await snapshot.load("14.1", "zh_CN") is None
+
+    asyncio.run(main())